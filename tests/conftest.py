@@ -0,0 +1,77 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from rdflib import Graph
+
+
+class SPARQLHandler(BaseHTTPRequestHandler):
+    """A stand-in SPARQL endpoint, answering queries on the test triples."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        self._answer(parse_qs(urlparse(self.path).query))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type", "").startswith("application/sparql-query"):
+            self._answer({"query": [body.decode()]})
+        else:
+            self._answer(parse_qs(body.decode()))
+
+    def _answer(self, params):
+        query = params["query"][0]
+        with self.server.lock:
+            self.server.requests.append(query)
+            try:
+                res = self.server.kg.query(query)
+            except Exception as error:
+                self.send_error(400, str(error).splitlines()[0])
+                return
+            if "text/tab-separated-values" in self.headers.get("Accept", ""):
+                content_type = "text/tab-separated-values"
+                lines = ["\t".join("?" + var for var in res.vars)]
+                for row in res:
+                    lines.append(
+                        "\t".join("" if term is None else term.n3() for term in row)
+                    )
+                data = "\n".join(lines).encode() + b"\n"
+            else:
+                content_type = "application/sparql-results+json"
+                data = res.serialize(format="json")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def sparql_endpoint():
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SPARQLHandler)
+    server.kg = kg
+    server.requests = []
+    server.connections = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_port}/sparql"
+    yield server
+    server.shutdown()
+    server.server_close()
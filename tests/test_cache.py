@@ -0,0 +1,57 @@
+import os
+import pytest
+from tools4rdf.network.cache import (
+    get_cache_dir,
+    get_cache_key,
+    get_cache_file,
+    load_compiled,
+    save_compiled,
+)
+
+OWL_CONTENT = """<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns:owl="http://www.w3.org/2002/07/owl#"
+         xmlns:ex="http://example.org/ontology#">
+    <owl:Class rdf:about="http://example.org/ontology#Pizza"/>
+</rdf:RDF>
+"""
+
+
+@pytest.fixture
+def owl_file(tmp_path):
+    owl_file = tmp_path / "test.owl"
+    owl_file.write_text(OWL_CONTENT)
+    return str(owl_file)
+
+
+def test_get_cache_dir_explicit(tmp_path):
+    assert get_cache_dir(str(tmp_path)) == str(tmp_path)
+
+
+def test_get_cache_dir_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLS4RDF_CACHE_DIR", str(tmp_path))
+    assert get_cache_dir() == str(tmp_path)
+
+
+def test_get_cache_key_depends_on_content(owl_file):
+    key = get_cache_key(owl_file)
+    assert key == get_cache_key(owl_file)
+    assert key != get_cache_key(owl_file, format="turtle")
+    with open(owl_file, "a") as fout:
+        fout.write("\n")
+    assert key != get_cache_key(owl_file)
+
+
+def test_save_and_load_compiled(owl_file, tmp_path):
+    cache_file = get_cache_file(owl_file, cache_dir=str(tmp_path / "cache"))
+    assert load_compiled(cache_file) is None
+    save_compiled(cache_file, {"data": [1, 2, 3]})
+    assert os.path.exists(cache_file)
+    assert load_compiled(cache_file) == {"data": [1, 2, 3]}
+
+
+def test_load_compiled_corrupt(tmp_path):
+    cache_file = tmp_path / "broken.onto"
+    cache_file.write_bytes(b"not a pickle")
+    with pytest.warns(UserWarning):
+        assert load_compiled(str(cache_file)) is None
@@ -0,0 +1,58 @@
+import pytest
+from tools4rdf.network.closure import (
+    strongly_connected_components,
+    transitive_closure,
+    invert_closure,
+)
+
+
+def test_strongly_connected_components_order():
+    # 0 -> 1 -> 2, 2 -> 1
+    components = strongly_connected_components([[1], [2], [1]])
+    assert len(components) == 2
+    assert sorted(components[0]) == [1, 2]
+    assert components[1] == [0]
+
+
+def test_transitive_closure_chain():
+    closure = transitive_closure({"A": ["B"], "B": ["C"], "C": []})
+    assert closure["A"] == ["B", "C"]
+    assert closure["B"] == ["C"]
+    assert closure["C"] == []
+
+
+def test_transitive_closure_direct_children_first():
+    closure = transitive_closure({"A": ["C", "B"], "B": ["D"], "C": []})
+    assert closure["A"][:2] == ["C", "B"]
+    assert "D" in closure["A"]
+
+
+def test_transitive_closure_diamond():
+    closure = transitive_closure({"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []})
+    assert sorted(closure["A"]) == ["B", "C", "D"]
+
+
+def test_transitive_closure_cycle():
+    closure = transitive_closure({"A": ["B"], "B": ["A"], "C": ["A"]})
+    assert sorted(closure["A"]) == ["A", "B"]
+    assert sorted(closure["B"]) == ["A", "B"]
+    assert sorted(closure["C"]) == ["A", "B"]
+
+
+def test_transitive_closure_unknown_child():
+    closure = transitive_closure({"A": ["X"]})
+    assert closure == {"A": ["X"]}
+
+
+def test_transitive_closure_deep_hierarchy():
+    n_levels = 5000
+    hierarchy = {f"C{i}": [f"C{i + 1}"] for i in range(n_levels)}
+    closure = transitive_closure(hierarchy)
+    assert len(closure["C0"]) == n_levels
+
+
+def test_invert_closure():
+    ancestors = invert_closure({"A": ["B", "C"], "B": ["C"], "C": []})
+    assert ancestors["A"] == []
+    assert ancestors["B"] == ["A"]
+    assert sorted(ancestors["C"]) == ["A", "B"]
@@ -0,0 +1,111 @@
+import pickle
+from urllib.error import HTTPError
+
+import pytest
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+
+from tools4rdf.network.endpoint import SPARQLEndpoint, get_endpoint, parse_term
+from tools4rdf.network.ontology import read_ontology
+
+QUERY = """PREFIX cmso: <http://purls.helmholtz-metadaten.de/cmso/>
+SELECT ?sample ?atoms
+WHERE { ?sample cmso:hasNumberOfAtoms ?atoms . }"""
+
+
+def test_parse_term():
+    assert parse_term("") is None
+    assert parse_term("<http://example.org/a>") == URIRef("http://example.org/a")
+    assert parse_term("_:b0") == BNode("b0")
+    assert parse_term('"a\\tb"') == Literal("a\tb")
+    assert parse_term('"chat"@fr') == Literal("chat", lang="fr")
+    assert parse_term('"4"^^<http://www.w3.org/2001/XMLSchema#int>') == Literal(
+        "4", datatype=XSD.int
+    )
+    assert parse_term("42") == Literal("42", datatype=XSD.integer)
+    assert parse_term("-4.2") == Literal("-4.2", datatype=XSD.decimal)
+    assert parse_term("1e3") == Literal("1e3", datatype=XSD.double)
+    assert parse_term("true") == Literal("true", datatype=XSD.boolean)
+    with pytest.raises(ValueError):
+        parse_term("cmso:Sample")
+
+
+def test_endpoint_init():
+    with pytest.raises(ValueError):
+        SPARQLEndpoint("ftp://example.org/sparql")
+    with pytest.raises(ValueError):
+        SPARQLEndpoint("http://example.org/sparql", result_format="xml")
+    assert get_endpoint("http://example.org/sparql") is get_endpoint(
+        "http://example.org/sparql"
+    )
+
+
+@pytest.mark.parametrize("result_format", ["tsv", "json"])
+def test_endpoint_select(sparql_endpoint, result_format):
+    expected = sorted(sparql_endpoint.kg.query(QUERY))
+    endpoint = SPARQLEndpoint(sparql_endpoint.url, result_format=result_format)
+    variables, rows = endpoint.select(QUERY)
+    assert variables == ["sample", "atoms"]
+    assert sorted(rows) == expected
+    assert sorted(endpoint.query(QUERY)) == expected
+
+    # the connection is kept alive between queries
+    endpoint.query(QUERY)
+    assert sparql_endpoint.connections == 1
+    endpoint.close()
+
+
+def test_endpoint_unread_rows(sparql_endpoint):
+    endpoint = SPARQLEndpoint(sparql_endpoint.url)
+    variables, rows = endpoint.select(QUERY)
+    next(rows)
+    rows.close()
+    # a connection with an unread response is not reused
+    assert len(endpoint.query(QUERY)) > 0
+    assert sparql_endpoint.connections == 2
+
+
+def test_endpoint_error(sparql_endpoint):
+    endpoint = SPARQLEndpoint(sparql_endpoint.url)
+    with pytest.raises(HTTPError) as excinfo:
+        endpoint.query("SELECT WHERE")
+    assert excinfo.value.code == 400
+    assert len(endpoint.query(QUERY)) > 0
+
+
+def test_endpoint_pickle(sparql_endpoint):
+    endpoint = SPARQLEndpoint(sparql_endpoint.url, timeout=10)
+    endpoint.query(QUERY)
+    copied = pickle.loads(pickle.dumps(endpoint))
+    assert copied.timeout == 10
+    assert len(copied.query(QUERY)) == len(endpoint.query(QUERY))
+
+
+def test_network_query_endpoint(sparql_endpoint):
+    onto = read_ontology()
+    terms = onto.terms
+    expected = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms == 4,
+    )
+    result = onto.query(
+        sparql_endpoint.url,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms == 4,
+    )
+    assert result.equals(expected)
+    # the query is sent as it is, without a SERVICE clause
+    assert "SERVICE" not in sparql_endpoint.requests[-1]
+
+    onto.endpoint_backend = "service"
+    result = onto.query(
+        sparql_endpoint.url,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms == 4,
+    )
+    assert len(result) == len(expected)
+
+    onto.endpoint_backend = "curl"
+    with pytest.raises(ValueError):
+        onto.query(sparql_endpoint.url, terms.cmso.AtomicScaleSample)
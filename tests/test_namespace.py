@@ -0,0 +1,46 @@
+import pickle
+from tools4rdf.network.namespace import NamespaceDict
+
+
+def test_lookup_longest_prefix():
+    namespaces = NamespaceDict(
+        ex="http://example.org/", onto="http://example.org/ontology#"
+    )
+    assert namespaces.lookup("http://example.org/ontology#Pizza") == "onto"
+    assert namespaces.lookup("http://example.org/Pizza") == "ex"
+    assert namespaces.lookup("http://other.org/Pizza") is None
+
+
+def test_lookup_shared_iri():
+    namespaces = NamespaceDict()
+    namespaces["first"] = "http://example.org/"
+    namespaces["second"] = "http://example.org/"
+    assert namespaces.lookup("http://example.org/Pizza") == "first"
+
+
+def test_lookup_after_update():
+    namespaces = NamespaceDict(ex="http://example.org/")
+    assert namespaces.lookup("http://example.org/ontology#Pizza") == "ex"
+
+    namespaces["onto"] = "http://example.org/ontology#"
+    assert namespaces.lookup("http://example.org/ontology#Pizza") == "onto"
+
+    del namespaces["onto"]
+    assert namespaces.lookup("http://example.org/ontology#Pizza") == "ex"
+
+    namespaces.update(onto="http://example.org/ontology#")
+    assert namespaces.lookup("http://example.org/ontology#Pizza") == "onto"
+
+    namespaces.pop("onto")
+    namespaces.clear()
+    assert namespaces.lookup("http://example.org/ontology#Pizza") is None
+
+
+def test_pickle():
+    namespaces = NamespaceDict(ex="http://example.org/")
+    namespaces.lookup("http://example.org/Pizza")
+    loaded = pickle.loads(pickle.dumps(namespaces))
+    assert loaded == namespaces
+    assert isinstance(loaded, NamespaceDict)
+    loaded["onto"] = "http://example.org/ontology#"
+    assert loaded.lookup("http://example.org/ontology#Pizza") == "onto"
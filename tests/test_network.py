@@ -1,4 +1,10 @@
+import asyncio
+import concurrent.futures
+import pickle
+import time
 import pytest
+import networkx as nx
+import pandas as pd
 from tools4rdf.network.ontology import read_ontology
 from tools4rdf.network.network import (
     Network,
@@ -7,7 +13,9 @@ from tools4rdf.network.network import (
     _replace_name,
     _strip_name,
 )
+from tools4rdf.network.pagination import PaginationError
 from tools4rdf.network.parser import OntoParser
+from tools4rdf.network.resultcache import ResultCache
 from tools4rdf.network.term import OntoTerm
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, URIRef
 
@@ -273,6 +281,41 @@ def test_get_triples(network_fixture):
     assert len(namespaces) > 0
 
 
+def test_combine_paths():
+    groups = [
+        [[["a", "p", "b"]], [["a", "q", "c"], ["c", "r", "b"]]],
+        [[["a", "s", "d"]], [["a", "v", "d"]], [["a", "t", "e"], ["e", "u", "d"]]],
+    ]
+    combinations = list(Network._combine_paths(groups))
+    # every combination once, shortest total path length first
+    assert len(combinations) == 6
+    sizes = [len(query) for query, namespaces in combinations]
+    assert sizes == [2, 2, 3, 3, 3, 4]
+    assert len({tuple(query) for query, namespaces in combinations}) == 6
+    assert combinations[0][0] == ["    ?a p ?b .", "    ?a s ?d ."]
+
+
+def test_create_query_max_queries(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    network.add_paths(
+        [("ex:Pizza", "ex:isPartOf", "ex:Person"), ("ex:Person", "ex:eats", "ex:Food")]
+    )
+    queries = network.create_query(
+        network.terms.ex.Pizza, network.terms.ex.Food, num_paths=3
+    )
+    assert len(queries) == 2
+    assert "ex:eats" not in queries[0]
+    assert "ex:eats" in queries[1]
+    queries = network.create_query(
+        network.terms.ex.Pizza,
+        network.terms.ex.Food,
+        num_paths=3,
+        max_queries=1,
+        return_list=True,
+    )
+    assert len(queries) == 1
+
+
 def test_add_types_for_source(network_fixture):
     source = network_fixture.terms.ex.Pizza
     query, namespaces = network_fixture._add_types_for_source(source)
@@ -376,6 +419,553 @@ def test_query_internal(network_fixture):
     assert len(result) == 0
 
 
+def test_get_labels():
+    assert Network._get_labels("SELECT DISTINCT ?s WHERE { ?s ?p ?o }") == ["s"]
+    assert Network._get_labels("PREFIX a: <b>\nSELECT ?s ?o\nWHERE {") == ["s", "o"]
+    assert Network._get_labels("ASK { ?s ?p ?o }") == []
+
+
+def test_merge_queries():
+    onto = read_ontology()
+    terms = onto.terms
+    queries = onto.create_query(
+        [terms.cmso.AtomicScaleSample, terms.cmso.Material],
+        terms.cmso.hasName,
+        return_list=True,
+    )
+    assert len(queries) == 2
+    query = onto.merge_queries(queries)
+    assert query.count("PREFIX cmso:") == 1
+    assert query.count("SELECT DISTINCT") == 2
+    assert Network._get_labels(query) == [
+        "AtomicScaleSample",
+        "hasNamevalue",
+        "Material",
+    ]
+    assert onto.merge_queries(queries[:1]) == queries[0]
+
+    query = onto.merge_queries(queries, remote_source="https://example.org/sparql")
+    assert query.count("SERVICE <https://example.org/sparql>") == 1
+    with pytest.raises(ValueError):
+        onto.merge_queries(queries, remote_source="not a url")
+
+
+def test_query_union():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasNumberOfAtoms, num_paths=3
+    )
+    result = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms,
+        num_paths=3,
+        union=True,
+    )
+    assert list(result.columns) == list(expected.columns)
+    assert result.equals(expected.reset_index(drop=True))
+
+
+def test_query_union_several_queries():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    query_strings = onto.create_query(
+        terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    assert len(query_strings) == 4
+    # each query is DISTINCT on its own, and the results are concatenated
+    expected = onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    result = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+        union=True,
+    )
+    assert len(result) == 63
+    assert list(result.columns) == list(expected.columns)
+    assert sorted(map(tuple, result.values)) == sorted(map(tuple, expected.values))
+
+
+def test_query_union_remote(sparql_endpoint):
+    onto = read_ontology()
+    terms = onto.terms
+    expected = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+    )
+    result = onto.query(
+        sparql_endpoint.url,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+        union=True,
+    )
+    # the 4 queries are sent as one
+    assert len(sparql_endpoint.requests) == 1
+    assert list(result.columns) == list(expected.columns)
+    # the order of the rows of a UNION is up to the triple store
+    assert sorted(map(tuple, result.values)) == sorted(map(tuple, expected.values))
+
+
+def test_query_executor():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    for executor in ["thread", "process"]:
+        result = onto.query(
+            kg,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+            executor=executor,
+            max_workers=2,
+        )
+        assert result.equals(expected)
+
+    with pytest.raises(ValueError):
+        onto.query(
+            kg,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+            executor="fork",
+        )
+
+
+def test_query_executor_remote(sparql_endpoint):
+    onto = read_ontology()
+    terms = onto.terms
+    expected = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        result = onto.query(
+            sparql_endpoint.url,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+            executor=executor,
+        )
+    assert len(sparql_endpoint.requests) == 4
+    assert list(result.columns) == list(expected.columns)
+    assert len(result) == len(expected)
+
+
+def test_iter_query(sparql_endpoint):
+    onto = read_ontology()
+    terms = onto.terms
+    expected = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+    )
+    for kg in [sparql_endpoint.kg, sparql_endpoint.url]:
+        chunks = list(
+            onto.iter_query(
+                kg,
+                terms.cmso.AtomicScaleSample,
+                terms.cmso.hasLatticeParameter,
+                num_paths=4,
+                chunksize=10,
+            )
+        )
+        assert max(len(chunk) for chunk in chunks) == 10
+        result = pd.concat(chunks)
+        assert list(result.columns) == list(expected.columns)
+        assert sorted(map(tuple, result.values)) == sorted(map(tuple, expected.values))
+
+    chunks = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms,
+        chunksize=5,
+    )
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 5, 2]
+
+    # the arguments are checked when called, before the first chunk is read
+    with pytest.raises(ValueError):
+        onto.iter_query(sparql_endpoint.kg, terms.cmso.AtomicScaleSample, chunksize=0)
+
+
+def test_query_typed():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        [
+            terms.cmso.hasNumberOfAtoms,
+            [terms.cmso.SimulationCell, terms.cmso.hasVolume],
+        ],
+    )
+    result = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        [
+            terms.cmso.hasNumberOfAtoms,
+            [terms.cmso.SimulationCell, terms.cmso.hasVolume],
+        ],
+        typed=True,
+    )
+    assert list(result.columns) == list(expected.columns)
+    assert isinstance(result["AtomicScaleSample"].dtype, pd.CategoricalDtype)
+    assert result["hasNumberOfAtomsvalue"].dtype == "int64"
+    assert result["SimulationCell_hasVolumevalue"].dtype == "float64"
+    assert result["hasNumberOfAtomsvalue"].tolist() == [
+        int(x) for x in expected["hasNumberOfAtomsvalue"]
+    ]
+
+    result = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+        typed=True,
+        executor="thread",
+    )
+    assert isinstance(result["AtomicScaleSample"].dtype, pd.CategoricalDtype)
+
+
+def test_query_result_cache(sparql_endpoint):
+    onto = read_ontology()
+    onto.result_cache = ResultCache()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    assert onto.result_cache.info().misses == 4
+    result = onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    assert result.equals(expected)
+    assert onto.result_cache.info().hits == 4
+
+    # a changed graph is queried again
+    kg.add((URIRef("http://example.org/s"), RDF.type, URIRef("http://example.org/C")))
+    onto.query(
+        kg, terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    assert onto.result_cache.info().misses == 8
+
+    for _ in range(2):
+        result = onto.query(
+            sparql_endpoint.url,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasNumberOfAtoms,
+        )
+    assert len(sparql_endpoint.requests) == 1
+    assert len(result) == 22
+
+    onto.endpoint_backend = "service"
+    for _ in range(2):
+        result = onto.query(
+            sparql_endpoint.url,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasNumberOfAtoms,
+        )
+    assert len(sparql_endpoint.requests) == 2
+    assert len(result) == 22
+
+
+def test_query_many():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = [
+        onto.query(kg, terms.cmso.AtomicScaleSample, terms.cmso.hasNumberOfAtoms),
+        onto.query(
+            kg,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+        ),
+    ]
+    onto.path_cache.clear()
+    counted = FlakyGraph(kg, fail_at=None)
+    results = onto.query_many(
+        counted,
+        [
+            (terms.cmso.AtomicScaleSample, [terms.cmso.hasNumberOfAtoms]),
+            (terms.cmso.AtomicScaleSample, [terms.cmso.hasLatticeParameter]),
+            {
+                "source": terms.cmso.AtomicScaleSample,
+                "destinations": [terms.cmso.hasNumberOfAtoms],
+            },
+        ],
+        num_paths=4,
+    )
+    assert results[0].equals(expected[0])
+    assert results[2].equals(expected[0])
+    assert sorted(map(tuple, results[1].values)) == sorted(
+        map(tuple, expected[1].values)
+    )
+    # the query shared by two requests is run once
+    assert len(counted.queries) == 5
+    # only the paths of the requested pairs are searched
+    assert {key[1:] for key, paths in onto.path_cache.items()} == {
+        ("cmso:AtomicScaleSample", "cmso:hasNumberOfAtomsvalue", 4),
+        ("cmso:AtomicScaleSample", "cmso:hasLatticeParameter", 4),
+    }
+
+    results = onto.query_many(
+        kg,
+        {"atoms": (terms.cmso.AtomicScaleSample, terms.cmso.hasNumberOfAtoms, 5)},
+        executor=None,
+    )
+    assert list(results) == ["atoms"]
+    assert len(results["atoms"]) == 5
+    assert onto.query_many(kg, []) == []
+
+
+def test_explain():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    plan = onto.explain(
+        terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+    )
+    assert sorted(plan["queries"]) == sorted(
+        onto.create_query(
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+            return_list=True,
+        )
+    )
+    assert plan["namespaces"] == ["cmso", "rdf"]
+    assert plan["length"] == sum(len(text) for text in plan["queries"])
+    source = plan["sources"][0]
+    assert source["source"] == "cmso:AtomicScaleSample"
+    assert source["combinations"] == 4
+    assert len(source["paths"]["hasLatticeParameter"]) == 4
+    assert [query["paths"]["hasLatticeParameter"] for query in source["queries"]] == [
+        0,
+        1,
+        2,
+        3,
+    ]
+    assert all(
+        pattern["cardinality"] is None
+        for query in source["queries"]
+        for pattern in query["patterns"]
+    )
+
+    plan = onto.explain(
+        terms.cmso.AtomicScaleSample,
+        [terms.cmso.hasNumberOfAtoms == 4, terms.cmso.Material],
+        max_queries=1,
+        kg=kg,
+    )
+    source = plan["sources"][0]
+    assert source["unions"] == [
+        {"variable": "Material", "class": "cmso:Material", "size": 3}
+    ]
+    assert "FILTER" in plan["queries"][0]
+    patterns = {
+        pattern["pattern"]: pattern["cardinality"]
+        for pattern in source["queries"][0]["patterns"]
+    }
+    assert patterns["?Material rdf:type cmso:CrystallineMaterial"] == 22
+    assert patterns["?Material rdf:type cmso:Material"] == 0
+
+    plan = onto.explain(
+        terms.cmso.AtomicScaleSample,
+        kg={"http://purls.helmholtz-metadaten.de/cmso/AtomicScaleSample": 7},
+    )
+    assert plan["sources"][0]["combinations"] == 1
+    assert plan["sources"][0]["queries"][0]["patterns"][0]["cardinality"] == 7
+    with pytest.raises(ValueError):
+        onto.explain(terms.cmso.AtomicScaleSample, kg="http://example.org/sparql")
+
+
+class FlakyGraph:
+    def __init__(self, kg, fail_at):
+        self.kg = kg
+        self.fail_at = fail_at
+        self.queries = []
+
+    def query(self, query_string):
+        self.queries.append(query_string)
+        if len(self.queries) == self.fail_at:
+            raise ConnectionError("endpoint timed out")
+        return self.kg.query(query_string)
+
+
+def test_query_pages():
+    onto = read_ontology()
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = onto.terms
+    expected = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+    )
+    paged = FlakyGraph(kg, fail_at=None)
+    result = onto.query(
+        paged,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+        page_size=10,
+    )
+    assert sorted(map(tuple, result.values)) == sorted(map(tuple, expected.values))
+    assert all("ORDER BY ?AtomicScaleSample" in q for q in paged.queries)
+    assert any("LIMIT 10\nOFFSET 20" in q for q in paged.queries)
+
+    # the limit applies to each query over all pages
+    result = onto.query(
+        kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasNumberOfAtoms,
+        limit=15,
+        page_size=10,
+    )
+    assert len(result) == 15
+
+    # a failed page can be resumed from its cursor
+    flaky = FlakyGraph(kg, fail_at=4)
+    with pytest.raises(PaginationError) as excinfo:
+        onto.query(
+            flaky,
+            terms.cmso.AtomicScaleSample,
+            terms.cmso.hasLatticeParameter,
+            num_paths=4,
+            page_size=10,
+        )
+    error = excinfo.value
+    assert isinstance(error.__cause__, ConnectionError)
+    rest = onto.query(
+        flaky,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+        page_size=10,
+        cursor=error.cursor,
+    )
+    result = pd.concat([error.partial, rest])
+    assert sorted(map(tuple, result.values)) == sorted(map(tuple, expected.values))
+
+    with pytest.raises(ValueError):
+        onto.query(kg, terms.cmso.AtomicScaleSample, page_size=0)
+
+
+class SlowGraph:
+    def query(self, query_string):
+        time.sleep(1)
+
+
+def test_aquery(sparql_endpoint):
+    onto = read_ontology()
+    terms = onto.terms
+    expected = onto.query(
+        sparql_endpoint.kg,
+        terms.cmso.AtomicScaleSample,
+        terms.cmso.hasLatticeParameter,
+        num_paths=4,
+    )
+
+    async def run():
+        query = await onto.acreate_query(
+            terms.cmso.AtomicScaleSample, terms.cmso.hasLatticeParameter, num_paths=4
+        )
+        assert len(query) == 4
+        return await asyncio.gather(
+            onto.aquery(
+                sparql_endpoint.kg,
+                terms.cmso.AtomicScaleSample,
+                terms.cmso.hasLatticeParameter,
+                num_paths=4,
+            ),
+            onto.aquery(
+                sparql_endpoint.url,
+                terms.cmso.AtomicScaleSample,
+                terms.cmso.hasLatticeParameter,
+                num_paths=4,
+                timeout=30,
+            ),
+        )
+
+    local, remote = asyncio.run(run())
+    assert local.equals(expected)
+    assert len(remote) == len(expected)
+    assert len(sparql_endpoint.requests) == 4
+
+
+def test_network_close():
+    onto = read_ontology()
+    terms = onto.terms
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    with onto:
+        result = asyncio.run(
+            onto.aquery(kg, terms.cmso.AtomicScaleSample, terms.cmso.hasNumberOfAtoms)
+        )
+        executor = onto._executor
+        assert executor is not None
+    assert len(result) == 22
+    assert onto._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+    onto.close()
+
+
+def test_aquery_timeout():
+    onto = read_ontology()
+    terms = onto.terms
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(
+            onto.aquery(
+                SlowGraph(),
+                terms.cmso.AtomicScaleSample,
+                terms.cmso.hasNumberOfAtoms,
+                timeout=0.1,
+            )
+        )
+
+
+def test_network_pickle():
+    onto = read_ontology()
+    onto.warmup(["cmso:AtomicScaleSample"])
+    onto._get_executor()
+    loaded = pickle.loads(pickle.dumps(onto))
+    assert loaded._executor is None
+    assert len(loaded.path_cache) == len(onto.path_cache) > 0
+
+    kg = Graph()
+    kg.parse("tests/triples", format="turtle")
+    terms = loaded.terms
+    result = asyncio.run(
+        loaded.aquery(kg, terms.cmso.AtomicScaleSample, terms.cmso.hasNumberOfAtoms)
+    )
+    assert len(result) == 22
+
+
 def test_ontology_network_base_init(simple_onto):
     network = OntologyNetworkBase(simple_onto)
     assert network.onto == simple_onto
@@ -449,6 +1039,75 @@ def test_ontology_network_base_add_path(simple_onto):
     assert network._g is None
 
 
+def test_ontology_network_base_add_term_incremental(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    terms = network.terms
+    g = network.g
+
+    network.add_term("http://example.org/ontology#Pasta", "class")
+    network.add_term(
+        "http://example.org/ontology#hasSauce",
+        "object_property",
+        dm=["http://example.org/ontology#Pasta"],
+        rn=["http://example.org/ontology#Food"],
+    )
+
+    assert network._terms is terms
+    assert network._g is g
+    assert network.terms.ex.Pasta.name == "ex:Pasta"
+    assert g.has_edge("ex:Pasta", "ex:hasSauce")
+    assert g.has_edge("ex:hasSauce", "ex:Food")
+    query = network.create_query(network.terms.ex.Pasta, network.terms.ex.hasSauce)
+    assert "ex:hasSauce" in query
+
+
+def test_add_term_class_matches_parsing():
+    onto = read_ontology()
+    onto.g
+    onto.terms
+    onto.add_term("http://purls.helmholtz-metadaten.de/cmso/NewClass", "class")
+
+    def dump(parser):
+        return {
+            key: [
+                (name, term.domain, term.range, term.subclasses)
+                for name, term in items.items()
+            ]
+            for key, items in parser.attributes.items()
+        }
+
+    parser = OntoParser(onto.onto.graph)
+    assert dump(onto.onto) == dump(parser)
+    assert onto.onto.classes == parser.classes
+    assert sorted(onto.g.edges) == sorted(parser.get_networkx_graph().edges)
+
+
+def test_add_term_class_owlThing_domain():
+    onto = read_ontology()
+    onto.g
+    onto.terms
+    onto.add_term("http://purls.helmholtz-metadaten.de/cmso/NewClass", "class")
+
+    query = onto.create_query(onto.terms.cmso.NewClass, onto.terms.cmso.hasName)
+    assert "?NewClass cmso:hasName ?hasNamevalue" in query
+
+
+def test_ontology_network_base_add_path_edges(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    g = network.g
+    network.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+
+    assert network._g is g
+    assert g.has_edge("ex:Person", "ex:owns")
+    assert g.has_edge("ex:owns", "ex:Pizza")
+
+    # paths survive a rebuild of the graph
+    network._g = None
+    assert network.g.has_edge("ex:owns", "ex:Pizza")
+    query = network.create_query(network.terms.ex.Person, network.terms.ex.hasPrice)
+    assert "?Person ex:owns ?ex_Pizza" in query
+
+
 def test_ontology_network_base_add_path_invalid_subject(simple_onto):
     network = OntologyNetworkBase(simple_onto)
     with pytest.raises(ValueError):
@@ -461,6 +1120,258 @@ def test_ontology_network_base_add_path_invalid_object(simple_onto):
         network.add_path(("ex:Pizza", "ex:hasTopping", "ex:Invalid"))
 
 
+def test_ontology_network_base_add_terms(simple_onto, tmp_path):
+    network = OntologyNetworkBase(simple_onto)
+    g = network.g
+    network.add_terms(
+        [
+            {"uri": "http://example.org/ontology#Pasta", "node_type": "class"},
+            {"uri": "http://example.org/ontology#Sauce", "node_type": "class"},
+            {
+                "uri": "http://example.org/ontology#hasSauce",
+                "node_type": "object_property",
+                "dm": ["http://example.org/ontology#Pasta"],
+                "rn": ["http://example.org/ontology#Sauce"],
+            },
+        ]
+    )
+    assert network._g is g
+    assert g.has_edge("ex:Pasta", "ex:hasSauce")
+    assert g.has_edge("ex:hasSauce", "ex:Sauce")
+
+    csv_file = tmp_path / "terms.csv"
+    pd.DataFrame(
+        {
+            "uri": [
+                "http://example.org/ontology#Salad",
+                "http://example.org/ontology#hasWeight",
+            ],
+            "node_type": ["class", "data_property"],
+            "dm": [
+                None,
+                "http://example.org/ontology#Pasta;http://example.org/ontology#Salad",
+            ],
+        }
+    ).to_csv(csv_file, index=False)
+    network.add_terms(str(csv_file))
+    assert network.terms.ex.Salad.name == "ex:Salad"
+    assert network.terms.ex.hasWeight.domain == ["ex:Pasta", "ex:Salad"]
+
+
+def test_ontology_network_base_add_terms_invalid(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    n_triples = len(network.onto.graph)
+    with pytest.raises(ValueError):
+        network.add_terms(
+            [
+                {"uri": "http://example.org/ontology#Pasta", "node_type": "class"},
+                {"uri": "http://example.org/ontology#Invalid", "node_type": "invalid"},
+            ]
+        )
+    assert len(network.onto.graph) == n_triples
+
+
+def test_ontology_network_base_add_paths(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    g = network.g
+    network.add_paths(
+        pd.DataFrame(
+            {
+                "subject": ["ex:Person", "ex:Food"],
+                "predicate": ["ex:owns", "ex:isEatenBy"],
+                "object": ["ex:Pizza", "ex:Person"],
+            }
+        )
+    )
+    assert g.has_edge("ex:owns", "ex:Pizza")
+    assert g.has_edge("ex:isEatenBy", "ex:Person")
+    assert network._paths == [
+        ("ex:Person", "ex:owns", "ex:Pizza"),
+        ("ex:Food", "ex:isEatenBy", "ex:Person"),
+    ]
+
+
+def test_ontology_network_base_add_paths_invalid(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    n_triples = len(network.onto.graph)
+    with pytest.raises(ValueError) as excinfo:
+        network.add_paths(
+            [
+                ("ex:Person", "ex:owns", "ex:Pizza"),
+                ("ex:Invalid", "ex:owns", "ex:Pizza"),
+            ]
+        )
+    # only the missing classes are listed
+    assert str(excinfo.value) == "['ex:Invalid'] not found as classes in the ontology"
+    assert len(network.onto.graph) == n_triples
+    assert network._paths == []
+
+
+def test_ontology_network_base_path_cache(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    # keep the queries from being reused
+    network.query_cache.maxsize = 0
+    query = network.create_query(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+    assert network.path_cache.info().misses == 1
+    assert (
+        network.create_query(network.terms.ex.Pizza, network.terms.ex.hasPrice) == query
+    )
+    assert network.path_cache.info().hits == 1
+
+    # changing the graph invalidates the cached paths
+    network.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+    network.create_query(network.terms.ex.Person, network.terms.ex.hasPrice)
+    network.create_query(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+    info = network.path_cache.info()
+    assert info.hits == 1
+    assert info.misses == 3
+    assert info.currsize == 2
+
+
+def test_ontology_network_base_query_cache(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    terms = network.terms
+    terms.ex.hasPrice.range = ["float"]
+    query = network.create_query(terms.ex.Pizza, terms.ex.hasPrice > 10)
+    assert '"10"^^xsd:' in query
+    assert network.query_cache.info().currsize == 1
+
+    # a different value reuses the query, with the paths not looked up again
+    misses = network.path_cache.info().misses
+    other = network.create_query(terms.ex.Pizza, terms.ex.hasPrice > 25)
+    assert network.query_cache.info().hits == 1
+    assert network.path_cache.info().misses == misses
+    assert other == query.replace('"10"^^xsd:', '"25"^^xsd:')
+    assert terms.ex.hasPrice._condition is None
+
+    # a different structure does not
+    network.create_query(terms.ex.Pizza, terms.ex.hasPrice < 25)
+    assert network.query_cache.info().currsize == 2
+
+    # changing the graph invalidates the queries
+    network.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+    network.create_query(terms.ex.Pizza, terms.ex.hasPrice > 10)
+    assert network.query_cache.info().hits == 1
+    assert network.query_cache.info().currsize == 1
+
+
+def test_ontology_network_base_csr_backend(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    expected = network.get_shortest_path(
+        network.terms.ex.Pizza, network.terms.ex.hasPrice
+    )
+    network.path_backend = "csr"
+    assert (
+        network.get_shortest_path(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+        == expected
+    )
+    network.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+    assert network.get_shortest_path(
+        network.terms.ex.Person, network.terms.ex.hasPrice
+    ) == [["Person", "ex:owns", "ex:Pizza", "ex:hasPrice", "hasPricevalue"]]
+
+    network.path_backend = "unknown"
+    with pytest.raises(ValueError):
+        network.get_shortest_path(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+
+
+def test_ontology_network_base_one_tree_per_source(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    network.path_backend = "csr"
+    network.add_path(("ex:Pizza", "ex:isEatenBy", "ex:Person"))
+    network.create_query(
+        network.terms.ex.Pizza,
+        [network.terms.ex.hasPrice, network.terms.ex.Food, network.terms.ex.Person],
+    )
+    info = network.path_cache.info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_shortest_path_matches_networkx():
+    onto = read_ontology()
+    terms = onto.terms
+    # the path through cmso:Length is as short, networkx picks this one
+    expected = [
+        "AtomicScaleSample",
+        "cmso:hasSimulationCell",
+        "cmso:SimulationCell",
+        "cmso:hasLength",
+        "cmso:LatticeParameter",
+        "cmso:hasLength_x",
+        "hasLength_xvalue",
+    ]
+    path = onto.get_shortest_path(terms.cmso.AtomicScaleSample, terms.cmso.hasLength_x)
+    assert path == [expected]
+    assert (
+        next(
+            nx.shortest_simple_paths(
+                onto.g, "cmso:AtomicScaleSample", "cmso:hasLength_x"
+            )
+        )[1:]
+        == expected[1:-1]
+    )
+
+
+def test_ontology_network_base_reachability(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    assert network.is_reachable(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+    assert not network.is_reachable(network.terms.ex.Person, network.terms.ex.Pizza)
+    assert sorted(network.reachable_from(network.terms.ex.Pizza)) == [
+        "ex:Food",
+        "ex:hasPrice",
+        "ex:hasPricevalue",
+        "ex:hasTopping",
+    ]
+
+    # unreachable destinations fail before any path search
+    with pytest.raises(nx.NetworkXNoPath):
+        network.create_query(network.terms.ex.Person, network.terms.ex.hasPrice)
+    assert network.path_cache.info().misses == 0
+
+    network.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+    assert network.is_reachable("ex:Person", "ex:Pizza")
+
+
+def test_ontology_network_base_warmup(simple_onto):
+    network = OntologyNetworkBase(simple_onto)
+    # the paths to the 4 nodes reachable from the source
+    network.warmup([network.terms.ex.Pizza])
+    assert network.path_cache.info().currsize == 4
+    network.create_query(network.terms.ex.Pizza, network.terms.ex.hasPrice)
+    assert network.path_cache.info().hits == 1
+
+    network.warmup(["ex:Pizza"], num_paths=2)
+    assert network.path_cache.info().currsize == 8
+    network.warmup(["ex:Pizza"], [network.terms.ex.Food, "ex:Person"], num_paths=3)
+    assert network.path_cache.info().currsize == 9
+
+    # one shortest path tree for the csr backend
+    network.path_backend = "csr"
+    network.warmup(["ex:Pizza"])
+    assert network.path_cache.info().currsize == 10
+
+
+def test_ontology_network_base_save_and_load_paths(simple_onto, tmp_path):
+    network = OntologyNetworkBase(simple_onto)
+    network.warmup(["ex:Pizza"], num_paths=2)
+    path_file = str(tmp_path / "network.paths")
+    network.save_paths(path_file)
+
+    loaded = OntologyNetworkBase(simple_onto)
+    assert loaded.load_paths(path_file)
+    assert loaded.path_cache.items() == network.path_cache.items()
+
+    # paths of a different graph are not loaded
+    loaded.add_path(("ex:Person", "ex:owns", "ex:Pizza"))
+    with pytest.warns(UserWarning):
+        assert not loaded.load_paths(path_file)
+    assert not loaded.load_paths(str(tmp_path / "missing.paths"))
+    with pytest.raises(ValueError):
+        loaded.save_paths()
+
+
 def test_ontology_network_init(tmp_path):
     owl_file = tmp_path / "test.owl"
     owl_content = """<?xml version="1.0"?>
@@ -473,3 +1384,60 @@ def test_ontology_network_init(tmp_path):
     owl_file.write_text(owl_content)
     network = OntologyNetwork(str(owl_file), format="xml")
     assert network.onto is not None
+
+
+def test_ontology_network_cache(tmp_path, monkeypatch):
+    import tools4rdf.network.network as network_module
+
+    owl_file = tmp_path / "test.owl"
+    owl_content = """<?xml version="1.0"?>
+    <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+             xmlns:owl="http://www.w3.org/2002/07/owl#"
+             xmlns:ex="http://example.org/ontology#">
+        <owl:Class rdf:about="http://example.org/ontology#Pizza"/>
+    </rdf:RDF>
+    """
+    owl_file.write_text(owl_content)
+    cache_dir = tmp_path / "cache"
+
+    network = OntologyNetwork(str(owl_file), cache_dir=str(cache_dir))
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ontology should be loaded from the cache")
+
+    monkeypatch.setattr(network_module, "parse_ontology", fail)
+    cached = OntologyNetwork(str(owl_file), cache_dir=str(cache_dir))
+    assert cached.onto._data_dict is not None
+    assert cached._g is not None
+    assert sorted(cached.attributes["class"]) == sorted(network.attributes["class"])
+    assert sorted(cached.g.nodes) == sorted(network.g.nodes)
+    assert cached.namespaces == network.namespaces
+    assert cached.terms.ex.Pizza.name == "ex:Pizza"
+
+
+def test_ontology_network_cache_paths(tmp_path):
+    owl_file = tmp_path / "test.owl"
+    owl_content = """<?xml version="1.0"?>
+    <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+             xmlns:owl="http://www.w3.org/2002/07/owl#"
+             xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+             xmlns:ex="http://example.org/ontology#">
+        <owl:Class rdf:about="http://example.org/ontology#Pizza"/>
+        <owl:DatatypeProperty rdf:about="http://example.org/ontology#hasPrice">
+            <rdfs:domain rdf:resource="http://example.org/ontology#Pizza"/>
+        </owl:DatatypeProperty>
+    </rdf:RDF>
+    """
+    owl_file.write_text(owl_content)
+    cache_dir = tmp_path / "cache"
+
+    network = OntologyNetwork(str(owl_file), cache_dir=str(cache_dir))
+    network.warmup([network.terms.ex.Pizza])
+    network.save_paths()
+    assert len(list(cache_dir.iterdir())) == 2
+
+    cached = OntologyNetwork(str(owl_file), cache_dir=str(cache_dir))
+    assert cached.path_cache.info().currsize == network.path_cache.info().currsize
+    cached.create_query(cached.terms.ex.Pizza, cached.terms.ex.hasPrice)
+    assert cached.path_cache.info().hits == 1
@@ -344,6 +344,51 @@ def test_unravel_relation():
     assert ex.Pasta in result
 
 
+def test_unravel_relation_does_not_share_default():
+    g = Graph()
+    ex = Namespace("http://example.org/ontology#")
+
+    first = BNode()
+    g.add((first, RDF.first, ex.Pizza))
+    g.add((first, RDF.rest, RDF.nil))
+    second = BNode()
+    g.add((second, RDF.first, ex.Pasta))
+    g.add((second, RDF.rest, RDF.nil))
+
+    parser = OntoParser(g)
+    assert parser.unravel_relation(first) == [ex.Pizza]
+    assert parser.unravel_relation(second) == [ex.Pasta]
+
+
+def test_build_index(parser_with_properties):
+    ex = Namespace("http://example.org/ontology#")
+    parser = parser_with_properties
+    parser._build_index()
+
+    assert ex.Pizza in parser._instances(OWL.Class)
+    assert ex.hasTopping in parser._instances(OWL.ObjectProperty)
+    assert parser._objects(ex.hasTopping, RDFS.domain) == [ex.Pizza]
+    assert parser._objects(ex.hasTopping, RDFS.label) == []
+    assert parser._instances(OWL.NamedIndividual) == []
+
+
+def test_build_index_order():
+    g = Graph()
+    ex = Namespace("http://example.org/ontology#")
+    for name in ["Pizza", "Food", "Pasta", "Dish", "Topping", "Person"]:
+        g.add((ex[name], RDF.type, OWL.Class))
+    for name in ["Food", "Dish", "Person"]:
+        g.add((ex.Pizza, RDFS.subClassOf, ex[name]))
+    parser = OntoParser(g)
+    parser._build_index()
+
+    # the index keeps the order of the graph, which does not depend on hashing
+    assert parser._instances(OWL.Class) == list(g.subjects(RDF.type, OWL.Class))
+    assert parser._objects(ex.Pizza, RDFS.subClassOf) == list(
+        g.objects(ex.Pizza, RDFS.subClassOf)
+    )
+
+
 def test_lookup_node_simple():
     g = Graph()
     ex = Namespace("http://example.org/ontology#")
@@ -528,7 +573,91 @@ def test_add_namespace():
 
     parser.add_namespace("custom", "http://custom.org/")
 
+    assert parser._data_dict is not None
+    assert parser.namespaces["custom"] == "http://custom.org/"
+
+
+def test_add_namespace_before_parsing():
+    g = Graph()
+    g.add((URIRef("http://custom.org/Pizza"), RDF.type, OWL.Class))
+    parser = OntoParser(g)
+
+    # the namespace of the terms exists once the ontology is parsed
+    parser.add_namespace("custom.org", "http://other.org/")
+    bound = {prefix: iri.toPython() for prefix, iri in parser.graph.namespaces()}
+    assert bound.get("custom.org") != "http://other.org/"
+    assert parser.namespaces["custom.org"] == "http://custom.org/"
+
+    parser.add_namespace("custom", "http://other.org/")
+    parser.add_namespace("custom", "http://another.org/")
+    assert parser.namespaces["custom"] == "http://other.org/"
+    assert "custom.org:Pizza" in parser.attributes["class"]
+
+
+def test_add_namespace_renaming_terms():
+    g = Graph()
+    g.add((URIRef("http://custom.org/Pizza"), RDF.type, OWL.Class))
+    parser = OntoParser(g)
+    parser._initialize()
+    assert "custom.org:Pizza" in parser.attributes["class"]
+
+    parser.add_namespace("custom", "http://custom.org/")
+
+    assert parser._data_dict is None
+    assert "custom:Pizza" in parser.attributes["class"]
+
+
+def test_add_term_incremental(parser_with_properties):
+    parser = parser_with_properties
+    data_dict = parser.data_dict
+
+    new_class = parser.add_term("http://example.org/ontology#Pasta", "class")
+    new_property = parser.add_term(
+        "http://example.org/ontology#hasSauce",
+        "object_property",
+        dm=["http://example.org/ontology#Pasta"],
+        rn=["http://example.org/ontology#Pizza"],
+    )
+    new_data_property = parser.add_term(
+        "http://example.org/ontology#hasWeight",
+        "data_property",
+        dm=["http://example.org/ontology#Pasta"],
+    )
+
+    assert parser._data_dict is data_dict
+    assert new_class.name == "ex:Pasta"
+    assert parser.attributes["class"]["ex:Pasta"] is new_class
+    assert "ex:Pasta" in parser.attributes["class"]["owl:Thing"].subclasses
+    assert parser.ancestors("ex:Pasta") == ["owl:Thing"]
+    assert new_property.domain == ["ex:Pasta"]
+    assert new_property.range == ["ex:Pizza"]
+    assert new_data_property.associated_data_node == "ex:hasWeightvalue"
+    assert "ex:hasWeightvalue" in parser.attributes["data_nodes"]
+
+    # the incremental result is the same as parsing again
+    reparsed = OntoParser(parser.graph)
+    for key in ["class", "object_property", "data_property"]:
+        assert sorted(reparsed.attributes[key]) == sorted(parser.attributes[key])
+    assert sorted(reparsed.attributes["class"]["owl:Thing"].subclasses) == sorted(
+        parser.attributes["class"]["owl:Thing"].subclasses
+    )
+    for name, term in reparsed.attributes["object_property"].items():
+        assert term.domain == parser.attributes["object_property"][name].domain
+        assert term.range == parser.attributes["object_property"][name].range
+
+
+def test_add_term_with_superclass_reparses(simple_graph):
+    ex = Namespace("http://example.org/ontology#")
+    simple_graph.add((ex.Margherita, RDFS.subClassOf, ex.Pizza))
+    parser = OntoParser(simple_graph)
+    parser._initialize()
+    assert "ex:Margherita" not in parser.attributes["class"]
+
+    term = parser.add_term("http://example.org/ontology#Margherita", "class")
+
+    assert term is None
     assert parser._data_dict is None
+    assert "ex:Margherita" in parser.attributes["class"]["ex:Food"].subclasses
 
 
 def test_extract_values():
@@ -630,6 +759,55 @@ def test_recursively_add_subclasses():
     assert "ex:Margherita" in parser.attributes["class"]["ex:Food"].subclasses
 
 
+def test_ancestors_and_descendants():
+    g = Graph()
+    ex = Namespace("http://example.org/ontology#")
+    g.bind("ex", ex)
+
+    g.add((ex.Food, RDF.type, OWL.Class))
+    g.add((ex.Pizza, RDF.type, OWL.Class))
+    g.add((ex.Margherita, RDF.type, OWL.Class))
+    g.add((ex.Pizza, RDFS.subClassOf, ex.Food))
+    g.add((ex.Margherita, RDFS.subClassOf, ex.Pizza))
+    g.add((ex.hasTopping, RDF.type, OWL.ObjectProperty))
+    g.add((ex.hasCheese, RDF.type, OWL.ObjectProperty))
+    g.add((ex.hasCheese, RDFS.subPropertyOf, ex.hasTopping))
+
+    parser = OntoParser(g)
+
+    assert parser.descendants("ex:Food") == ["ex:Pizza", "ex:Margherita"]
+    assert sorted(parser.ancestors("ex:Margherita")) == [
+        "ex:Food",
+        "ex:Pizza",
+        "owl:Thing",
+    ]
+    assert parser.ancestors("ex:Pizza") == ["ex:Food", "owl:Thing"]
+    assert parser.ancestors("ex:Food") == ["owl:Thing"]
+    assert parser.ancestors("owl:Thing") == []
+    assert parser.descendants("ex:hasTopping") == ["ex:hasCheese"]
+    term = parser.attributes["object_property"]["ex:hasCheese"]
+    assert parser.ancestors(term) == ["ex:hasTopping"]
+
+    with pytest.raises(ValueError):
+        parser.ancestors("ex:Unknown")
+
+
+def test_subclass_cycle():
+    g = Graph()
+    ex = Namespace("http://example.org/ontology#")
+    g.bind("ex", ex)
+
+    g.add((ex.Pizza, RDF.type, OWL.Class))
+    g.add((ex.Pie, RDF.type, OWL.Class))
+    g.add((ex.Pizza, RDFS.subClassOf, ex.Pie))
+    g.add((ex.Pie, RDFS.subClassOf, ex.Pizza))
+
+    parser = OntoParser(g)
+
+    assert sorted(parser.descendants("ex:Pizza")) == ["ex:Pie", "ex:Pizza"]
+    assert sorted(parser.ancestors("ex:Pie")) == ["ex:Pie", "ex:Pizza", "owl:Thing"]
+
+
 def test_recursively_add_equivalents():
     g = Graph()
     ex = Namespace("http://example.org/ontology#")
@@ -0,0 +1,190 @@
+import itertools
+import pickle
+import networkx as nx
+import pytest
+from tools4rdf.network.paths import (
+    PathCache,
+    CSRGraph,
+    ReachabilityIndex,
+    graph_fingerprint,
+)
+
+
+@pytest.fixture
+def diamond():
+    g = nx.DiGraph()
+    g.add_edges_from(
+        [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e"), ("a", "e")]
+    )
+    g.add_node("f")
+    return g
+
+
+def test_path_cache_hit_and_miss():
+    cache = PathCache(maxsize=2)
+    assert cache.get(("a", "b", 1), 0) is None
+    cache.put(("a", "b", 1), 0, [["a", "p", "b"]])
+    assert cache.get(("a", "b", 1), 0) == [["a", "p", "b"]]
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.maxsize == 2
+    assert info.currsize == 1
+
+
+def test_path_cache_eviction():
+    cache = PathCache(maxsize=2)
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    cache.put(("a", "c", 1), 0, [["a", "c"]])
+    # a -> b is now the most recently used entry
+    cache.get(("a", "b", 1), 0)
+    cache.put(("a", "d", 1), 0, [["a", "d"]])
+
+    assert len(cache) == 2
+    assert cache.get(("a", "c", 1), 0) is None
+    assert cache.get(("a", "b", 1), 0) == [["a", "b"]]
+
+
+def test_path_cache_version():
+    cache = PathCache()
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    assert cache.get(("a", "b", 1), 1) is None
+    assert len(cache) == 0
+    # paths found in an outdated graph are not stored
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    assert len(cache) == 0
+
+
+def test_path_cache_disabled_and_clear():
+    cache = PathCache(maxsize=0)
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    assert cache.get(("a", "b", 1), 0) is None
+
+    cache = PathCache()
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    cache.get(("a", "b", 1), 0)
+    cache.clear()
+    assert cache.info() == (0, 0, cache.maxsize, 0)
+
+
+def test_path_cache_pickle():
+    cache = PathCache(maxsize=2)
+    cache.put(("a", "b", 1), 0, [["a", "b"]])
+    loaded = pickle.loads(pickle.dumps(cache))
+    assert loaded.get(("a", "b", 1), 0) == [["a", "b"]]
+    assert loaded.maxsize == 2
+    loaded.put(("a", "c", 1), 0, [["a", "c"]])
+    assert len(loaded) == 2
+    assert len(cache) == 1
+
+
+def test_graph_fingerprint(diamond):
+    assert graph_fingerprint(diamond) == graph_fingerprint(diamond.copy())
+    # the same graph built in another order can break ties in other ways
+    reordered = nx.DiGraph()
+    reordered.add_nodes_from(reversed(list(diamond.nodes)))
+    reordered.add_edges_from(reversed(list(diamond.edges)))
+    assert set(reordered.edges) == set(diamond.edges)
+    assert graph_fingerprint(reordered) != graph_fingerprint(diamond)
+    changed = diamond.copy()
+    changed.add_edge("e", "f")
+    assert graph_fingerprint(changed) != graph_fingerprint(diamond)
+
+
+def test_csr_graph_arrays(diamond):
+    csr = CSRGraph(diamond)
+    a = csr.index["a"]
+    successors = csr.indices[csr.indptr[a] : csr.indptr[a + 1]]
+    assert [csr.nodes[i] for i in successors] == ["b", "c", "e"]
+    e = csr.index["e"]
+    predecessors = csr.rev_indices[csr.rev_indptr[e] : csr.rev_indptr[e + 1]]
+    assert sorted(csr.nodes[i] for i in predecessors) == ["a", "d"]
+
+
+def test_csr_graph_shortest_path(diamond):
+    csr = CSRGraph(diamond)
+    assert csr.shortest_path("a", "e") == ["a", "e"]
+    assert csr.shortest_path("b", "e") == ["b", "d", "e"]
+    with pytest.raises(nx.NetworkXNoPath):
+        csr.shortest_path("e", "a")
+    with pytest.raises(nx.NodeNotFound):
+        csr.shortest_path("a", "x")
+
+
+def test_csr_graph_shortest_simple_paths(diamond):
+    csr = CSRGraph(diamond)
+    paths = csr.shortest_simple_paths("a", "e", num_paths=5)
+    assert paths[0] == ["a", "e"]
+    assert sorted(paths[1:]) == [["a", "b", "d", "e"], ["a", "c", "d", "e"]]
+    assert csr.shortest_simple_paths("a", "e", num_paths=2)[0] == ["a", "e"]
+    with pytest.raises(nx.NetworkXNoPath):
+        csr.shortest_simple_paths("a", "f", num_paths=2)
+
+
+def test_csr_graph_matches_networkx():
+    for seed in range(50):
+        g = nx.gnp_random_graph(25, 0.12, directed=True, seed=seed)
+        csr = CSRGraph(g)
+        if not nx.has_path(g, 0, 1):
+            continue
+        expected = list(itertools.islice(nx.shortest_simple_paths(g, 0, 1), 5))
+        paths = csr.shortest_simple_paths(0, 1, num_paths=5)
+        assert [len(path) for path in paths] == [len(path) for path in expected]
+        assert len(set(map(tuple, paths))) == len(paths)
+        for path in paths:
+            assert len(set(path)) == len(path)
+            assert all(g.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+def test_csr_graph_shortest_path_tree(diamond):
+    csr = CSRGraph(diamond)
+    tree = csr.shortest_path_tree("a")
+    assert csr.tree_path(tree, "a", "a") == ["a"]
+    assert csr.tree_path(tree, "a", "d") == ["a", "b", "d"]
+    assert csr.tree_path(tree, "a", "e") == ["a", "e"]
+    with pytest.raises(nx.NetworkXNoPath):
+        csr.tree_path(tree, "a", "f")
+    with pytest.raises(nx.NodeNotFound):
+        csr.shortest_path_tree("x")
+
+
+def test_csr_graph_shortest_path_tree_random():
+    for seed in range(20):
+        g = nx.gnp_random_graph(40, 0.08, directed=True, seed=seed)
+        csr = CSRGraph(g)
+        tree = csr.shortest_path_tree(0)
+        lengths = nx.single_source_shortest_path_length(g, 0)
+        for node in g.nodes:
+            if node in lengths:
+                path = csr.tree_path(tree, 0, node)
+                assert path[0] == 0 and path[-1] == node
+                assert len(path) == lengths[node] + 1
+                assert all(g.has_edge(u, v) for u, v in zip(path, path[1:]))
+            else:
+                with pytest.raises(nx.NetworkXNoPath):
+                    csr.tree_path(tree, 0, node)
+
+
+def test_reachability_index(diamond):
+    diamond.add_edges_from([("e", "g"), ("g", "e")])
+    index = ReachabilityIndex(CSRGraph(diamond))
+    assert index.is_reachable("a", "e")
+    assert index.is_reachable("b", "g")
+    assert index.is_reachable("g", "e")
+    assert index.is_reachable("a", "a")
+    assert not index.is_reachable("e", "a")
+    assert not index.is_reachable("a", "f")
+    assert sorted(index.reachable_from("a")) == ["b", "c", "d", "e", "g"]
+    assert sorted(index.reachable_from("e")) == ["g"]
+    assert index.reachable_from("f") == []
+    with pytest.raises(nx.NodeNotFound):
+        index.is_reachable("a", "x")
+
+
+def test_reachability_index_matches_networkx():
+    for seed in range(10):
+        g = nx.gnp_random_graph(40, 0.05, directed=True, seed=seed)
+        index = ReachabilityIndex(CSRGraph(g))
+        for node in g.nodes:
+            assert set(index.reachable_from(node)) == nx.descendants(g, node)
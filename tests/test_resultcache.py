@@ -0,0 +1,80 @@
+import pickle
+import time
+
+import pandas as pd
+from rdflib import Graph, Literal, URIRef
+
+from tools4rdf.network.endpoint import SPARQLEndpoint
+from tools4rdf.network.resultcache import ResultCache, kg_fingerprint
+
+
+def frame(n):
+    return pd.DataFrame({"a": range(n)})
+
+
+def test_kg_fingerprint():
+    kg = Graph()
+    first = kg_fingerprint(kg)
+    kg.add((URIRef("http://example.org/a"), URIRef("http://example.org/b"), Literal(1)))
+    assert kg_fingerprint(kg) != first
+    assert kg_fingerprint(kg, version=1) != kg_fingerprint(kg, version=2)
+    endpoint = SPARQLEndpoint("http://example.org/sparql")
+    assert kg_fingerprint(endpoint) == ("endpoint", "http://example.org/sparql", None)
+    assert kg_fingerprint(object()) is None
+    assert kg_fingerprint(object(), version=1) is not None
+
+
+def test_result_cache():
+    cache = ResultCache()
+    assert cache.get(("q", 1)) is None
+    cache.put(("q", 1), frame(3))
+    result = cache.get(("q", 1))
+    assert result.equals(frame(3))
+    # the cached frame is not changed through the result
+    result["a"] = 0
+    assert cache.get(("q", 1)).equals(frame(3))
+    info = cache.info()
+    assert (info.hits, info.misses) == (2, 1)
+    assert info.hit_rate == 2 / 3
+    assert info.currbytes == frame(3).memory_usage(deep=True).sum()
+
+
+def test_result_cache_pickle():
+    cache = ResultCache()
+    cache.put(("q", 1), frame(3))
+    loaded = pickle.loads(pickle.dumps(cache))
+    assert loaded.get(("q", 1)).equals(frame(3))
+    loaded.put(("q", 2), frame(2))
+    assert len(loaded) == 2
+
+
+def test_result_cache_eviction():
+    size = frame(100).memory_usage(deep=True).sum()
+    cache = ResultCache(maxbytes=2 * size)
+    cache.put("a", frame(100))
+    cache.put("b", frame(100))
+    cache.get("a")
+    cache.put("c", frame(100))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.info().currbytes == 2 * size
+    # results larger than the cache are not kept
+    cache.put("d", frame(1000))
+    assert cache.get("d") is None
+
+
+def test_result_cache_ttl():
+    cache = ResultCache(ttl=0.05)
+    cache.put("a", frame(3))
+    assert cache.get("a") is not None
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_result_cache_directory(tmp_path):
+    ResultCache(directory=str(tmp_path)).put(("q", 1), frame(3))
+    cache = ResultCache(directory=str(tmp_path))
+    assert cache.get(("q", 1)).equals(frame(3))
+    assert cache.get(("q", 2)) is None
+    assert len(cache) == 1
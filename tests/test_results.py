@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from rdflib import Literal, URIRef
+from rdflib.namespace import XSD
+
+from tools4rdf.network.results import build_frame, get_data_types
+from tools4rdf.network.ontology import read_ontology
+
+
+def test_build_frame():
+    rows = [
+        (
+            URIRef("http://example.org/a"),
+            Literal("1.5", datatype=XSD.float),
+            Literal("3", datatype=XSD.integer),
+            Literal("true", datatype=XSD.boolean),
+            Literal("2024-01-02T03:04:05", datatype=XSD.dateTime),
+            Literal("x"),
+        ),
+        (
+            URIRef("http://example.org/b"),
+            None,
+            Literal("4", datatype=XSD.integer),
+            Literal("false", datatype=XSD.boolean),
+            Literal("2024-02-03T04:05:06", datatype=XSD.dateTime),
+            None,
+        ),
+    ]
+    labels = ["s", "f", "i", "b", "d", "x"]
+    df = build_frame(iter(rows), labels)
+    assert list(df.columns) == labels
+    assert isinstance(df["s"].dtype, pd.CategoricalDtype)
+    assert df["f"].dtype == np.float64
+    assert np.isnan(df["f"][1])
+    assert df["i"].dtype == np.int64
+    assert df["b"].tolist() == [True, False]
+    assert df["d"].dt.year.tolist() == [2024, 2024]
+    assert df["x"].tolist()[0] == "x"
+
+
+def test_build_frame_types():
+    rows = [(Literal("3"), Literal("a")), (None, Literal("b"))]
+    # the range of the data property is used over the datatype of the values
+    df = build_frame(rows, ["Cell_hasNumbervalue", "v"], {"hasNumbervalue": "integer"})
+    assert df["Cell_hasNumbervalue"].dtype == np.float64
+    assert df["Cell_hasNumbervalue"][0] == 3
+    # values that do not match their type are kept
+    df = build_frame(rows, ["v", "hasNumbervalue"], {"hasNumbervalue": "integer"})
+    assert df["hasNumbervalue"].tolist() == ["a", "b"]
+    assert len(build_frame([], ["a"])) == 0
+
+
+def test_get_data_types():
+    onto = read_ontology()
+    terms = onto.terms
+    types = get_data_types(
+        [
+            terms.cmso.AtomicScaleSample,
+            [terms.cmso.SimulationCell, terms.cmso.hasVolume],
+            terms.cmso.hasNumberOfAtoms,
+        ]
+    )
+    assert types == {"hasVolumevalue": "float", "hasNumberOfAtomsvalue": "integer"}
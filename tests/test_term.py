@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 from tools4rdf.network.term import (
     OntoTerm,
@@ -382,3 +384,74 @@ def test_ontoterm_and_requires_ontoterm():
     cond = term > 10
     with pytest.raises(TypeError):
         cond & "not a term"
+
+
+def test_ontoterm_compact_representation():
+    term1 = OntoTerm(uri="http://example.org/pizza#Pizza")
+    term2 = OntoTerm(uri="http://example.org/pizza#" + "Pizza".lower().title())
+
+    assert not hasattr(term1, "__dict__")
+    with pytest.raises(AttributeError):
+        term1.unknown_attribute = 1
+    # equal strings are shared between terms
+    assert term1.uri is term2.uri
+    assert term1.name is term2.name
+
+
+def test_ontoterm_lists_not_shared():
+    term1 = OntoTerm(uri="http://example.org/pizza#Pizza")
+    term2 = OntoTerm(uri="http://example.org/pizza#Food")
+
+    term1.subclasses.append("pizza:Margherita")
+    term1.domain.append("pizza:Food")
+    term1._parents.append(term2)
+
+    assert term1.subclasses == ["pizza:Margherita"]
+    assert term2.subclasses == []
+    assert term2.domain == []
+    assert term2._parents == []
+    term2.subclasses = ["pizza:Pizza"]
+    assert term2.subclasses == ["pizza:Pizza"]
+
+
+def test_ontoterm_pickle_and_copy():
+    term = OntoTerm(uri="http://example.org/pizza#Pizza", dm=["pizza:Food"])
+    term.subclasses.append("pizza:Margherita")
+
+    for item in [pickle.loads(pickle.dumps(term)), copy.deepcopy(term)]:
+        assert item.name == term.name
+        assert item.domain == ["pizza:Food"]
+        assert item.subclasses == ["pizza:Margherita"]
+        assert item.named_individuals == []
+
+
+def test_ontoterm_operators_share_ontology_data():
+    term = OntoTerm(
+        uri="http://example.org/pizza#hasPrice",
+        name="pizza:hasPrice",
+        node_type="data_property",
+        dm=["pizza:Pizza"],
+        rn=["float"],
+    )
+    other = OntoTerm(
+        uri="http://example.org/pizza#hasWeight",
+        name="pizza:hasWeight",
+        node_type="data_property",
+        rn=["float"],
+    )
+    parent = OntoTerm(uri="http://example.org/pizza#Pizza")
+
+    cond = term > 10
+    assert cond.domain is term.domain
+    assert cond.range is term.range
+    assert term._condition is None
+
+    combined = cond & (other < 5)
+    assert combined._condition_parents[0]._condition is not None
+    assert cond._condition_parents == []
+
+    with pytest.warns(UserWarning):
+        item = term @ parent
+    assert item._parents[0].name == "pizza:Pizza"
+    assert term._parents == []
+    assert item.any._parents is not item._parents
@@ -1,2 +1,3 @@
-from tools4rdf.network.network import OntologyNetwork
+__version__ = "0.3.8"
 
+from tools4rdf.network.network import OntologyNetwork
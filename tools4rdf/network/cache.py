@@ -0,0 +1,154 @@
+"""
+This module provides an on-disk cache of compiled ontologies.
+
+Parsing an ontology file and building the ontology terms, attribute dictionaries
+and the networkx graph is repeated every time an `OntologyNetwork` is created.
+The compiled cache stores the finished result in a local cache directory, so
+that later constructions from the same file can skip the parsing step.
+
+Cache entries are keyed by the content hash of the ontology file, its format and
+the version of tools4rdf, so that a changed file or an update of the package
+never returns stale data. Entries are stored with `pickle`; only use cache
+directories which are not writable by others.
+"""
+
+import os
+import hashlib
+import pickle
+import tempfile
+import warnings
+
+CACHE_ENV_VARIABLE = "TOOLS4RDF_CACHE_DIR"
+
+# bumped whenever the layout of the compiled objects changes
+CACHE_FORMAT = 2
+
+
+def get_cache_dir(cache_dir=None):
+    """
+    Get the directory used for the compiled ontology cache.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        The cache directory. If not provided, the value of the environment
+        variable `TOOLS4RDF_CACHE_DIR` is used, or `~/.cache/tools4rdf`.
+
+    Returns
+    -------
+    str
+        The path to the cache directory.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_ENV_VARIABLE)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "tools4rdf")
+    return cache_dir
+
+
+def get_cache_key(infile, format="xml"):
+    """
+    Compute the cache key of an ontology file.
+
+    Parameters
+    ----------
+    infile : str
+        The path to the ontology file.
+    format : str, optional
+        The format of the ontology file (default is "xml").
+
+    Returns
+    -------
+    str
+        A hex digest of the file content, the format, the tools4rdf version
+        and the cache format.
+    """
+    from tools4rdf import __version__
+
+    digest = hashlib.sha256()
+    with open(infile, "rb") as fin:
+        for chunk in iter(lambda: fin.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(f"\0{format}\0{__version__}\0{CACHE_FORMAT}".encode())
+    return digest.hexdigest()
+
+
+def get_cache_file(infile, format="xml", cache_dir=None, suffix="onto"):
+    """
+    Get the path of the cache file for an ontology file.
+
+    Parameters
+    ----------
+    infile : str
+        The path to the ontology file.
+    format : str, optional
+        The format of the ontology file (default is "xml").
+    cache_dir : str, optional
+        The cache directory, see `get_cache_dir`.
+    suffix : str, optional
+        The extension of the cache file (default is "onto").
+
+    Returns
+    -------
+    str
+        The path to the cache file.
+    """
+    return os.path.join(
+        get_cache_dir(cache_dir), f"{get_cache_key(infile, format=format)}.{suffix}"
+    )
+
+
+def load_compiled(cache_file):
+    """
+    Load a compiled ontology from the cache.
+
+    Parameters
+    ----------
+    cache_file : str
+        The path to the cache file.
+
+    Returns
+    -------
+    dict or None
+        The compiled ontology, or None if the cache file does not exist or
+        cannot be read.
+    """
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "rb") as fin:
+            return pickle.load(fin)
+    except Exception as e:
+        warnings.warn(f"Ignoring unreadable ontology cache {cache_file}: {e}")
+        return None
+
+
+def save_compiled(cache_file, compiled):
+    """
+    Save a compiled ontology to the cache.
+
+    The file is written to a temporary file first and then moved in place, so
+    that concurrent processes never read a partially written cache file.
+
+    Parameters
+    ----------
+    cache_file : str
+        The path to the cache file.
+    compiled : dict
+        The compiled ontology.
+
+    Returns
+    -------
+    None
+    """
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmpfile = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fout:
+            pickle.dump(compiled, fout, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpfile, cache_file)
+    except Exception:
+        if os.path.exists(tmpfile):
+            os.remove(tmpfile)
+        raise
@@ -0,0 +1,166 @@
+"""
+This module computes transitive closures of hierarchies, such as the subclass,
+subproperty and equivalent class relations of an ontology.
+
+The closure is computed once per hierarchy. Strongly connected components are
+collapsed first, so that cycles in the hierarchy are handled, and the
+descendants are then propagated through the resulting acyclic graph in
+topological order.
+"""
+
+
+def strongly_connected_components(successors):
+    """
+    Find the strongly connected components of a directed graph.
+
+    This is an iterative version of Tarjan's algorithm, so that deep hierarchies
+    do not hit the recursion limit.
+
+    Parameters
+    ----------
+    successors : list of list of int
+        The adjacency list of the graph. Nodes are integers from 0 to
+        ``len(successors) - 1``.
+
+    Returns
+    -------
+    list of list of int
+        The components in reverse topological order, that is, every component
+        comes after all the components that can be reached from it.
+    """
+    n_nodes = len(successors)
+    index = [-1] * n_nodes
+    low = [0] * n_nodes
+    on_stack = [False] * n_nodes
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(n_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+        while work:
+            node, position = work[-1]
+            node_successors = successors[node]
+            if position < len(node_successors):
+                work[-1] = (node, position + 1)
+                child = node_successors[position]
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, 0))
+                elif on_stack[child]:
+                    low[node] = min(low[node], index[child])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def transitive_closure(hierarchy):
+    """
+    Compute all descendants of every node in a hierarchy.
+
+    Parameters
+    ----------
+    hierarchy : dict
+        A dictionary which maps the name of each node to the names of its direct
+        children. Children which are not keys themselves are treated as nodes
+        without children.
+
+    Returns
+    -------
+    dict
+        A dictionary which maps the name of each node to the list of all its
+        descendants. The direct children come first, in their original order,
+        followed by the indirect descendants. A node which is part of a cycle is
+        its own descendant.
+    """
+    names = list(hierarchy.keys())
+    ids = {name: count for count, name in enumerate(names)}
+    for children in hierarchy.values():
+        for child in children:
+            if child not in ids:
+                ids[child] = len(names)
+                names.append(child)
+
+    successors = [[] for _ in names]
+    for name, children in hierarchy.items():
+        successors[ids[name]] = [ids[child] for child in children]
+
+    components = strongly_connected_components(successors)
+    component_of = [0] * len(names)
+    for count, component in enumerate(components):
+        for member in component:
+            component_of[member] = count
+
+    # components are ordered such that all descendants are done before
+    reachable = [None] * len(components)
+    for count, component in enumerate(components):
+        descendants = set()
+        cyclic = len(component) > 1
+        for member in component:
+            for child in successors[member]:
+                child_component = component_of[child]
+                if child_component == count:
+                    cyclic = True
+                elif child not in descendants:
+                    descendants.add(child)
+                    descendants |= reachable[child_component]
+        if cyclic:
+            descendants.update(component)
+        reachable[count] = descendants
+
+    closure = {}
+    for name in hierarchy.keys():
+        node = ids[name]
+        descendants = reachable[component_of[node]]
+        direct = []
+        seen = set()
+        for child in successors[node]:
+            if child not in seen:
+                seen.add(child)
+                direct.append(child)
+        indirect = sorted(descendants.difference(seen))
+        closure[name] = [names[x] for x in direct + indirect]
+    return closure
+
+
+def invert_closure(closure):
+    """
+    Invert a closure, mapping each node to all of its ancestors.
+
+    Parameters
+    ----------
+    closure : dict
+        A dictionary which maps each node to its descendants, as returned by
+        `transitive_closure`.
+
+    Returns
+    -------
+    dict
+        A dictionary which maps each node to the list of its ancestors.
+    """
+    ancestors = {name: [] for name in closure.keys()}
+    for name, descendants in closure.items():
+        for descendant in descendants:
+            ancestors.setdefault(descendant, []).append(name)
+    return ancestors
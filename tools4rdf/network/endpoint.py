@@ -0,0 +1,332 @@
+"""
+This module provides a client for remote SPARQL endpoints.
+
+Queries are sent directly to the endpoint with the SPARQL protocol, instead of
+through a SERVICE clause evaluated by rdflib. The client keeps one HTTP
+connection alive per thread, asks for compressed responses in a compact result
+format, and parses tab separated results line by line as they arrive.
+"""
+
+import gzip
+import http.client
+import io
+import json
+import re
+import threading
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from rdflib import BNode, Literal, URIRef, Variable
+from rdflib.namespace import XSD
+from rdflib.plugins.parsers.ntriples import unquote
+from rdflib.query import Result
+
+ENDPOINT_BACKENDS = ("direct", "service")
+
+RESULT_FORMATS = {
+    "tsv": "text/tab-separated-values",
+    "json": "application/sparql-results+json",
+}
+
+# numbers and booleans may be written without quotes and datatype
+_ABBREVIATIONS = [
+    (re.compile(r"[+-]?\d+$"), XSD.integer),
+    (re.compile(r"[+-]?\d*\.\d+$"), XSD.decimal),
+    (re.compile(r"[+-]?(\d+\.?\d*|\.\d+)[eE][+-]?\d+$"), XSD.double),
+    (re.compile(r"(true|false)$"), XSD.boolean),
+]
+# a quoted literal, with an optional language tag or datatype
+_LITERAL = re.compile(r'"(.*)"(?:@([A-Za-z0-9-]+)|\^\^<(.*)>)?$', re.DOTALL)
+
+_ENDPOINTS = {}
+_ENDPOINTS_LOCK = threading.Lock()
+
+
+def get_endpoint(url):
+    """
+    Get the client of a SPARQL endpoint, shared by all queries to the url.
+
+    Parameters
+    ----------
+    url : str
+        The url of the endpoint.
+
+    Returns
+    -------
+    SPARQLEndpoint
+    """
+    with _ENDPOINTS_LOCK:
+        if url not in _ENDPOINTS:
+            _ENDPOINTS[url] = SPARQLEndpoint(url)
+        return _ENDPOINTS[url]
+
+
+def parse_term(text):
+    """
+    Parse an RDF term of a tab separated SPARQL result.
+
+    Parameters
+    ----------
+    text : str
+        The term, in the syntax of Turtle.
+
+    Returns
+    -------
+    rdflib.term.Identifier or None
+        The term, or None for an unbound variable.
+    """
+    if text == "":
+        return None
+    if text[0] == "<":
+        return URIRef(unquote(text[1:-1]))
+    if text.startswith("_:"):
+        return BNode(text[2:])
+    match = _LITERAL.match(text)
+    if match is not None:
+        value, lang, datatype = match.groups()
+        return Literal(
+            unquote(value),
+            lang=lang,
+            datatype=None if datatype is None else URIRef(datatype),
+        )
+    for pattern, datatype in _ABBREVIATIONS:
+        if pattern.match(text):
+            return Literal(text, datatype=datatype)
+    raise ValueError(f"{text} is not a valid RDF term")
+
+
+def _parse_binding(binding):
+    """Parse an RDF term of a SPARQL JSON result."""
+    if binding["type"] == "uri":
+        return URIRef(binding["value"])
+    if binding["type"] == "bnode":
+        return BNode(binding["value"])
+    datatype = binding.get("datatype")
+    return Literal(
+        binding["value"],
+        lang=binding.get("xml:lang"),
+        datatype=None if datatype is None else URIRef(datatype),
+    )
+
+
+class SPARQLEndpoint:
+    """
+    A client for a remote SPARQL endpoint.
+
+    Parameters
+    ----------
+    url : str
+        The url of the endpoint.
+    timeout : float, optional
+        The timeout of the connections in seconds. Default is None (no timeout).
+    result_format : str, optional
+        The format requested for the results, "tsv" (default) or "json".
+    headers : dict, optional
+        Additional HTTP headers sent with every query, such as authorization.
+
+    Raises
+    ------
+    ValueError
+        If the url is not an http or https url, or the format is not known.
+    """
+
+    def __init__(self, url, timeout=None, result_format="tsv", headers=None):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.hostname is None:
+            raise ValueError(f"{url} is not a valid url")
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(
+                f"Unknown result format {result_format}, use one of {list(RESULT_FORMATS)}"
+            )
+        self.url = url
+        self.timeout = timeout
+        self.result_format = result_format
+        self.headers = dict(headers or {})
+        self._parts = parts
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # connections cannot be shared with other processes
+        state = self.__dict__.copy()
+        del state["_local"], state["_connections"], state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._parts.scheme == "https":
+            connection_class = http.client.HTTPSConnection
+        else:
+            connection_class = http.client.HTTPConnection
+        connection = connection_class(
+            self._parts.hostname, self._parts.port, timeout=self.timeout
+        )
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _drop(self, connection):
+        connection.close()
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+    def _request(self, query_string):
+        """
+        Send a query, reusing the connection of the thread if there is one.
+
+        Returns
+        -------
+        connection : http.client.HTTPConnection
+        response : http.client.HTTPResponse
+        """
+        path = self._parts.path or "/"
+        if self._parts.query:
+            path = f"{path}?{self._parts.query}"
+        headers = {
+            "Content-Type": "application/sparql-query; charset=utf-8",
+            "Accept": RESULT_FORMATS[self.result_format],
+            "Accept-Encoding": "gzip",
+            **self.headers,
+        }
+        body = query_string.encode("utf-8")
+
+        # the connection is taken from the thread until the response is read
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        reused = connection is not None
+        if connection is None:
+            connection = self._connect()
+        try:
+            connection.request("POST", path, body=body, headers=headers)
+            response = connection.getresponse()
+        except (http.client.HTTPException, OSError) as error:
+            self._drop(connection)
+            # the server may have closed a connection that was idle
+            if not reused or isinstance(error, TimeoutError):
+                raise
+            connection = self._connect()
+            connection.request("POST", path, body=body, headers=headers)
+            response = connection.getresponse()
+
+        if response.status != 200:
+            content = response.read()
+            self._drop(connection)
+            raise HTTPError(
+                self.url,
+                response.status,
+                f"{response.reason}: {content[:500].decode('utf-8', 'replace')}",
+                response.headers,
+                io.BytesIO(content),
+            )
+        return connection, response
+
+    def select(self, query_string):
+        """
+        Run a SELECT query and iterate over the results as they arrive.
+
+        Parameters
+        ----------
+        query_string : str
+            The SPARQL query.
+
+        Returns
+        -------
+        variables : list of str
+            The names of the variables of the results.
+        rows : iterator of tuple
+            The rows of the results, with None for unbound variables. The
+            connection is reused once all the rows are read.
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            If the endpoint does not answer the query.
+        """
+        connection, response = self._request(query_string)
+        stream = response
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            stream = gzip.GzipFile(fileobj=response)
+
+        if self.result_format == "json":
+            data = json.load(stream)
+            variables = data["head"]["vars"]
+            rows = (
+                tuple(
+                    _parse_binding(binding[var]) if var in binding else None
+                    for var in variables
+                )
+                for binding in data["results"]["bindings"]
+            )
+            self._finish(connection, response)
+            return variables, rows
+
+        lines = io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+        variables = [var.strip()[1:] for var in lines.readline().split("\t")]
+        return variables, self._iter_rows(connection, response, lines)
+
+    def _iter_rows(self, connection, response, lines):
+        finished = False
+        try:
+            for line in lines:
+                line = line.rstrip("\r\n")
+                if line == "":
+                    continue
+                yield tuple(parse_term(text) for text in line.split("\t"))
+            finished = True
+        finally:
+            if finished:
+                self._finish(connection, response)
+            else:
+                # the rest of the response is not read, the connection is lost
+                self._drop(connection)
+
+    def _finish(self, connection, response):
+        response.read()
+        if response.will_close:
+            self._drop(connection)
+        else:
+            self._local.connection = connection
+
+    def query(self, query_string):
+        """
+        Run a SELECT query.
+
+        Parameters
+        ----------
+        query_string : str
+            The SPARQL query.
+
+        Returns
+        -------
+        rdflib.query.Result
+            The results, as returned by `rdflib.Graph.query`.
+        """
+        variables, rows = self.select(query_string)
+        result = Result("SELECT")
+        result.vars = [Variable(var) for var in variables]
+        result.bindings = [
+            {var: term for var, term in zip(result.vars, row) if term is not None}
+            for row in rows
+        ]
+        return result
+
+    def close(self):
+        """
+        Close the connections to the endpoint.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
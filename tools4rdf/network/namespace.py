@@ -0,0 +1,93 @@
+"""
+This module provides the namespace mapping of an ontology, which resolves
+URIs to namespace prefixes.
+
+The mapping is a dict of prefix to IRI. Lookups go through a character trie of
+the IRIs, so that resolving a URI takes time proportional to the length of the
+URI, independent of the number of namespaces, and always returns the longest
+matching IRI. The trie is built on the first lookup and rebuilt only after the
+namespaces change.
+"""
+
+# key of the prefix stored at a trie node; trie edges are single characters
+_PREFIX = None
+
+
+class NamespaceDict(dict):
+    """
+    A dict of namespace prefixes to IRIs with a longest-prefix lookup of URIs.
+    """
+
+    _trie = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._trie = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._trie = None
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._trie = None
+        return result
+
+    def clear(self):
+        super().clear()
+        self._trie = None
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._trie = None
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._trie = None
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._trie = None
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._trie = None
+
+    def _build_trie(self):
+        trie = {}
+        for prefix, iri in self.items():
+            node = trie
+            for char in iri:
+                node = node.setdefault(char, {})
+            # if several prefixes share an IRI, the first one is used
+            node.setdefault(_PREFIX, prefix)
+        return trie
+
+    def lookup(self, uri):
+        """
+        Look up the namespace prefix of a URI.
+
+        Parameters
+        ----------
+        uri : str
+            The URI to be resolved.
+
+        Returns
+        -------
+        str or None
+            The prefix of the longest namespace IRI the URI starts with, or None
+            if there is no such namespace.
+        """
+        if self._trie is None:
+            self._trie = self._build_trie()
+        node = self._trie
+        match = node.get(_PREFIX)
+        for char in uri:
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(_PREFIX, match)
+        return match
@@ -12,12 +12,51 @@ Features:
 import networkx as nx
 import graphviz
 import pandas as pd
+import asyncio
+import heapq
 import itertools
+import functools
+import math
+import threading
+import concurrent.futures
+import os
+import re
+import warnings
 
 from rdflib import URIRef, Literal, RDF, OWL, Graph
+from rdflib.plugins.sparql import prepareQuery
 from tools4rdf.network.attrsetter import AttrSetter
 from tools4rdf.network.parser import parse_ontology, OntoParser
 from tools4rdf.network.term import OntoTerm, is_url
+from tools4rdf.network.cache import get_cache_file, load_compiled, save_compiled
+from tools4rdf.network.paths import (
+    PathCache,
+    CSRGraph,
+    ReachabilityIndex,
+    PATH_BACKENDS,
+    graph_fingerprint,
+)
+from tools4rdf.network.endpoint import (
+    ENDPOINT_BACKENDS,
+    SPARQLEndpoint,
+    get_endpoint,
+)
+from tools4rdf.network.pagination import PageCursor, PaginationError, paginate_query
+from tools4rdf.network.results import build_frame, get_data_types
+from tools4rdf.network.resultcache import kg_fingerprint
+from tools4rdf.network.templates import (
+    QueryTemplateCache,
+    term_signature,
+    mask_condition,
+    make_template,
+    fill_template,
+)
+
+# number of rows in the DataFrames of `Network.iter_query`
+QUERY_CHUNKSIZE = 10000
+
+# a triple pattern of a query, alone or as a block of a UNION
+_PATTERN = re.compile(r"^\s*\{?\s*\?(\S+) (\S+) (\S+) \.\s*\}?\s*$")
 
 
 def _replace_name(name):
@@ -31,6 +70,103 @@ def _strip_name(name):
     return name
 
 
+def _read_records(specs):
+    """
+    Read a table of specifications into a list of dicts.
+
+    Parameters
+    ----------
+    specs : iterable, pandas.DataFrame or str
+        The specifications, as an iterable, a DataFrame or the path of a CSV file.
+        Empty cells of a table are left out of the records.
+
+    Returns
+    -------
+    list
+    """
+    if isinstance(specs, (str, os.PathLike)):
+        specs = pd.read_csv(specs)
+    if isinstance(specs, pd.DataFrame):
+        return [
+            {
+                key: value
+                for key, value in record.items()
+                if not (isinstance(value, float) and pd.isna(value))
+            }
+            for record in specs.to_dict("records")
+        ]
+    return list(specs)
+
+
+def _iter_rows(kg, query_string):
+    """
+    Iterate over the rows of the results of a SPARQL query.
+
+    The rows of a `SPARQLEndpoint` are parsed as they arrive, those of an rdflib
+    graph as the query is evaluated.
+
+    Parameters
+    ----------
+    kg : object
+        The knowledge graph object that supports the `query` method.
+    query_string : str
+        The SPARQL query string to be executed on the knowledge graph.
+
+    Returns
+    -------
+    iterator of tuple
+    """
+    if isinstance(kg, SPARQLEndpoint):
+        return kg.select(query_string)[1]
+    res = kg.query(query_string)
+    if res is None:
+        return iter(())
+    return iter(res)
+
+
+def _execute_query(kg, query_string, return_df=True, query_object=None, types=None):
+    """
+    Execute a SPARQL query on a knowledge graph, see `Network._query`.
+
+    This is a module level function, so that it can be run in a process pool.
+
+    Parameters
+    ----------
+    kg : object
+        The knowledge graph object that supports the `query` method.
+    query_string : str
+        The SPARQL query string to be executed on the knowledge graph.
+    return_df : bool, optional
+        If True, the query result is returned as a pandas DataFrame.
+        Defaults to True.
+    query_object : object, optional
+        The query already parsed by the knowledge graph, to be run instead of
+        `query_string`.
+    types : dict, optional
+        If given, a typed DataFrame is returned, see `build_frame`, with the
+        datatypes of the data properties in the query.
+
+    Returns
+    -------
+    pandas.DataFrame or object
+    """
+    if return_df and types is not None and query_object is None:
+        # the rows are converted as they are read
+        return build_frame(
+            _iter_rows(kg, query_string), Network._get_labels(query_string), types
+        )
+    res = kg.query(query_string if query_object is None else query_object)
+    if res is not None:
+        if return_df:
+            labels = Network._get_labels(query_string)
+            if types is not None:
+                return build_frame(res, labels, types)
+            return pd.DataFrame(res, columns=labels)
+        # evaluate the results here, and not when they are read
+        len(res)
+    return res
+
+
 class Network:
     """
     Network
@@ -50,6 +186,25 @@ class Network:
         A dictionary of namespaces defined in the ontology.
     extra_namespaces : dict
         Additional namespaces that are not part of the core ontology.
+    path_cache : PathCache
+        The cache of the shortest paths found in the graph.
+    query_cache : QueryTemplateCache
+        The cache of the queries created by `create_query`, as templates without
+        the values of the filter condition.
+    path_backend : str
+        The engine used to find shortest paths: "networkx" (default) uses
+        `networkx.shortest_simple_paths`, "csr" uses a `CSRGraph` built from the
+        graph, which is faster for larger graphs and `num_paths` > 1. Paths of
+        equal length may be returned in a different order by the two engines, and
+        "csr" reads single paths off one shortest path tree per source.
+    endpoint_backend : str
+        How queries are sent to a SPARQL endpoint given by url: "direct" (default)
+        posts them to the endpoint with a `SPARQLEndpoint`, which keeps the
+        connections alive, "service" wraps them in a SERVICE clause run by rdflib.
+    result_cache : ResultCache or None
+        If set, the DataFrames returned by `query` are cached by query and
+        knowledge graph, and repeated queries are answered from the cache.
+        Default is None (no cache).
 
     Methods
     -------
@@ -78,18 +233,56 @@ class Network:
         Add filter conditions to a SPARQL query based on destination nodes.
     _create_query(source, destinations=None, num_paths=1)
         Generate a complete SPARQL query string based on the source and destination nodes.
-    query(kg, source, destinations=None, return_df=True, num_paths=1)
+    explain(source, destinations=None, num_paths=1, kg=None)
+        Describe the SPARQL queries of a request and their cost, without running them.
+    query(kg, source, destinations=None, return_df=True, num_paths=1, union=False)
         Execute SPARQL queries on a knowledge graph and return the results.
+    iter_query(kg, source, destinations=None, num_paths=1, chunksize=QUERY_CHUNKSIZE)
+        Execute SPARQL queries and iterate over the results in DataFrame chunks.
+    query_many(kg, specs, num_paths=1, executor="thread")
+        Execute a batch of queries, running each distinct SPARQL query once.
+    aquery(kg, source, destinations=None, return_df=True, num_paths=1, timeout=None)
+        Execute SPARQL queries without blocking the asyncio event loop.
+    close()
+        Shut down the thread pool of the asynchronous methods.
+    merge_queries(query_strings, remote_source=None)
+        Merge SPARQL queries into a single query with a UNION of their results.
     _query(kg, query_string, return_df=True)
         Execute a single SPARQL query on a knowledge graph and return the results.
     """
 
+    path_backend = "networkx"
+    endpoint_backend = "direct"
+    result_cache = None
+    # default file of `save_paths` and `load_paths`
+    _path_store = None
+
     def __init__(self, onto):
         self.terms = AttrSetter()
         self.terms._add_attribute(onto.get_attributes())
         self.g = onto.get_networkx_graph()
         self.namespaces = onto.namespaces
         self.extra_namespaces = onto.extra_namespaces
+        self.path_cache = PathCache()
+        self.query_cache = QueryTemplateCache()
+        # incremented on every change of the graph, to invalidate cached paths
+        self._graph_version = 0
+        self._csr = None
+        self._reachability = None
+        # thread pool and lock of the asynchronous methods
+        self._executor = None
+        self._create_lock = threading.Lock()
+
+    def __getstate__(self):
+        # the thread pool and the lock belong to this process
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        del state["_create_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._create_lock = threading.Lock()
 
     def draw(
         self,
@@ -171,18 +364,25 @@ class Network:
 
         Notes
         -----
-        - This method uses the `networkx.shortest_simple_paths` function to
-          compute the paths.
+        - The paths are computed with the `networkx.shortest_simple_paths`
+          function, or a `CSRGraph` if `path_backend` is "csr", in which case a
+          single path is read off the shortest path tree of the source. Among
+          paths of equal length, the tree may pick another one than networkx.
+        - The paths found are stored in `path_cache`, until the graph changes.
         """
-        # this function will be modified to take OntoTerms direcl as input; and use their names.
-        path_iterator = nx.shortest_simple_paths(
-            self.g, source=source.query_name, target=target.query_name
-        )
+        if self.path_backend not in PATH_BACKENDS:
+            raise ValueError(
+                f"path_backend should be one of {PATH_BACKENDS}, not {self.path_backend}"
+            )
+        if num_paths == 1 and self.path_backend == "csr":
+            node_paths = [self._get_tree_path(source.query_name, target.query_name)]
+        else:
+            node_paths = self._get_simple_paths(
+                source.query_name, target.query_name, num_paths
+            )
         # replace the start and end with thier corresponding variable names
         paths = []
-        for count, path in enumerate(path_iterator):
-            if count == num_paths:
-                break
+        for path in node_paths:
             path = list(path)
             # now we need to replace the start and end with their variable names
             path[0] = source.variable_name
@@ -193,6 +393,324 @@ class Network:
             paths.append(path)
         return paths
 
+    def _get_simple_paths(self, source, target, num_paths):
+        """
+        Get the shortest simple paths between two nodes, from `path_cache` if
+        they were found before.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source node.
+        target : str
+            The name of the target node.
+        num_paths : int
+            The maximum number of paths.
+
+        Returns
+        -------
+        list of list
+            The paths, as lists of node names.
+        """
+        key = (self.path_backend, source, target, num_paths)
+        node_paths = self.path_cache.get(key, self._graph_version)
+        if node_paths is None:
+            if self.path_backend == "csr":
+                node_paths = self._get_csr().shortest_simple_paths(
+                    source, target, num_paths=num_paths
+                )
+            else:
+                path_iterator = nx.shortest_simple_paths(
+                    self.g, source=source, target=target
+                )
+                node_paths = [
+                    list(path) for path in itertools.islice(path_iterator, num_paths)
+                ]
+            self.path_cache.put(key, self._graph_version, node_paths)
+        return node_paths
+
+    def _get_tree_path(self, source, target):
+        """
+        Get a shortest path from the shortest path tree of the source, for the
+        "csr" backend only.
+
+        The tree is computed once per source and kept in `path_cache`, so that
+        with the "csr" backend the paths to all destinations of a query, and of
+        later queries from the same source, are read off the same tree.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source node.
+        target : str
+            The name of the target node.
+
+        Returns
+        -------
+        list
+            The names of the nodes along the path.
+        """
+        if target not in self.g:
+            raise nx.NodeNotFound(f"target node {target} not in graph")
+        tree = self._get_tree(source)
+        return self._get_csr().tree_path(tree, source, target)
+
+    def _get_tree(self, source):
+        """
+        Get the shortest path tree of a source with the "csr" backend, from
+        `path_cache` if it was computed before.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source node.
+
+        Returns
+        -------
+        numpy.ndarray
+            The tree, as returned by `CSRGraph.shortest_path_tree`.
+        """
+        key = (self.path_backend, "tree", source)
+        tree = self.path_cache.get(key, self._graph_version)
+        if tree is None:
+            tree = self._get_csr().shortest_path_tree(source)
+            self.path_cache.put(key, self._graph_version, tree)
+        return tree
+
+    def _get_csr(self):
+        """
+        Get the CSR representation of the graph, rebuilt after the graph changed.
+
+        Returns
+        -------
+        CSRGraph
+        """
+        if self._csr is None or self._csr[0] != self._graph_version:
+            self._csr = (self._graph_version, CSRGraph(self.g))
+        return self._csr[1]
+
+    def _get_reachability(self):
+        """
+        Get the reachability index of the graph, rebuilt after the graph changed.
+
+        Returns
+        -------
+        ReachabilityIndex
+        """
+        if self._reachability is None or self._reachability[0] != self._graph_version:
+            self._reachability = (
+                self._graph_version,
+                ReachabilityIndex(self._get_csr()),
+            )
+        return self._reachability[1]
+
+    def is_reachable(self, source, target):
+        """
+        Check if there is a path from a source to a target.
+
+        The answer comes from a reachability index of the graph, without any
+        path search.
+
+        Parameters
+        ----------
+        source : OntoTerm or str
+            The source term, or the name of its node in the graph.
+        target : OntoTerm or str
+            The target term, or the name of its node in the graph.
+
+        Returns
+        -------
+        bool
+            True if the target can be reached from the source.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source or target is not in the graph.
+        """
+        if isinstance(source, OntoTerm):
+            source = source.query_name
+        if isinstance(target, OntoTerm):
+            target = target.query_name
+        return self._get_reachability().is_reachable(source, target)
+
+    def reachable_from(self, source):
+        """
+        Get the names of all nodes that can be reached from a source.
+
+        Parameters
+        ----------
+        source : OntoTerm or str
+            The source term, or the name of its node in the graph.
+
+        Returns
+        -------
+        list of str
+            The names of the reachable nodes, which are the possible destinations
+            of queries from the source.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source is not in the graph.
+        """
+        if isinstance(source, OntoTerm):
+            source = source.query_name
+        return self._get_reachability().reachable_from(source)
+
+    def warmup(self, sources, destinations=None, num_paths=1):
+        """
+        Precompute the shortest paths from a set of sources and store them in
+        `path_cache`.
+
+        Parameters
+        ----------
+        sources : list of OntoTerm or str
+            The source terms, or the names of their nodes in the graph.
+        destinations : list of OntoTerm or str, optional
+            The destination terms, or the names of their nodes. Defaults to all
+            nodes reachable from each source. For a single path with the "csr"
+            `path_backend`, the shortest path tree of each source is stored
+            instead, which covers all destinations.
+        num_paths : int, optional
+            The number of paths to precompute per source and destination
+            (default is 1).
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The cache holds at most `path_cache.maxsize` entries, which should be
+        raised first if more paths are precomputed.
+        """
+        sources = [
+            source.query_name if isinstance(source, OntoTerm) else source
+            for source in sources
+        ]
+        if destinations is not None:
+            destinations = [
+                (
+                    destination.query_name
+                    if isinstance(destination, OntoTerm)
+                    else destination
+                )
+                for destination in destinations
+            ]
+        for source in sources:
+            if num_paths == 1 and self.path_backend == "csr":
+                self._get_tree(source)
+                continue
+            if destinations is None:
+                targets = self.reachable_from(source)
+            else:
+                targets = [
+                    destination
+                    for destination in destinations
+                    if self.is_reachable(source, destination)
+                ]
+            for target in targets:
+                self._get_simple_paths(source, target, num_paths)
+
+    def save_paths(self, filename=None):
+        """
+        Save the paths in `path_cache` to a file, to be loaded with `load_paths`.
+
+        Parameters
+        ----------
+        filename : str, optional
+            The path of the file. Defaults to a file next to the compiled
+            ontology, for an `OntologyNetwork` created with the cache enabled.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If no filename is given and there is no default file.
+        """
+        filename = self._get_path_store(filename)
+        save_compiled(
+            filename,
+            {
+                "fingerprint": graph_fingerprint(self.g),
+                "entries": self.path_cache.items(),
+            },
+        )
+
+    def load_paths(self, filename=None):
+        """
+        Load paths saved with `save_paths` into `path_cache`.
+
+        The paths are only loaded if they were saved for the same graph.
+
+        Parameters
+        ----------
+        filename : str, optional
+            The path of the file. Defaults to a file next to the compiled
+            ontology, for an `OntologyNetwork` created with the cache enabled.
+
+        Returns
+        -------
+        bool
+            True if the paths were loaded, False if the file does not exist,
+            cannot be read or belongs to a different graph.
+
+        Raises
+        ------
+        ValueError
+            If no filename is given and there is no default file.
+        """
+        filename = self._get_path_store(filename)
+        store = load_compiled(filename)
+        if store is None:
+            return False
+        if store["fingerprint"] != graph_fingerprint(self.g):
+            warnings.warn(f"Ignoring paths in {filename}, saved for a different graph")
+            return False
+        self.path_cache.update(store["entries"], self._graph_version)
+        return True
+
+    def _get_path_store(self, filename):
+        if filename is None:
+            filename = self._path_store
+        if filename is None:
+            raise ValueError(
+                "No file given, and the network was not created with the cache enabled"
+            )
+        return filename
+
+    def _check_reachable(self, source, destinations):
+        """
+        Check that all destinations, and their parents, can be reached from the source.
+
+        Parameters
+        ----------
+        source : OntoTerm
+            The source term.
+        destinations : list of OntoTerm
+            The destination terms.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        networkx.NetworkXNoPath
+            If any destination cannot be reached.
+        """
+        for destination in destinations:
+            steps = [source, *destination._parents, destination]
+            for step_source, step_target in zip(steps[:-1], steps[1:]):
+                if not self.is_reachable(step_source, step_target):
+                    raise nx.NetworkXNoPath(
+                        f"{step_target.name} cannot be reached from {step_source.name}"
+                    )
+
     def get_shortest_path(self, source, target, triples=False, num_paths=1):
         """
         Computes the shortest path(s) between a source and target node in a network.
@@ -322,10 +840,15 @@ class Network:
         num_paths=1,
         limit=None,
         remote_source=None,
+        max_queries=None,
     ):
         """
         Creates a query based on the given source and destination nodes.
 
+        Queries are kept in `query_cache` as templates, so that a request for the
+        same terms with different values in the filter condition only fills in
+        the values.
+
         Parameters
         ----------
         source : list or object
@@ -343,6 +866,10 @@ class Network:
             The maximum number of results to return. Default is None (no limit).
         remote_source : str, optional
             If provided, this will be used as the source for remote queries. Default is None.
+        max_queries : int, optional
+            The maximum number of queries to create. With `num_paths` > 1, every
+            combination of paths gives a query, and the combinations with the
+            shortest total path length are used first. Default is None (no maximum).
 
         Raises
         ------
@@ -390,6 +917,76 @@ class Network:
             if s.node_type == "data_property":
                 raise ValueError("Data properties are not allowed as source nodes.")
 
+        key, values = self._get_query_template_key(
+            source,
+            destinations,
+            (return_list, num_paths, limit, remote_source, max_queries),
+        )
+        if key is not None:
+            template = self.query_cache.get(key, self._graph_version)
+            if template is not None:
+                self._refresh_destinations(destinations)
+                return fill_template(template, values)
+
+        classes, destinations = self._resolve_request(
+            source, destinations, num_paths=num_paths
+        )
+
+        # done, now run the query
+        queries = []
+        for s in classes:
+            if max_queries is not None and len(queries) >= max_queries:
+                break
+            qx = self._create_query(
+                s,
+                destinations=destinations,
+                num_paths=num_paths,
+                limit=limit,
+                remote_source=remote_source,
+                max_queries=None if max_queries is None else max_queries - len(queries),
+            )
+            queries.extend(
+                qx,
+            )
+
+        if (len(queries) == 1) and not return_list:
+            queries = queries[0]
+        if key is not None:
+            template = make_template(queries, values)
+            if template is not None:
+                self.query_cache.put(key, self._graph_version, template)
+        return queries
+
+    def _resolve_request(self, source, destinations, num_paths=1):
+        """
+        Resolve the source and destination terms of a request to `create_query`.
+
+        Object properties among the sources are replaced by a common class of
+        their domains, and become destinations of the query.
+
+        Parameters
+        ----------
+        source : list of OntoTerm
+            The source terms, classes or object properties.
+        destinations : list or None
+            The destination terms, lists of terms are stepped destinations.
+        num_paths : int, optional
+            The number of paths to consider in the query. Default is 1.
+
+        Returns
+        -------
+        classes : list of OntoTerm
+            The classes to start a query from.
+        destinations : list of OntoTerm
+            The destinations of the queries.
+
+        Raises
+        ------
+        ValueError
+            If no common classes are found in the domains of the object properties.
+        TypeError
+            If several destinations are used with `num_paths` > 1.
+        """
         # separate sources into classes and object properties
         classes = [s for s in source if s.node_type == "class"]
         object_properties = [s for s in source if s.node_type == "object_property"]
@@ -445,60 +1042,135 @@ class Network:
                     "Please set num_paths=1."
                 )
 
-        # done, now run the query
-        queries = []
-        for s in classes:
-            qx = self._create_query(
-                s,
-                destinations=destinations,
-                num_paths=num_paths,
-                limit=limit,
-                remote_source=remote_source,
-            )
-            queries.extend(
-                qx,
-            )
-
-        if (len(queries) == 1) and not return_list:
-            return queries[0]
-        return queries
+        return classes, destinations
 
-    def _prepare_destinations(self, destinations=None, source=None):
+    def _get_query_template_key(self, source, destinations, options):
         """
-        Prepares and validates the list of destination objects.
+        Get the key of a request to `create_query` in `query_cache`.
 
-        This method ensures that the provided destinations meet specific conditions
-        and adds any necessary parent destinations based on their conditions.
+        The key is made of the structure of the source and destination terms and
+        the options of the request, the values of the filter condition are
+        returned separately.
 
         Parameters
         ----------
-        destinations : list, optional
-            A list of destination objects to be prepared. If None, the method checks
-            if `source._enforce_type` is enabled and raises a ValueError if it is not.
+        source : list
+            The source terms.
+        destinations : list or None
+            The destination terms, as passed to `create_query`.
+        options : tuple
+            The other arguments of `create_query`.
 
         Returns
         -------
-        list
-            A modified list of destination objects, including any necessary parent
-            destinations.
-
-        Raises
-        ------
-        ValueError
-            If `destinations` is None and `source.any` is used without enforcing type.
-        ValueError
-            If more than one destination has an associated condition.
+        key : tuple or None
+            The key, or None if the request cannot be cached.
+        values : list of str or None
+            The values of the filter condition of the queries.
         """
-        # if destinations is None, we need to check if source.any is used
-        if destinations is None and not source._enforce_type:
-            raise ValueError(
-                "If no destinations are provided, source.any cannot be used!."
-            )
+        # object properties as sources change the destinations passed in
+        if any(s.node_type != "class" for s in source):
+            return None, None
+        if destinations is None:
+            return ("query", tuple(map(term_signature, source)), None, options), []
 
-        # check if more than one of them have an associated condition -> if so throw error
-        no_of_conditions = 0
+        signature = []
+        terms = []
         for destination in destinations:
-            if destination._condition is not None:
+            if isinstance(destination, (list, tuple)):
+                signature.append(tuple(map(term_signature, destination)))
+                terms.append(destination[-1])
+            else:
+                signature.append(term_signature(destination))
+                terms.append(destination)
+
+        # the filter is written from the first condition found
+        condition = None
+        for term in terms + [p for term in terms for p in term._condition_parents]:
+            if term._condition is not None:
+                condition = term._condition
+                break
+        values = mask_condition(condition)[1]
+
+        # names in the values would be replaced when writing the filter
+        names = set()
+        for destination in destinations:
+            if not isinstance(destination, (list, tuple)):
+                destination = [destination]
+            for term in destination:
+                for t in [term] + term._parents + term._condition_parents:
+                    names.update((t.query_name, t.variable_name, t._old_variable_name))
+        names.discard(None)
+        if any(name in value for name in names for value in values):
+            return None, None
+
+        key = (
+            "query",
+            tuple(map(term_signature, source)),
+            tuple(signature),
+            options,
+        )
+        return key, values
+
+    @staticmethod
+    def _refresh_destinations(destinations):
+        """
+        Refresh the destination terms, as done after creating a query.
+
+        Parameters
+        ----------
+        destinations : list or None
+            The destination terms, as passed to `create_query`.
+
+        Returns
+        -------
+        None
+        """
+        if destinations is None:
+            return
+        for destination in destinations:
+            if isinstance(destination, (list, tuple)):
+                destination = destination[-1]
+            for parent in destination._condition_parents:
+                parent.refresh()
+            destination.refresh()
+
+    def _prepare_destinations(self, destinations=None, source=None):
+        """
+        Prepares and validates the list of destination objects.
+
+        This method ensures that the provided destinations meet specific conditions
+        and adds any necessary parent destinations based on their conditions.
+
+        Parameters
+        ----------
+        destinations : list, optional
+            A list of destination objects to be prepared. If None, the method checks
+            if `source._enforce_type` is enabled and raises a ValueError if it is not.
+
+        Returns
+        -------
+        list
+            A modified list of destination objects, including any necessary parent
+            destinations.
+
+        Raises
+        ------
+        ValueError
+            If `destinations` is None and `source.any` is used without enforcing type.
+        ValueError
+            If more than one destination has an associated condition.
+        """
+        # if destinations is None, we need to check if source.any is used
+        if destinations is None and not source._enforce_type:
+            raise ValueError(
+                "If no destinations are provided, source.any cannot be used!."
+            )
+
+        # check if more than one of them have an associated condition -> if so throw error
+        no_of_conditions = 0
+        for destination in destinations:
+            if destination._condition is not None:
                 no_of_conditions += 1
         if no_of_conditions > 1:
             raise ValueError("Only one condition is allowed")
@@ -580,39 +1252,117 @@ class Network:
         namespaces : list of str
             A list of namespaces extracted from the triples.
         """
+        queries = []
+        namespaces = []
+        for query, namespace in self._iter_triples(
+            source, destinations, num_paths=num_paths
+        ):
+            queries.append(query)
+            namespaces.extend(namespace)
+        return queries, namespaces
+
+    def _iter_triples(self, source, destinations, num_paths=1):
+        """
+        Generate the triple patterns of the queries between a source and multiple destinations.
+
+        The paths to all destinations are found right away. Every query combines
+        one path per destination, and the combinations are generated one at a
+        time, in order of increasing total path length, so that only the
+        queries actually used are built.
+
+        Parameters
+        ----------
+        source : str
+            The starting node for the paths.
+        destinations : list of str
+            A list of destination nodes for which paths need to be computed.
+        num_paths : int, optional
+            The number of shortest paths to compute for each source-destination pair (default is 1).
+
+        Returns
+        -------
+        generator
+            Yields the triple patterns of a query as a list of str, and the
+            namespaces used in them as a list of str.
+        """
         # for each source and destinations, we need to find num_paths paths
         # then these have to be combined; and each set to be made into individual queries
-        complete_triples = []
-        for count, destination in enumerate(destinations):
-            triplets = self.get_shortest_path(
+        groups = [
+            self.get_shortest_path(
                 source, destination, triples=True, num_paths=num_paths
             )
-            complete_triples.append(triplets)
-        # flattened = [[item[0] for item in group] for group in complete_triples]
-        # Get Cartesian product (all combinations)
-        prepared = [[triple for triple in group] for group in complete_triples]
-        # Get all combinations
-        combinations = list(itertools.product(*prepared))
-        namespaces = []
-        queries = []
+            for destination in destinations
+        ]
+        return self._combine_paths(groups)
+
+    @staticmethod
+    def _combine_paths(groups):
+        """
+        Combine one path of every group into queries, shortest combinations first.
 
-        for count, combination in enumerate(combinations):
+        Parameters
+        ----------
+        groups : list of list
+            For every destination, the paths to it as lists of triples, sorted
+            by length.
+
+        Yields
+        ------
+        query : list of str
+            The triple patterns of a query, without duplicates.
+        namespaces : list of str
+            The namespaces used in the triple patterns.
+        """
+        if any(len(group) == 0 for group in groups):
+            return
+        lengths = [[len(triples) for triples in group] for group in groups]
+        for combination in Network._rank_combinations(lengths):
             query = []
-            namespace = []
-            for triples in combination:
-                for triple in triples:
-                    namespace.extend([x.split(":")[0] for x in triple if ":" in x])
+            namespaces = []
+            seen = set()
+            for group, position in zip(groups, combination):
+                for triple in group[position]:
+                    namespaces.extend([x.split(":")[0] for x in triple if ":" in x])
                     line_text = "    ?%s %s ?%s ." % (
                         triple[0].replace(":", "_"),
                         triple[1],
                         triple[2].replace(":", "_"),
                     )
-                    if line_text not in query:
+                    if line_text not in seen:
+                        seen.add(line_text)
                         query.append(line_text)
-            queries.append(query)
-            namespaces.extend(namespace)
+            yield query, namespaces
 
-        return queries, namespaces
+    @staticmethod
+    def _rank_combinations(lengths):
+        """
+        Enumerate the combinations of one path per group, shortest first.
+
+        Parameters
+        ----------
+        lengths : list of list of int
+            For every group, the lengths of its paths, sorted.
+
+        Yields
+        ------
+        tuple of int
+            The position of the path taken from every group.
+        """
+        # best first enumeration of the cartesian product; every combination is
+        # pushed once, by increasing the last position that was increased to
+        # reach it, and never costs less than the combination it came from
+        heap = [(sum(group[0] for group in lengths), (0,) * len(lengths), 0)]
+        while heap:
+            _, combination, last = heapq.heappop(heap)
+            yield combination
+            for count in range(last, len(lengths)):
+                if combination[count] + 1 < len(lengths[count]):
+                    successor = list(combination)
+                    successor[count] += 1
+                    cost = sum(
+                        group[position] for group, position in zip(lengths, successor)
+                    )
+                    heapq.heappush(heap, (cost, tuple(successor), count))
 
     def _add_types_for_source(self, source):
         """
@@ -830,6 +1580,7 @@ class Network:
         num_paths=1,
         limit=None,
         remote_source=None,
+        max_queries=None,
     ):
         """
         Creates SPARQL queries based on the given source, destinations, and number of paths.
@@ -851,6 +1602,9 @@ class Network:
             The maximum number of results to return. Default is None (no limit).
         remote_source : str, optional
             If provided, this will be used as the source for remote queries. Default is None.
+        max_queries : int, optional
+            The maximum number of queries to create, shortest paths first. Default is
+            None (all combinations of paths).
 
         Returns
         -------
@@ -867,6 +1621,8 @@ class Network:
         destinations = self._prepare_destinations(
             destinations=destinations, source=source
         )
+        # fail before any path search if a destination cannot be reached
+        self._check_reachable(source, destinations)
         query_header = self._create_query_prefix(
             source, destinations, remote_source=remote_source
         )
@@ -876,10 +1632,8 @@ class Network:
         namespaces_used.append(source.name.split(":")[0])
         namespaces_used.append("rdf")
 
-        # get a list of queries
-        queries, namespaces = self._get_triples(
-            source, destinations, num_paths=num_paths
-        )
+        # the paths are found here, the queries are only combined when used
+        triples = self._iter_triples(source, destinations, num_paths=num_paths)
 
         query_footer_source_types, namespaces_source = self._add_types_for_source(
             source
@@ -891,7 +1645,7 @@ class Network:
         query_filter = self._add_filters(destinations, remote_source=remote_source)
 
         created_queries = []
-        for query in queries:
+        for query, namespaces in itertools.islice(triples, max_queries):
             query_header_new = (
                 self._insert_namespaces(
                     set(
@@ -914,8 +1668,238 @@ class Network:
             created_queries.append("\n".join(query))
         return created_queries
 
+    def explain(
+        self,
+        source,
+        destinations=None,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        kg=None,
+    ):
+        """
+        Describe the queries that `query` would run, without running them.
+
+        Parameters
+        ----------
+        source : list or OntoTerm
+            The source nodes, see `create_query`.
+        destinations : list, OntoTerm or None, optional
+            The destination nodes, see `create_query`.
+        num_paths : int, optional
+            The number of paths to consider for each destination. Default is 1.
+        limit : int, optional
+            The maximum number of results of each query. Default is None.
+        max_queries : int, optional
+            The maximum number of queries, see `create_query`. Default is None.
+        kg : rdflib.Graph or dict, optional
+            If given, the number of triples matching each triple pattern is
+            estimated, by counting them in the graph, or from a dict with the
+            number of triples of each predicate URI and, for `rdf:type`
+            patterns, of each class URI.
+
+        Returns
+        -------
+        dict
+            The plan, with the keys:
+
+            - sources : list of dict
+                For every class the queries start from, its `source` and
+                `variable`, the `paths` found to each destination variable as
+                lists of triples, shortest first, the number of `combinations`
+                of these paths, the `unions` of subclasses in the type
+                constraints with their `variable`, `class` and `size`, and its
+                `queries`. For every query, the position of the path chosen
+                for each destination as `paths`, the `text`, its `length`, and
+                its triple `patterns` with their estimated `cardinality`, which
+                is None without `kg`.
+            - namespaces : list of str
+                The prefixes declared by the queries.
+            - queries : list of str
+                The queries, as returned by `create_query`.
+            - length : int
+                The total length of the queries.
+
+        Raises
+        ------
+        ValueError
+            If any source node is of type "data_property".
+
+        Notes
+        -----
+        Like `create_query`, the conditions of the destination terms are
+        consumed by the call.
+        """
+        if not isinstance(source, list):
+            source = [source]
+        if destinations is not None and not isinstance(destinations, list):
+            destinations = [destinations]
+        for s in source:
+            if s.node_type == "data_property":
+                raise ValueError("Data properties are not allowed as source nodes.")
+        if kg is not None and not (isinstance(kg, dict) or hasattr(kg, "triples")):
+            raise ValueError(
+                "Cardinalities can only be estimated from an rdflib graph or a dict."
+            )
+
+        classes, destinations = self._resolve_request(
+            source, destinations, num_paths=num_paths
+        )
+        counts = {}
+        plans = []
+        queries = []
+        for s in classes:
+            if max_queries is not None and len(queries) >= max_queries:
+                break
+            remaining = None if max_queries is None else max_queries - len(queries)
+            destinations = self._prepare_destinations(
+                destinations=destinations, source=s
+            )
+            self._check_reachable(s, destinations)
+            names = [destination.variable_name for destination in destinations]
+            groups = [
+                self.get_shortest_path(
+                    s, destination, triples=True, num_paths=num_paths
+                )
+                for destination in destinations
+            ]
+            if any(len(group) == 0 for group in groups):
+                chosen = []
+            else:
+                chosen = itertools.islice(
+                    self._rank_combinations(
+                        [[len(triples) for triples in group] for group in groups]
+                    ),
+                    remaining,
+                )
+            unions = [
+                {
+                    "variable": _strip_name(term.variable_name),
+                    "class": term.query_name,
+                    "size": len(term.subclasses) + 1,
+                }
+                for term in [s] + destinations
+                if term._add_subclass
+                and term.node_type == "class"
+                and len(term.subclasses) > 0
+            ]
+            texts = self._create_query(
+                s,
+                destinations=destinations,
+                num_paths=num_paths,
+                limit=limit,
+                max_queries=remaining,
+            )
+            plans.append(
+                {
+                    "source": s.query_name,
+                    "variable": s.variable_name,
+                    "paths": {
+                        name: [[tuple(triple) for triple in path] for path in group]
+                        for name, group in zip(names, groups)
+                    },
+                    "combinations": math.prod(len(group) for group in groups),
+                    "unions": unions,
+                    "queries": [
+                        {
+                            "paths": dict(zip(names, combination)),
+                            "text": text,
+                            "length": len(text),
+                            "patterns": self._explain_patterns(text, kg, counts),
+                        }
+                        for combination, text in zip(chosen, texts)
+                    ],
+                }
+            )
+            queries.extend(texts)
+
+        namespaces = set()
+        for text in queries:
+            for line in text.split("\n"):
+                if line.startswith("PREFIX "):
+                    namespaces.add(line.split()[1].rstrip(":"))
+        return {
+            "sources": plans,
+            "namespaces": sorted(namespaces),
+            "queries": queries,
+            "length": sum(len(text) for text in queries),
+        }
+
+    def _explain_patterns(self, query_string, kg=None, counts=None):
+        """
+        Get the triple patterns of a query and their estimated cardinality.
+
+        Parameters
+        ----------
+        query_string : str
+            The query.
+        kg : rdflib.Graph or dict, optional
+            The graph or the statistics to estimate from, see `explain`.
+        counts : dict, optional
+            The cardinalities already estimated, which are reused and updated.
+
+        Returns
+        -------
+        list of dict
+            The `pattern`, and its `cardinality`, or None if `kg` is not given.
+        """
+        if counts is None:
+            counts = {}
+        ns = self.namespaces | self.extra_namespaces
+
+        def to_uri(name):
+            prefix, _, local = name.partition(":")
+            if prefix in ns and local != "":
+                return ns[prefix] + local
+            return name
+
+        patterns = []
+        for line in query_string.split("\n"):
+            match = _PATTERN.match(line)
+            if match is None:
+                continue
+            predicate = to_uri(match.group(2))
+            obj = None if match.group(3).startswith("?") else to_uri(match.group(3))
+            cardinality = None
+            if kg is not None:
+                key = (predicate, obj)
+                if key not in counts:
+                    if isinstance(kg, dict):
+                        counts[key] = kg.get(obj, kg.get(predicate))
+                    else:
+                        counts[key] = sum(
+                            1
+                            for _ in kg.triples(
+                                (
+                                    None,
+                                    URIRef(predicate),
+                                    None if obj is None else URIRef(obj),
+                                )
+                            )
+                        )
+                cardinality = counts[key]
+            patterns.append(
+                {"pattern": "?%s %s %s" % match.groups(), "cardinality": cardinality}
+            )
+        return patterns
+
     def query(
-        self, kg, source, destinations=None, return_df=True, num_paths=1, limit=None
+        self,
+        kg,
+        source,
+        destinations=None,
+        return_df=True,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+        executor=None,
+        max_workers=None,
+        chunksize=None,
+        typed=False,
+        page_size=None,
+        cursor=None,
+        kg_version=None,
     ):
         """
         Executes queries on a knowledge graph (KG) to retrieve data from a SPARQL query.
@@ -924,7 +1908,7 @@ class Network:
         ----------
         kg : object, or SPARQL endpoint
             The knowledge graph object to query.
-            Or a remote SPARQL url for endpoint
+            Or a remote SPARQL url for endpoint, queried as set by `endpoint_backend`.
         source : OntoTerm
             The source node from which paths are to be queried.
         destinations : list of OntoTerm, optional
@@ -935,6 +1919,38 @@ class Network:
             The number of paths to retrieve for each query.
         limit : int, optional
             The maximum number of results to return. If None, no limit is applied.
+        max_queries : int, optional
+            The maximum number of queries to run, see `create_query`. If None, no maximum is applied.
+        union : bool, default=False
+            If True, the queries are merged into a single query with a UNION of
+            their results, see `merge_queries`, so that the KG is queried only once.
+        executor : str or concurrent.futures.Executor, optional
+            If "thread" or "process", the queries are run concurrently in a thread
+            or process pool, which is useful for remote endpoints. An existing
+            executor can be given as well. The results are kept in the order of
+            the queries. If None, the queries are run one after another.
+        max_workers : int, optional
+            The number of workers of a pool created for `executor`. If None, the
+            default of `concurrent.futures` is used.
+        chunksize : int, optional
+            If given, an iterator of DataFrames with at most `chunksize` rows is
+            returned instead, see `iter_query`; `return_df` and `executor` are
+            not used then.
+        typed : bool, default=False
+            If True, the DataFrame has typed columns, see `build_frame`: numbers,
+            booleans and dates of data properties as NumPy dtypes, following the
+            range of the data properties, and URIs as categoricals.
+        page_size : int, optional
+            If given, the results of each query are fetched in pages of this
+            size, see `iter_query`, and a DataFrame is returned. If a page fails,
+            the `PaginationError` raised holds the results fetched so far in
+            `partial` and the `cursor` to resume from with the same arguments.
+        cursor : PageCursor, optional
+            The page to start from, with `page_size`.
+        kg_version : hashable, optional
+            The version of the knowledge graph for `result_cache`, see
+            `kg_fingerprint`. It is needed to cache the results of knowledge
+            graphs that are neither rdflib graphs nor SPARQL endpoints.
 
         Returns
         -------
@@ -943,83 +1959,1021 @@ class Network:
             If `return_df` is False, returns a list of query results.
             Returns None if no results are found.
         """
-
-        remote_source = None
-        if isinstance(kg, str):
-            if is_url(kg):
-                remote_source = kg
-                kg = Graph()
-
-        query_strings = self.create_query(
+        if chunksize is not None:
+            return self.iter_query(
+                kg,
+                source,
+                destinations=destinations,
+                num_paths=num_paths,
+                limit=limit,
+                max_queries=max_queries,
+                union=union,
+                chunksize=chunksize,
+                typed=typed,
+                page_size=page_size,
+                cursor=cursor,
+            )
+        if page_size is not None:
+            frames = []
+            try:
+                for frame in self.iter_query(
+                    kg,
+                    source,
+                    destinations=destinations,
+                    num_paths=num_paths,
+                    limit=limit,
+                    max_queries=max_queries,
+                    union=union,
+                    chunksize=page_size,
+                    typed=typed,
+                    page_size=page_size,
+                    cursor=cursor,
+                ):
+                    frames.append(frame)
+            except PaginationError as error:
+                error.partial = self._collect_results(frames)
+                raise
+            return self._collect_results(frames)
+
+        types = self._get_data_types(source, destinations) if typed else None
+        kg, query_strings = self._get_query_strings(
+            kg,
             source,
             destinations=destinations,
-            return_list=True,
             num_paths=num_paths,
             limit=limit,
-            remote_source=remote_source,
+            max_queries=max_queries,
+            union=union,
         )
-        res = []
-        for query_string in query_strings:
-            r = self._query(kg, query_string, return_df=return_df)
-            if r is not None:
-                res.append(r)
-        if len(res) == 0:
-            return None
-        if return_df:
-            res = pd.concat(res)
-        return res
+        results = self._run_cached_queries(
+            kg,
+            query_strings,
+            return_df=return_df,
+            executor=executor,
+            max_workers=max_workers,
+            types=types,
+            kg_version=kg_version,
+        )
+        return self._collect_results(results, return_df=return_df)
 
-    def _query(self, kg, query_string, return_df=True):
+    def query_many(
+        self,
+        kg,
+        specs,
+        num_paths=1,
+        executor="thread",
+        max_workers=None,
+        typed=False,
+        kg_version=None,
+    ):
         """
-        Executes a SPARQL query on the given knowledge graph (KG) and optionally
-        returns the result as a pandas DataFrame.
+        Executes many queries on a knowledge graph together.
+
+        The paths from the source classes to the destinations of all the
+        requests are found first, once per pair, the queries of all the
+        requests are then created, and every distinct query is run once,
+        concurrently with the others.
+
+        Parameters
+        ----------
+        kg : object, or SPARQL endpoint
+            The knowledge graph object to query.
+            Or a remote SPARQL url for endpoint, queried as set by `endpoint_backend`.
+        specs : list or dict
+            The requests, as tuples of (source, destinations, limit), where the
+            destinations and the limit can be left out, or as dicts with these
+            keys. If a dict of requests is given, a dict of results with the same
+            keys is returned. Terms with conditions must not be shared between
+            requests, since their conditions are cleared once a query is created.
+        num_paths : int, default=1
+            The number of paths to retrieve for each query.
+        executor : str or concurrent.futures.Executor, optional
+            The executor to run the queries in, see `query`. Default is "thread".
+        max_workers : int, optional
+            The number of workers of a pool created for `executor`.
+        typed : bool, default=False
+            If True, the DataFrames have typed columns, see `query`.
+        kg_version : hashable, optional
+            The version of the knowledge graph for `result_cache`, see `query`.
+
+        Returns
+        -------
+        list or dict
+            The DataFrame of each request, or None if it has no results.
+        """
+        named = isinstance(specs, dict)
+        items = list(specs.items()) if named else list(enumerate(specs))
+        requests = []
+        for key, spec in items:
+            if isinstance(spec, dict):
+                spec = (spec["source"], spec.get("destinations"), spec.get("limit"))
+            source, destinations, limit = (tuple(spec) + (None, None))[:3]
+            requests.append((key, source, destinations, limit))
+
+        # the paths between the classes and the plain destinations of each
+        # request are found first; object properties as sources and stepped
+        # destinations are resolved by `create_query`, which finds their paths
+        targets = {}
+        for _, source, dests, _ in requests:
+            dests = [] if dests is None else dests
+            for s in source if isinstance(source, list) else [source]:
+                if s.node_type != "class":
+                    continue
+                found = targets.setdefault(s.query_name, {})
+                for dest in dests if isinstance(dests, list) else [dests]:
+                    if isinstance(dest, OntoTerm):
+                        found[dest.query_name] = None
+        for source, found in targets.items():
+            self.warmup([source], list(found), num_paths=num_paths)
+
+        target = kg
+        types = {}
+        query_lists = []
+        for _, source, dests, limit in requests:
+            if typed:
+                types.update(self._get_data_types(source, dests))
+            target, query_strings = self._get_query_strings(
+                kg,
+                source,
+                destinations=dests,
+                num_paths=num_paths,
+                limit=limit,
+            )
+            query_lists.append(query_strings)
+
+        # the same query may be part of several requests
+        unique = list(dict.fromkeys(itertools.chain.from_iterable(query_lists)))
+        results = dict(
+            zip(
+                unique,
+                self._run_cached_queries(
+                    target,
+                    unique,
+                    executor=executor,
+                    max_workers=max_workers,
+                    types=types if typed else None,
+                    kg_version=kg_version,
+                ),
+            )
+        )
+        frames = [
+            self._collect_results([results[query] for query in query_strings])
+            for query_strings in query_lists
+        ]
+        if named:
+            return {request[0]: frame for request, frame in zip(requests, frames)}
+        return frames
+
+    def _run_cached_queries(
+        self,
+        kg,
+        query_strings,
+        return_df=True,
+        executor=None,
+        max_workers=None,
+        types=None,
+        kg_version=None,
+    ):
+        """
+        Executes SPARQL queries, taking the results from `result_cache` if it is set.
 
         Parameters
         ----------
         kg : object
             The knowledge graph object that supports the `query` method.
-        query_string : str
-            The SPARQL query string to be executed on the knowledge graph.
+        query_strings : list of str
+            The SPARQL queries.
         return_df : bool, optional
-            If True, the query result is returned as a pandas DataFrame.
-            Defaults to True.
+            If True, the query results are returned as pandas DataFrames. Only
+            DataFrames are cached.
+        executor : str or concurrent.futures.Executor, optional
+            The executor, see `query`.
+        max_workers : int, optional
+            The number of workers of a pool created for `executor`.
+        types : dict, optional
+            If given, typed DataFrames are returned, see `_execute_query`.
+        kg_version : hashable, optional
+            The version of the knowledge graph, see `kg_fingerprint`.
 
         Returns
         -------
-        pandas.DataFrame or object
-            If `return_df` is True and the query result is not None, returns a
-            pandas DataFrame with the query results. The column names are derived
-            from the SELECT clause of the query. If `return_df` is False or the
-            query result is None, returns the raw query result.
-
-        Notes
-        -----
-        - The method assumes that the query string contains a SELECT DISTINCT
-          clause if `return_df` is True.
-        - The column names in the DataFrame are extracted from the SELECT clause
-          by removing the leading '?' from variable names.
-        """
-        res = kg.query(query_string)
-        if res is not None:
-            if return_df:
-                for line in query_string.split("\n"):
-                    if "SELECT DISTINCT" in line:
-                        break
-                labels = [x[1:] for x in line.split()[2:]]
-                return pd.DataFrame(res, columns=labels)
+        list
+            The results, in the order of the queries.
+        """
+        fingerprint = None
+        if self.result_cache is not None and return_df:
+            fingerprint = kg_fingerprint(kg, version=kg_version)
+        if fingerprint is None:
+            return self._run_queries(
+                kg,
+                query_strings,
+                return_df=return_df,
+                executor=executor,
+                max_workers=max_workers,
+                types=types,
+            )
 
-        return res
+        typed = types is not None
+        keys = [(query_string, fingerprint, typed) for query_string in query_strings]
+        results = [self.result_cache.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        new_results = self._run_queries(
+            kg,
+            [query_strings[index] for index in missing],
+            return_df=return_df,
+            executor=executor,
+            max_workers=max_workers,
+            types=types,
+        )
+        for index, result in zip(missing, new_results):
+            results[index] = result
+            if result is not None:
+                self.result_cache.put(keys[index], result)
+        return results
 
+    def _run_queries(
+        self,
+        kg,
+        query_strings,
+        return_df=True,
+        executor=None,
+        max_workers=None,
+        types=None,
+    ):
+        """
+        Executes SPARQL queries, one after another or in an executor.
 
-class OntologyNetworkBase(Network):
-    """
-    Network representation of Onto
-    """
+        Parameters
+        ----------
+        kg : object
+            The knowledge graph object that supports the `query` method.
+        query_strings : list of str
+            The SPARQL queries.
+        return_df : bool, optional
+            If True, the query results are returned as pandas DataFrames.
+        executor : str or concurrent.futures.Executor, optional
+            The executor, see `query`. If None, the queries are run one after another.
+        max_workers : int, optional
+            The number of workers of a pool created for `executor`.
+        types : dict, optional
+            If given, typed DataFrames are returned, see `_execute_query`.
 
-    def __init__(self, onto):
-        self.onto = onto
-        self._terms = None
+        Returns
+        -------
+        list
+            The results, in the order of the queries.
+        """
+        if executor is None or len(query_strings) < 2:
+            return [
+                self._query(kg, query_string, return_df=return_df, types=types)
+                for query_string in query_strings
+            ]
+        return self._map_queries(
+            kg,
+            query_strings,
+            return_df=return_df,
+            executor=executor,
+            max_workers=max_workers,
+            types=types,
+        )
+
+    def iter_query(
+        self,
+        kg,
+        source,
+        destinations=None,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+        chunksize=QUERY_CHUNKSIZE,
+        typed=False,
+        page_size=None,
+        cursor=None,
+    ):
+        """
+        Executes queries on a knowledge graph and iterates over the results in chunks.
+
+        The results are read as they are returned by the knowledge graph, and
+        only one chunk is turned into a DataFrame at a time, so that large
+        results do not have to be held in memory as a whole.
+
+        Parameters
+        ----------
+        kg : object, or SPARQL endpoint
+            The knowledge graph object to query.
+            Or a remote SPARQL url for endpoint, queried as set by `endpoint_backend`.
+        source : OntoTerm
+            The source node from which paths are to be queried.
+        destinations : list of OntoTerm, optional
+            A list of destination nodes to which paths are to be queried.
+        num_paths : int, default=1
+            The number of paths to retrieve for each query.
+        limit : int, optional
+            The maximum number of results of each query.
+        max_queries : int, optional
+            The maximum number of queries to run, see `create_query`.
+        union : bool, default=False
+            If True, the queries are merged into a single query, see `merge_queries`.
+        chunksize : int, optional
+            The maximum number of rows of a chunk. Default is `QUERY_CHUNKSIZE`.
+        typed : bool, default=False
+            If True, the DataFrames have typed columns, see `query`.
+        page_size : int, optional
+            If given, the results of each query are fetched in pages of this
+            size, in the order of the selected variables, see `paginate_query`.
+            `limit` then caps the results of each query over all pages.
+        cursor : PageCursor, optional
+            The page to start from, taken from the `PaginationError` of a failed
+            run. Default is None (the first page of the first query).
+
+        Returns
+        -------
+        generator of pandas.DataFrame
+            The results, with the columns of the SELECT clause of the query. A
+            chunk holds the results of one query only. The queries are only
+            created and run as the chunks are read.
+
+        Raises
+        ------
+        ValueError
+            If `chunksize` or `page_size` is not a positive integer, when called.
+        PaginationError
+            If a page cannot be fetched, with the cursor of the page, while the
+            chunks are read.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize should be a positive integer, not {chunksize}")
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"page_size should be a positive integer, not {page_size}")
+        return self._iter_query(
+            kg,
+            source,
+            destinations=destinations,
+            num_paths=num_paths,
+            limit=limit,
+            max_queries=max_queries,
+            union=union,
+            chunksize=chunksize,
+            typed=typed,
+            page_size=page_size,
+            cursor=cursor,
+        )
+
+    def _iter_query(
+        self,
+        kg,
+        source,
+        destinations=None,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+        chunksize=QUERY_CHUNKSIZE,
+        typed=False,
+        page_size=None,
+        cursor=None,
+    ):
+        """Iterates over the results of `iter_query`, with checked arguments."""
+        types = self._get_data_types(source, destinations) if typed else None
+        kg, query_strings = self._get_query_strings(
+            kg,
+            source,
+            destinations=destinations,
+            num_paths=num_paths,
+            limit=limit if page_size is None else None,
+            max_queries=max_queries,
+            union=union,
+        )
+        if cursor is None:
+            cursor = PageCursor(0, 0)
+        for index, query_string in enumerate(query_strings):
+            if index < cursor.query:
+                continue
+            labels = self._get_labels(query_string)
+            if page_size is None:
+                rows = _iter_rows(kg, query_string)
+            else:
+                offset = cursor.offset if index == cursor.query else 0
+                rows = self._iter_pages(
+                    kg, query_string, labels, page_size, limit, index, offset
+                )
+            while True:
+                chunk = list(itertools.islice(rows, chunksize))
+                if len(chunk) == 0:
+                    break
+                if types is not None:
+                    yield build_frame(chunk, labels, types)
+                else:
+                    yield pd.DataFrame(chunk, columns=labels)
+
+    @staticmethod
+    def _iter_pages(kg, query_string, labels, page_size, limit, index, offset):
+        """
+        Iterate over the rows of a query, fetched page by page.
+
+        Parameters
+        ----------
+        kg : object
+            The knowledge graph object that supports the `query` method.
+        query_string : str
+            The SPARQL query, without a LIMIT clause.
+        labels : list of str
+            The variables selected by the query.
+        page_size : int
+            The number of results of a page.
+        limit : int or None
+            The maximum number of results of the query.
+        index : int
+            The index of the query, for the cursor of a failed page.
+        offset : int
+            The number of results before the first page.
+
+        Yields
+        ------
+        tuple
+            The rows of the results.
+
+        Raises
+        ------
+        PaginationError
+            If a page cannot be fetched.
+        """
+        while True:
+            size = page_size if limit is None else min(page_size, limit - offset)
+            if size <= 0:
+                return
+            page = paginate_query(query_string, labels, size, offset=offset)
+            try:
+                # a page is read completely before its rows are used
+                rows = list(_iter_rows(kg, page))
+            except Exception as error:
+                raise PaginationError(
+                    f"Page at offset {offset} of query {index} failed: {error}",
+                    PageCursor(index, offset),
+                ) from error
+            yield from rows
+            offset += len(rows)
+            if len(rows) < size:
+                return
+
+    async def acreate_query(self, source, destinations=None, **kwargs):
+        """
+        Creates a query without blocking the event loop, see `create_query`.
+
+        The query is created in the thread pool of `aquery`. Queries are created
+        one at a time, since the terms are modified while a query is created.
+
+        Parameters
+        ----------
+        source : list or object
+            The source nodes for the query.
+        destinations : list, object, or None, optional
+            The destination nodes for the query. Default is None.
+        **kwargs
+            The other arguments of `create_query`.
+
+        Returns
+        -------
+        list or object
+            The queries, as returned by `create_query`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(
+                self._run_locked,
+                self.create_query,
+                source,
+                destinations=destinations,
+                **kwargs,
+            ),
+        )
+
+    async def aquery(
+        self,
+        kg,
+        source,
+        destinations=None,
+        return_df=True,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+        executor=None,
+        timeout=None,
+    ):
+        """
+        Executes queries on a knowledge graph without blocking the event loop,
+        see `query`.
+
+        The queries are created and run in a thread pool, which is shared by all
+        calls on the network, and the queries of one call are run concurrently.
+        Several calls can be awaited together with `asyncio.gather`. This is not
+        asynchronous I/O: every running query blocks a thread of the pool until
+        its results are read. The pool is shut down by `close`.
+
+        Parameters
+        ----------
+        kg : object, or SPARQL endpoint
+            The knowledge graph object to query.
+            Or a remote SPARQL url for endpoint
+        source : OntoTerm
+            The source node from which paths are to be queried.
+        destinations : list of OntoTerm, optional
+            A list of destination nodes to which paths are to be queried.
+        return_df : bool, default=True
+            If True, the results will be returned as a concatenated pandas DataFrame.
+        num_paths : int, default=1
+            The number of paths to retrieve for each query.
+        limit : int, optional
+            The maximum number of results to return.
+        max_queries : int, optional
+            The maximum number of queries to run, see `create_query`.
+        union : bool, default=False
+            If True, the queries are merged into a single query, see `merge_queries`.
+        executor : concurrent.futures.Executor, optional
+            The executor to run the queries in. If None, the shared thread pool
+            of the network is used.
+        timeout : float, optional
+            The time in seconds after which `asyncio.TimeoutError` is raised. If
+            None, there is no timeout.
+
+        Returns
+        -------
+        pandas.DataFrame or list
+            The results, as returned by `query`.
+
+        Notes
+        -----
+        On a timeout or cancellation, queries that have not started are not run.
+        Queries that are already running in a thread cannot be interrupted; their
+        results are discarded.
+        """
+        return await asyncio.wait_for(
+            self._aquery(
+                kg,
+                source,
+                destinations=destinations,
+                return_df=return_df,
+                num_paths=num_paths,
+                limit=limit,
+                max_queries=max_queries,
+                union=union,
+                executor=executor,
+            ),
+            timeout,
+        )
+
+    async def _aquery(
+        self,
+        kg,
+        source,
+        destinations=None,
+        return_df=True,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+        executor=None,
+    ):
+        """Executes the queries of `aquery`, without the timeout."""
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = self._get_executor()
+        kg, query_strings, query_objects = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self._run_locked,
+                self._prepare_queries,
+                kg,
+                source,
+                destinations=destinations,
+                num_paths=num_paths,
+                limit=limit,
+                max_queries=max_queries,
+                union=union,
+            ),
+        )
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    _execute_query,
+                    kg,
+                    query_string,
+                    return_df,
+                    query_object,
+                )
+                for query_string, query_object in zip(query_strings, query_objects)
+            ]
+        )
+        return self._collect_results(results, return_df=return_df)
+
+    def close(self):
+        """
+        Shut down the thread pool of the asynchronous methods.
+
+        The network can still be used afterwards; a new thread pool is created
+        when needed. The network is also closed on leaving a `with` block.
+
+        Returns
+        -------
+        None
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _get_executor(self):
+        """
+        Get the thread pool shared by the asynchronous methods.
+
+        Returns
+        -------
+        concurrent.futures.ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="tools4rdf"
+            )
+        return self._executor
+
+    def _run_locked(self, func, *args, **kwargs):
+        """Call a function while no query is created in another thread."""
+        with self._create_lock:
+            return func(*args, **kwargs)
+
+    def _prepare_queries(self, kg, source, **kwargs):
+        """Create the queries of `aquery` and parse them for the thread pool."""
+        kg, query_strings = self._get_query_strings(kg, source, **kwargs)
+        return kg, query_strings, self._parse_queries(kg, query_strings)
+
+    def _get_query_strings(
+        self,
+        kg,
+        source,
+        destinations=None,
+        num_paths=1,
+        limit=None,
+        max_queries=None,
+        union=False,
+    ):
+        """
+        Creates the queries to be run by `query` on a knowledge graph.
+
+        Parameters
+        ----------
+        kg : object, or SPARQL endpoint
+            The knowledge graph object to query, or a remote SPARQL url.
+        source : OntoTerm
+            The source node from which paths are to be queried.
+        destinations : list of OntoTerm, optional
+            A list of destination nodes to which paths are to be queried.
+        num_paths : int, default=1
+            The number of paths to retrieve for each query.
+        limit : int, optional
+            The maximum number of results to return.
+        max_queries : int, optional
+            The maximum number of queries to run.
+        union : bool, default=False
+            If True, the queries are merged into a single query.
+
+        Returns
+        -------
+        kg : object
+            The knowledge graph to run the queries on.
+        query_strings : list of str
+            The queries.
+        """
+        remote_source = None
+        if isinstance(kg, str):
+            if is_url(kg):
+                if self.endpoint_backend == "direct":
+                    kg = get_endpoint(kg)
+                elif self.endpoint_backend == "service":
+                    remote_source = kg
+                    # an empty graph named after the endpoint, which identifies
+                    # the results of the endpoint in `result_cache`
+                    kg = Graph(identifier=URIRef(kg))
+                else:
+                    raise ValueError(
+                        f"endpoint_backend should be one of {ENDPOINT_BACKENDS}, not {self.endpoint_backend}"
+                    )
+
+        query_strings = self.create_query(
+            source,
+            destinations=destinations,
+            return_list=True,
+            num_paths=num_paths,
+            limit=limit,
+            remote_source=None if union else remote_source,
+            max_queries=max_queries,
+        )
+        if union and len(query_strings) > 0:
+            query_strings = [
+                self.merge_queries(query_strings, remote_source=remote_source)
+            ]
+        return kg, query_strings
+
+    @staticmethod
+    def _parse_queries(kg, query_strings):
+        """
+        Parse queries for an rdflib graph, to be run from several threads.
+
+        The SPARQL parser of rdflib is not safe to use from several threads
+        before it has run once, so the queries are parsed in advance.
+
+        Parameters
+        ----------
+        kg : object
+            The knowledge graph to run the queries on.
+        query_strings : list of str
+            The queries.
+
+        Returns
+        -------
+        list
+            The parsed queries, or None for each query if `kg` is not an rdflib
+            graph.
+        """
+        if not isinstance(kg, Graph):
+            return [None] * len(query_strings)
+        namespaces = dict(kg.namespaces())
+        return [
+            prepareQuery(query_string, initNs=namespaces)
+            for query_string in query_strings
+        ]
+
+    @staticmethod
+    def _collect_results(results, return_df=True):
+        """
+        Combine the results of the queries run by `query`.
+
+        Parameters
+        ----------
+        results : list
+            The results of the queries, in order.
+        return_df : bool, default=True
+            If True, the results are concatenated into a single DataFrame.
+
+        Returns
+        -------
+        pandas.DataFrame or list or None
+            None if there are no results.
+        """
+        res = [r for r in results if r is not None]
+        if len(res) == 0:
+            return None
+        if return_df:
+            categories = {
+                label
+                for r in res
+                for label, dtype in r.dtypes.items()
+                if isinstance(dtype, pd.CategoricalDtype)
+            }
+            res = pd.concat(res)
+            # categoricals with different categories are concatenated as objects
+            for label in categories:
+                res[label] = res[label].astype("category")
+        return res
+
+    @staticmethod
+    def _get_data_types(source, destinations=None):
+        """
+        Get the datatypes of the data properties of a query, see `get_data_types`.
+
+        Parameters
+        ----------
+        source : list or OntoTerm
+            The source nodes of the query.
+        destinations : list, OntoTerm or None, optional
+            The destination nodes of the query.
+
+        Returns
+        -------
+        dict
+        """
+        terms = list(source) if isinstance(source, list) else [source]
+        if isinstance(destinations, list):
+            terms.extend(destinations)
+        elif destinations is not None:
+            terms.append(destinations)
+        return get_data_types(terms)
+
+    @staticmethod
+    def _map_queries(
+        kg,
+        query_strings,
+        return_df=True,
+        executor="thread",
+        max_workers=None,
+        types=None,
+    ):
+        """
+        Executes SPARQL queries concurrently on a knowledge graph.
+
+        Parameters
+        ----------
+        kg : object
+            The knowledge graph object that supports the `query` method. For a
+            process pool, it has to be picklable.
+        query_strings : list of str
+            The SPARQL queries.
+        return_df : bool, optional
+            If True, the query results are returned as pandas DataFrames.
+            Defaults to True.
+        executor : str or concurrent.futures.Executor, optional
+            "thread", "process" or an existing executor. Defaults to "thread".
+        max_workers : int, optional
+            The number of workers of a pool created for `executor`.
+        types : dict, optional
+            If given, typed DataFrames are returned, see `_execute_query`.
+
+        Returns
+        -------
+        list
+            The results, in the order of the queries.
+
+        Raises
+        ------
+        ValueError
+            If `executor` is not a known kind of pool.
+        """
+        if isinstance(executor, concurrent.futures.Executor):
+            pool = executor
+        elif executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        elif executor == "process":
+            pool = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            raise ValueError(
+                f"Unknown executor {executor}, use 'thread', 'process' or an Executor"
+            )
+        query_objects = itertools.repeat(None)
+        if isinstance(pool, concurrent.futures.ThreadPoolExecutor):
+            query_objects = Network._parse_queries(kg, query_strings)
+        try:
+            return list(
+                pool.map(
+                    _execute_query,
+                    itertools.repeat(kg),
+                    query_strings,
+                    itertools.repeat(return_df),
+                    query_objects,
+                    itertools.repeat(types),
+                )
+            )
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+
+    def merge_queries(self, query_strings, remote_source=None):
+        """
+        Merges queries into a single query, with the UNION of their results.
+
+        Each query becomes a subquery, so that its DISTINCT and LIMIT apply to
+        its own results as before. The merged query selects the variables of all
+        the queries, in order of appearance; variables that a subquery does not
+        select are unbound in its results.
+
+        Parameters
+        ----------
+        query_strings : list of str
+            The queries, as created by `create_query` without `remote_source`.
+        remote_source : str, optional
+            If provided, the merged query is sent to this SPARQL endpoint as a
+            whole. Default is None.
+
+        Returns
+        -------
+        str
+            The merged query. A single query without `remote_source` is returned
+            unchanged.
+        """
+        if len(query_strings) == 1 and remote_source is None:
+            return query_strings[0]
+
+        prefixes = {}
+        labels = {}
+        subqueries = []
+        for query_string in query_strings:
+            lines = query_string.split("\n")
+            start = 0
+            while lines[start].startswith("PREFIX"):
+                prefixes[lines[start]] = None
+                start += 1
+            labels.update(dict.fromkeys(self._get_labels(query_string)))
+            subqueries.append(["  {"] + ["    " + line for line in lines[start:]])
+            subqueries.append(["  }"])
+            subqueries.append(["  UNION"])
+
+        query = list(prefixes)
+        query.append(f'SELECT {" ".join("?" + label for label in labels)}')
+        query.append("WHERE {")
+        body = list(itertools.chain.from_iterable(subqueries[:-1]))
+        if remote_source is not None:
+            if not is_url(remote_source):
+                raise ValueError(f"{remote_source} is not a valid url")
+            query.append(f"  SERVICE <{remote_source}> {{")
+            query.extend("  " + line for line in body)
+            query.append("  }")
+        else:
+            query.extend(body)
+        query.append("}")
+        return "\n".join(query)
+
+    @staticmethod
+    def _get_labels(query_string):
+        """
+        Get the names of the variables selected by a query.
+
+        Parameters
+        ----------
+        query_string : str
+            The SPARQL query, with the variables on the line of the first SELECT.
+
+        Returns
+        -------
+        list of str
+            The variable names, without the leading '?'.
+        """
+        for line in query_string.split("\n"):
+            words = line.split()
+            if len(words) > 0 and words[0] == "SELECT":
+                break
+        else:
+            return []
+        labels = []
+        for word in words[1:]:
+            if word == "DISTINCT":
+                continue
+            if not word.startswith("?"):
+                break
+            labels.append(word[1:])
+        return labels
+
+    def _query(self, kg, query_string, return_df=True, types=None):
+        """
+        Executes a SPARQL query on the given knowledge graph (KG) and optionally
+        returns the result as a pandas DataFrame.
+
+        Parameters
+        ----------
+        kg : object
+            The knowledge graph object that supports the `query` method.
+        query_string : str
+            The SPARQL query string to be executed on the knowledge graph.
+        return_df : bool, optional
+            If True, the query result is returned as a pandas DataFrame.
+            Defaults to True.
+        types : dict, optional
+            If given, the DataFrame has typed columns, see `build_frame`, with
+            the datatypes of the data properties in the query.
+
+        Returns
+        -------
+        pandas.DataFrame or object
+            If `return_df` is True and the query result is not None, returns a
+            pandas DataFrame with the query results. The column names are derived
+            from the SELECT clause of the query. If `return_df` is False or the
+            query result is None, returns the raw query result.
+
+        Notes
+        -----
+        - The method assumes that the query string contains a SELECT clause if
+          `return_df` is True.
+        - The column names in the DataFrame are extracted from the first SELECT
+          clause by removing the leading '?' from variable names.
+        """
+        return _execute_query(kg, query_string, return_df=return_df, types=types)
+
+
+class OntologyNetworkBase(Network):
+    """
+    Network representation of Onto
+    """
+
+    def __init__(self, onto):
+        self.onto = onto
+        self._terms = None
         self._g = None
+        self._paths = []
+        self.path_cache = PathCache()
+        self.query_cache = QueryTemplateCache()
+        # incremented on every change of the graph, to invalidate cached paths
+        self._graph_version = 0
+        self._csr = None
+        self._reachability = None
+        # thread pool and lock of the asynchronous methods
+        self._executor = None
+        self._create_lock = threading.Lock()
 
     @property
     def terms(self):
@@ -1032,11 +2986,15 @@ class OntologyNetworkBase(Network):
     def g(self):
         if self._g is None:
             self._g = self.onto.get_networkx_graph()
+            for triple in self._paths:
+                self._add_path_to_graph(self._g, triple)
         return self._g
 
     def __add__(self, ontonetwork):
         onto = self.onto + ontonetwork.onto
-        return OntologyNetworkBase(onto)
+        network = OntologyNetworkBase(onto)
+        network._paths = self._paths + ontonetwork._paths
+        return network
 
     @property
     def attributes(self):
@@ -1053,8 +3011,44 @@ class OntologyNetworkBase(Network):
     def __radd__(self, ontonetwork):
         return self.__add__(ontonetwork)
 
+    def _compile(self):
+        """
+        Collect the parsed state of the network for the compiled ontology cache.
+
+        Returns
+        -------
+        dict
+            The RDF graph, the parsed data of the ontology and the networkx graph.
+        """
+        return {
+            "graph": self.onto.graph,
+            "data_dict": self.onto.data_dict,
+            "g": self.g,
+        }
+
+    def _load_compiled(self, compiled):
+        """
+        Restore the parsed state of the network from the compiled ontology cache.
+
+        Parameters
+        ----------
+        compiled : dict
+            The compiled ontology, as returned by `_compile`.
+
+        Returns
+        -------
+        None
+        """
+        self.onto._data_dict = compiled["data_dict"]
+        self._g = compiled["g"]
+        self._graph_version += 1
+
     def add_namespace(self, namespace_name, namespace_iri):
         self.onto.add_namespace(namespace_name, namespace_iri)
+        if self.onto._data_dict is None:
+            self._terms = None
+            self._g = None
+            self._graph_version += 1
 
     add_namespace.__doc__ = OntoParser.add_namespace.__doc__
 
@@ -1069,27 +3063,74 @@ class OntologyNetworkBase(Network):
         node_id=None,
         delimiter="/",
     ):
-        self.onto.add_term(
-            uri=uri,
-            node_type=node_type,
-            namespace=namespace,
-            dm=dm,
-            rn=rn,
-            data_type=data_type,
-            node_id=node_id,
-            delimiter=delimiter,
-        )
-        self._terms = None
-        self._g = None
+        self.add_terms([dict(uri=uri, node_type=node_type, dm=dm, rn=rn)])
 
     add_term.__doc__ = OntoParser.add_term.__doc__
 
+    def add_terms(self, terms):
+        """
+        Add several terms at once.
+
+        All terms are validated before the ontology is modified, and the
+        derived structures are updated once for the whole batch.
+
+        Parameters
+        ----------
+        terms : iterable of dict, pandas.DataFrame or str
+            The terms to be added, with the keyword arguments of :meth:`add_term`
+            as keys or columns, at least ``uri`` and ``node_type``. A string is
+            read as the path of a CSV file. In a table, ``dm`` and ``rn`` are
+            given as ";" separated URIs.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the node type of any of the terms is not found.
+        """
+        records = []
+        for term in _read_records(terms):
+            term = dict(term)
+            for key in ["dm", "rn"]:
+                if isinstance(term.get(key), str):
+                    term[key] = [x.strip() for x in term[key].split(";") if x.strip()]
+            records.append(term)
+
+        added = self.onto.add_terms(records)
+        self._graph_version += 1
+        if any(term is None for term in added):
+            self._terms = None
+            self._g = None
+            return
+        # update the derived structures in place
+        for term in added:
+            if self._terms is not None:
+                self._terms._add_attribute(
+                    {term.namespace: {term.name_without_prefix: term}}
+                )
+            if self._g is not None:
+                self.onto._add_term_to_graph(self._g, term, term.node_type)
+        # new classes are in the domain and range of the properties on owl:Thing
+        classes = {term.name for term in added if term.node_type == "class"}
+        if self._g is not None and classes:
+            for key in ["object_property", "data_property"]:
+                for prop in self.onto.attributes[key].values():
+                    if classes.intersection(prop.domain) or (
+                        key == "object_property" and classes.intersection(prop.range)
+                    ):
+                        self.onto._add_term_to_graph(self._g, prop, key)
+
     def add_path(self, triple):
         """
         Add a triple as path.
 
         Note that all attributes of the triple should already exist in the graph.
-        The ontology itself is not modified. Only the graph representation of it is.
+        The ontology itself is not modified. Only the graph representation of it is:
+        the edges subject -> predicate -> object are added to the networkx graph,
+        so that shortest paths can go through them.
         The expected use is to bridge between two (or more) different ontologies.
 
         Parameters
@@ -1104,32 +3145,100 @@ class OntologyNetworkBase(Network):
         If the subject or object of the triple is not found in the attributes of the ontology.
 
         """
+        self.add_paths([triple])
+
+    def add_paths(self, triples):
+        """
+        Add several triples as paths at once.
+
+        All triples are validated before any of them is added. See
+        :meth:`add_path` for the meaning of a path.
+
+        Parameters
+        ----------
+        triples : iterable of tuple, pandas.DataFrame or str
+            The subject, predicate and object of each path. A table should have
+            the columns ``subject``, ``predicate`` and ``object``, or exactly
+            three columns. A string is read as the path of a CSV file.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the subject or object of any triple is not a class of the ontology.
+        """
+        records = _read_records(triples)
+        columns = ["subject", "predicate", "object"]
+        triples = []
+        for record in records:
+            if isinstance(record, dict):
+                if all(key in record for key in columns):
+                    record = [record[key] for key in columns]
+                else:
+                    record = list(record.values())
+            if len(record) != 3:
+                raise ValueError(
+                    f"A path needs a subject, predicate and object: {record}"
+                )
+            triples.append(tuple(record))
 
         def to_uri(tag, namespaces):
             if ":" in tag:
-                prefix, term = tag.split(":")
+                prefix, term = tag.split(":", 1)
                 return URIRef(namespaces[prefix] + term)
             else:
                 return Literal(tag)
 
-        sub, pred, obj = [to_uri(t, self.namespaces) for t in triple]
-
-        if (sub, RDF.type, OWL.Class) not in self.onto.graph:
+        namespaces = self.namespaces
+        classes = set(self.onto.graph.subjects(RDF.type, OWL.Class))
+        rdf_triples = []
+        missing = []
+        for triple in triples:
+            sub, pred, obj = [to_uri(t, namespaces) for t in triple]
+            if sub not in classes:
+                missing.append(triple[0])
+            if isinstance(obj, URIRef) and obj not in classes:
+                missing.append(triple[2])
+            rdf_triples.append((sub, pred, obj))
+        if len(missing) > 0:
             raise ValueError(
-                f"{sub} not found in {list(self.onto.graph.subjects(RDF.type, OWL.Class))}"
+                f"{sorted(set(missing))} not found as classes in the ontology"
             )
 
-        if (
-            isinstance(obj, URIRef)
-            and (obj, RDF.type, OWL.Class) not in self.onto.graph
-        ):
-            raise ValueError(
-                f"{obj} not found in {list(self.onto.graph.subjects(RDF.type, OWL.Class))}"
-            )
+        self.onto.graph.addN((*triple, self.onto.graph) for triple in rdf_triples)
+        for triple in rdf_triples:
+            self.onto._index_triple(triple)
+        self._paths.extend(triples)
+        self._graph_version += 1
+        if self._g is not None:
+            for triple in triples:
+                self._add_path_to_graph(self._g, triple)
 
-        self.onto.graph.add((sub, pred, obj))
-        self._terms = None
-        self._g = None
+    @staticmethod
+    def _add_path_to_graph(g, triple):
+        """
+        Add the edges of a path triple to a networkx graph.
+
+        Parameters
+        ----------
+        g : networkx.DiGraph
+            The graph to be extended.
+        triple : tuple
+            The subject, predicate and object names of the path.
+
+        Returns
+        -------
+        None
+        """
+        sub, pred, obj = triple
+        if pred not in g:
+            g.add_node(pred, node_type="object_property")
+        g.add_edge(sub, pred)
+        if ":" in obj:
+            g.add_edge(pred, obj)
 
 
 class OntologyNetwork(OntologyNetworkBase):
@@ -1144,6 +3253,18 @@ class OntologyNetwork(OntologyNetworkBase):
         The path to the ontology file to be parsed.
     format : str, optional
         The format of the ontology file (default is "xml").
+    cache : bool, optional
+        If True, the compiled ontology is loaded from the on-disk cache, or
+        stored there after parsing if it is not cached yet (default is False).
+        See `tools4rdf.network.cache`.
+    cache_dir : str, optional
+        The cache directory. Providing it enables the cache. Defaults to the
+        environment variable `TOOLS4RDF_CACHE_DIR`, or `~/.cache/tools4rdf`.
+        Paths saved with `save_paths` are stored there too, and loaded again
+        when the network is created.
+
+    Attributes
+    ----------
     terms : AttrSetter
         An object for managing attributes of the ontology terms.
     g : networkx.Graph
@@ -1154,5 +3275,23 @@ class OntologyNetwork(OntologyNetworkBase):
         Additional namespaces that are not part of the core ontology.
     """
 
-    def __init__(self, infile, format="xml"):
-        super().__init__(parse_ontology(infile, format=format))
+    def __init__(self, infile, format="xml", cache=False, cache_dir=None):
+        if not cache and cache_dir is None:
+            super().__init__(parse_ontology(infile, format=format))
+            return
+
+        cache_file = get_cache_file(infile, format=format, cache_dir=cache_dir)
+        compiled = load_compiled(cache_file)
+        if compiled is None:
+            super().__init__(parse_ontology(infile, format=format))
+            try:
+                save_compiled(cache_file, self._compile())
+            except OSError as e:
+                warnings.warn(f"Could not write ontology cache {cache_file}: {e}")
+        else:
+            super().__init__(OntoParser(compiled["graph"]))
+            self._load_compiled(compiled)
+        # paths saved with `save_paths` are picked up as well
+        self._path_store = os.path.splitext(cache_file)[0] + ".paths"
+        if os.path.exists(self._path_store):
+            self.load_paths()
@@ -0,0 +1,63 @@
+"""
+This module provides the pagination of SPARQL queries with LIMIT and OFFSET.
+
+Endpoints often cap the number of results of a query or time out on large
+ones. A query is therefore run in pages: the results are put in a fixed order
+with ORDER BY on all the selected variables, starting with the source, and
+every page is fetched with its own LIMIT and OFFSET. The position of the next
+page to fetch is a `PageCursor`, from which a failed run can be resumed.
+"""
+
+from collections import namedtuple
+
+# the index of a query, and the number of its results before a page
+PageCursor = namedtuple("PageCursor", ["query", "offset"])
+
+
+class PaginationError(RuntimeError):
+    """
+    An error while fetching a page of results.
+
+    Parameters
+    ----------
+    message : str
+        The description of the error.
+    cursor : PageCursor
+        The position of the page that failed, to resume from.
+
+    Attributes
+    ----------
+    cursor : PageCursor
+        The position of the page that failed.
+    partial : pandas.DataFrame or None
+        The results fetched before the error, if they were collected.
+    """
+
+    def __init__(self, message, cursor):
+        super().__init__(message)
+        self.cursor = cursor
+        self.partial = None
+
+
+def paginate_query(query_string, labels, limit, offset=0):
+    """
+    Create the query of one page of results.
+
+    Parameters
+    ----------
+    query_string : str
+        The query, without a LIMIT clause.
+    labels : list of str
+        The variables selected by the query, the source first.
+    limit : int
+        The number of results of the page.
+    offset : int, optional
+        The number of results before the page. Default is 0.
+
+    Returns
+    -------
+    str
+        The query of the page.
+    """
+    order = " ".join("?" + label for label in labels)
+    return f"{query_string}\nORDER BY {order}\nLIMIT {limit}\nOFFSET {offset}"
@@ -10,6 +10,7 @@ Key Features:
 - Manage ontology classes, object properties, and data properties.
 - Handle namespaces and mappings within the ontology.
 - Support for subclass and equivalent class relationships.
+- Query the ancestors and descendants of classes and properties.
 - Generate a NetworkX graph representation of the ontology.
 - Add new terms and namespaces to the ontology dynamically.
 
@@ -28,9 +29,36 @@ import networkx as nx
 import warnings
 
 from tools4rdf.network.term import OntoTerm, strip_name
+from tools4rdf.network.closure import transitive_closure, invert_closure
+from tools4rdf.network.namespace import NamespaceDict
 from tools4rdf.network.patch import patch_terms
 from rdflib import Graph, RDF, RDFS, OWL, BNode, URIRef
 
+# rdf:type of the terms that can be added with `add_term`
+RDF_NODE_TYPES = {
+    "class": OWL.Class,
+    "object_property": OWL.ObjectProperty,
+    "data_property": OWL.DatatypeProperty,
+}
+
+IAO_DEFINITION = URIRef("http://purl.obolibrary.org/obo/IAO_0000115")
+
+# predicates whose triples are collected by the single pass in `_build_index`
+INDEXED_PREDICATES = (
+    RDF.type,
+    RDFS.subClassOf,
+    OWL.equivalentClass,
+    RDFS.domain,
+    RDFS.range,
+    RDFS.subPropertyOf,
+    RDF.first,
+    RDF.rest,
+    OWL.unionOf,
+    OWL.intersectionOf,
+    RDFS.comment,
+    IAO_DEFINITION,
+)
+
 
 def parse_ontology(infile, format="xml"):
     """
@@ -70,6 +98,9 @@ class OntoParser:
         The RDF graph containing the ontology data.
     _data_dict : dict or None
         A dictionary to store parsed ontology data. Initialized lazily.
+    _index : dict or None
+        An in-memory index of the triples needed for parsing, built by a single
+        pass over the graph. Initialized lazily.
     classes : list
         A list of ontology classes extracted from the graph.
     mappings : dict
@@ -88,8 +119,10 @@ class OntoParser:
     def __init__(self, graph):
         self.graph = graph
         self._data_dict = None
+        self._index = None
 
     def _initialize(self):
+        self._build_index()
         self._data_dict = {
             "classes": [],
             "attributes": {
@@ -99,8 +132,13 @@ class OntoParser:
                 "data_nodes": {},
             },
             "mappings": {},
-            "namespaces": {},
+            "namespaces": NamespaceDict(),
             "extra_namespaces": {},
+            "ancestors": {
+                "class": {},
+                "object_property": {},
+                "data_property": {},
+            },
         }
         self._extract_default_namespaces()
         self.extract_classes()
@@ -176,6 +214,107 @@ class OntoParser:
             base_iri = str(s)
         return base_iri
 
+    def _build_index(self):
+        """
+        Index the triples needed for parsing, with one lookup per predicate.
+
+        Every triple whose predicate is in `INDEXED_PREDICATES` is stored in a
+        dictionary keyed by predicate and subject. For `rdf:type` triples, the
+        subjects are also stored keyed by their type, so that all instances of
+        a type can be retrieved without another pass over the graph.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Subjects and objects are kept in the order the RDF graph returns them
+        for `Graph.subjects` and `Graph.objects`. A scan of all triples would
+        return them in an order that changes with the hash seed of the process,
+        and with it the order of the terms and of the network graph.
+        """
+        objects = {}
+        instances = {}
+        for predicate in INDEXED_PREDICATES:
+            by_subject = {}
+            for subject, obj in self.graph.subject_objects(predicate):
+                by_subject.setdefault(subject, []).append(obj)
+                if predicate == RDF.type:
+                    instances.setdefault(obj, []).append(subject)
+            for subject, objs in by_subject.items():
+                if len(objs) > 1:
+                    by_subject[subject] = list(self.graph.objects(subject, predicate))
+            objects[predicate] = by_subject
+        self._index = {"objects": objects, "instances": instances}
+
+    def _objects(self, subject, predicate):
+        """
+        Get all objects for a given subject and predicate.
+
+        Indexed predicates are served from the triple index, all others are
+        looked up in the RDF graph directly.
+
+        Parameters
+        ----------
+        subject : rdflib.term.Identifier
+            The subject node in the RDF graph.
+        predicate : rdflib.term.Identifier
+            The predicate node in the RDF graph.
+
+        Returns
+        -------
+        list
+            The objects associated with the subject and predicate.
+        """
+        if self._index is None:
+            self._build_index()
+        by_subject = self._index["objects"].get(predicate)
+        if by_subject is None:
+            return list(self.graph.objects(subject, predicate))
+        return by_subject.get(subject, [])
+
+    def _instances(self, rdf_type):
+        """
+        Get all subjects which have the given `rdf:type`.
+
+        Parameters
+        ----------
+        rdf_type : rdflib.term.Identifier
+            The type to look up, for example `OWL.Class`.
+
+        Returns
+        -------
+        list
+            The subjects of type `rdf_type`.
+        """
+        if self._index is None:
+            self._build_index()
+        return self._index["instances"].get(rdf_type, [])
+
+    def _index_triple(self, triple):
+        """
+        Add a triple which was added to the RDF graph to the triple index.
+
+        Parameters
+        ----------
+        triple : tuple
+            The subject, predicate and object of the triple.
+
+        Returns
+        -------
+        None
+        """
+        if self._index is None:
+            return
+        subject, predicate, obj = triple
+        by_subject = self._index["objects"].get(predicate)
+        if by_subject is None:
+            return
+        by_subject.setdefault(subject, []).append(obj)
+        if predicate == RDF.type:
+            self._index["instances"].setdefault(obj, []).append(subject)
+
     def _extract_default_namespaces(self):
         """
         Extracts and stores non-default namespaces from the RDF graph.
@@ -208,11 +347,11 @@ class OntoParser:
         """
         for mainkey in ["class", "object_property", "data_property"]:
             for key, val in self.attributes[mainkey].items():
-                namespace = self.attributes[mainkey][key].namespace
-                if namespace not in self.namespaces.keys():
-                    self.namespaces[namespace] = self.attributes[mainkey][
-                        key
-                    ].namespace_with_prefix
+                self._recheck_namespace(val)
+
+    def _recheck_namespace(self, term):
+        if term.namespace not in self.namespaces.keys():
+            self.namespaces[term.namespace] = term.namespace_with_prefix
 
     def extract_object_properties(self):
         """
@@ -223,13 +362,16 @@ class OntoParser:
         creates a term, assigns its domain, range, and node type, and stores
         it in the `attributes` dictionary under the "object_property" key.
         """
-        object_properties = list(self.graph.subjects(RDF.type, OWL.ObjectProperty))
-        for cls in object_properties:
-            term = self.create_term(cls)
-            term.domain = self.get_domain(cls)
-            term.range = self.get_range(cls)
-            term.node_type = "object_property"
-            self.attributes["object_property"][term.name] = term
+        for cls in self._instances(OWL.ObjectProperty):
+            self._add_object_property(cls)
+
+    def _add_object_property(self, cls):
+        term = self.create_term(cls)
+        term.domain = self.get_domain(cls)
+        term.range = self.get_range(cls)
+        term.node_type = "object_property"
+        self.attributes["object_property"][term.name] = term
+        return term
 
     def extract_data_properties(self):
         """
@@ -240,24 +382,25 @@ class OntoParser:
         "data_property". Additionally, it creates associated data nodes for each
         data property and stores them in the attributes dictionary.
         """
-        data_properties = list(self.graph.subjects(RDF.type, OWL.DatatypeProperty))
-        for cls in data_properties:
-            term = self.create_term(cls)
-            term.domain = self.get_domain(cls)
-            rrange = self.get_range(cls)
-            rrange = [x.split(":")[-1] for x in rrange]
-            rrange = patch_terms(term.uri, rrange)
-
-            term.range = rrange
-            term.node_type = "data_property"
-            self.attributes["data_property"][term.name] = term
-
-            # now create data nodes
-            data_term = OntoTerm(name=term.name + "value", node_type="data_node")
-            self.attributes["data_property"][
-                term.name
-            ].associated_data_node = data_term.name
-            self.attributes["data_nodes"][data_term.name] = data_term
+        for cls in self._instances(OWL.DatatypeProperty):
+            self._add_data_property(cls)
+
+    def _add_data_property(self, cls):
+        term = self.create_term(cls)
+        term.domain = self.get_domain(cls)
+        rrange = self.get_range(cls)
+        rrange = [x.split(":")[-1] for x in rrange]
+        rrange = patch_terms(term.uri, rrange)
+
+        term.range = rrange
+        term.node_type = "data_property"
+        self.attributes["data_property"][term.name] = term
+
+        # now create data nodes
+        data_term = OntoTerm(name=term.name + "value", node_type="data_node")
+        term.associated_data_node = data_term.name
+        self.attributes["data_nodes"][data_term.name] = data_term
+        return term
 
     def extract_subproperties(self):
         """
@@ -272,8 +415,7 @@ class OntoParser:
         for prop_type in ["object_property", "data_property"]:
             for key, prop in self.attributes[prop_type].items():
                 # get the subproperties
-                top_props = list(self.graph.objects(prop.URIRef, RDFS.subPropertyOf))
-                for top_prop in top_props:
+                for top_prop in self._objects(prop.URIRef, RDFS.subPropertyOf):
                     if top_prop not in top_most_properties:
                         # get the name of the subproperty
                         toppropname = strip_name(
@@ -289,10 +431,9 @@ class OntoParser:
                             warnings.warn(
                                 f"{toppropname} is a superproperty of {key}, but not found in attribute."
                             )
-        # recursivly add the subproperties
+        # add the indirect subproperties
         for prop_type in ["object_property", "data_property"]:
-            for key, prop in self.attributes[prop_type].items():
-                self._recursively_add_subclasses(key, item_type=prop_type)
+            self.recursively_add_subclasses(item_type=prop_type)
 
     def extract_values(self, subject, predicate):
         """
@@ -312,7 +453,7 @@ class OntoParser:
             The first object value associated with the given subject and predicate,
             or None if no such value exists.
         """
-        for val in self.graph.objects(subject, predicate):
+        for val in self._objects(subject, predicate):
             return val
         return None
 
@@ -327,7 +468,7 @@ class OntoParser:
 
         At the end, the `OWL.Thing` class is also added to the `classes` list.
         """
-        for term in self.graph.subjects(RDF.type, OWL.Class):
+        for term in self._instances(OWL.Class):
             if isinstance(term, BNode):
                 for relation_type, owl_term in [
                     ("union", OWL.unionOf),
@@ -384,11 +525,9 @@ class OntoParser:
             The description of the class, or an empty string if no description
             is found.
         """
-        comment = self.graph.value(
-            cls, URIRef("http://purl.obolibrary.org/obo/IAO_0000115")
-        )
+        comment = self.extract_values(cls, IAO_DEFINITION)
         if comment is None:
-            comment = self.graph.value(cls, RDFS.comment)
+            comment = self.extract_values(cls, RDFS.comment)
         if comment is None:
             comment = ""
         return comment
@@ -529,7 +668,7 @@ class OntoParser:
             for the specified class.
         """
         domain = []
-        for obj in self.graph.objects(cls, predicate):
+        for obj in self._objects(cls, predicate):
             # Check if this BNode is a union/intersection
             if isinstance(obj, BNode):
                 union_term = self.extract_values(obj, OWL.unionOf)
@@ -607,9 +746,8 @@ class OntoParser:
         """
         Look up the namespace prefix for a given URI.
 
-        This method iterates through the stored namespaces and checks if the
-        provided URI starts with any of the namespace values. If a match is found,
-        the corresponding namespace prefix is returned.
+        The prefix of the longest stored namespace IRI that the URI starts
+        with is returned.
 
         Parameters
         ----------
@@ -621,12 +759,9 @@ class OntoParser:
         str or None
             The namespace prefix if a match is found, otherwise None.
         """
-        for key, value in self.namespaces.items():
-            if uri.startswith(value):
-                return key
-        return None
+        return self.namespaces.lookup(uri)
 
-    def unravel_relation(self, term, unravel_list=[]):
+    def unravel_relation(self, term, unravel_list=None):
         """
         Recursively unravels an RDF collection into a Python list.
 
@@ -641,7 +776,7 @@ class OntoParser:
             is the head of the RDF list.
         unravel_list : list, optional
             A list to accumulate the elements of the RDF collection. Defaults
-            to an empty list.
+            to a new empty list.
 
         Returns
         -------
@@ -649,12 +784,14 @@ class OntoParser:
             A Python list containing the elements of the RDF collection in the
             order they appear.
         """
-        if term == RDF.nil:
+        if unravel_list is None:
+            unravel_list = []
+        if term is None or term == RDF.nil:
             return unravel_list
-        first_term = self.graph.value(term, RDF.first)
+        first_term = self.extract_values(term, RDF.first)
         if first_term not in unravel_list:
             unravel_list.append(first_term)
-        second_term = self.graph.value(term, RDF.rest)
+        second_term = self.extract_values(term, RDF.rest)
         return self.unravel_relation(second_term, unravel_list)
 
     def parse_subclasses(self):
@@ -667,17 +804,19 @@ class OntoParser:
         the current class.
         """
         for key, cls in self.attributes["class"].items():
-            for obj in self.graph.objects(cls.target, RDFS.subClassOf):
+            for obj in self._objects(cls.target, RDFS.subClassOf):
                 superclasses = self.lookup_class(obj)
                 for superclass in superclasses:
                     self.attributes["class"][superclass].subclasses.append(cls.name)
 
     def recursively_add_subclasses(self, item_type="class"):
         """
-        Recursively adds subclasses for each class in the specified item type.
+        Adds all indirect subclasses of each item to its list of subclasses.
 
-        This method iterates through all the classes in the specified item type
-        and calls a helper method to recursively add their subclasses.
+        The transitive closure of the hierarchy is computed once for all the items
+        of the given type, see `tools4rdf.network.closure.transitive_closure`. The
+        ancestors of each item are stored as well, and can be accessed with
+        `ancestors`.
 
         Parameters
         ----------
@@ -685,36 +824,74 @@ class OntoParser:
             The type of item to process (default is "class"). This is used to
             determine which set of attributes to process.
         """
-        for clsname in self.attributes[item_type].keys():
-            self._recursively_add_subclasses(clsname, item_type=item_type)
+        items = self.attributes[item_type]
+        closure = transitive_closure(
+            {name: item.subclasses for name, item in items.items()}
+        )
+        for name, item in items.items():
+            item.subclasses = closure[name]
+        self.data_dict["ancestors"][item_type] = invert_closure(closure)
+
+    def ancestors(self, term, item_type=None):
+        """
+        Get all direct and indirect superclasses or superproperties of a term.
+
+        Parameters
+        ----------
+        term : OntoTerm or str
+            The term, or its name, for example "cmso:UnitCell".
+        item_type : str, optional
+            One of "class", "object_property" or "data_property". If not provided,
+            it is determined from the term.
 
-    def _recursively_add_subclasses(self, clsname, item_type="class"):
+        Returns
+        -------
+        list of str
+            The names of all the ancestors of the term.
+
+        Raises
+        ------
+        ValueError
+            If the term is not found in the ontology.
         """
-        Recursively adds all subclasses of a given class to its subclass list.
+        name, item_type = self._resolve_hierarchy_term(term, item_type)
+        return list(self.data_dict["ancestors"][item_type].get(name, []))
 
-        This method traverses the subclass hierarchy for a given class and ensures
-        that all indirect subclasses are added to the direct subclass list of the
-        specified class.
+    def descendants(self, term, item_type=None):
+        """
+        Get all direct and indirect subclasses or subproperties of a term.
 
         Parameters
         ----------
-        clsname : str
-            The name of the class whose subclass hierarchy is to be processed.
+        term : OntoTerm or str
+            The term, or its name, for example "cmso:UnitCell".
         item_type : str, optional
-            The type of item being processed (default is "class").
-        """
-        subclasses_to_add = []
-        for subclass in self.attributes[item_type][clsname].subclasses:
-            for subclass_of_subclass in self.attributes[item_type][subclass].subclasses:
-                if (
-                    subclass_of_subclass
-                    not in self.attributes[item_type][clsname].subclasses
-                ):
-                    subclasses_to_add.append(subclass_of_subclass)
-        if len(subclasses_to_add) == 0:
-            return
-        self.attributes[item_type][clsname].subclasses.extend(subclasses_to_add)
-        self._recursively_add_subclasses(clsname, item_type=item_type)
+            One of "class", "object_property" or "data_property". If not provided,
+            it is determined from the term.
+
+        Returns
+        -------
+        list of str
+            The names of all the descendants of the term.
+
+        Raises
+        ------
+        ValueError
+            If the term is not found in the ontology.
+        """
+        name, item_type = self._resolve_hierarchy_term(term, item_type)
+        return list(self.attributes[item_type][name].subclasses)
+
+    def _resolve_hierarchy_term(self, term, item_type=None):
+        name = term.name if isinstance(term, OntoTerm) else term
+        if item_type is None:
+            for key in ["class", "object_property", "data_property"]:
+                if name in self.attributes[key]:
+                    item_type = key
+                    break
+        if item_type is None or name not in self.attributes[item_type]:
+            raise ValueError(f"{name} not found in the ontology")
+        return name, item_type
 
     def add_subclasses_to_owlThing(self):
         """
@@ -724,11 +901,16 @@ class OntoParser:
         For each class, it checks if the class has any existing `rdfs:subClassOf` relationships
         in the RDF graph. If no such relationships are found, the class is added as a subclass
         of "owl:Thing".
+
+        "owl:Thing" is also added to the ancestors of every class, and not only
+        of the classes without a superclass.
         """
+        ancestors = self.data_dict["ancestors"]["class"]
         for key, cls in self.attributes["class"].items():
-            objects = list(self.graph.objects(cls.target, RDFS.subClassOf))
-            if len(objects) == 0:
+            if len(self._objects(cls.target, RDFS.subClassOf)) == 0:
                 self.attributes["class"]["owl:Thing"].subclasses.append(cls.name)
+            if key != "owl:Thing":
+                ancestors.setdefault(key, []).append("owl:Thing")
 
     def parse_equivalents(self):
         """
@@ -741,7 +923,7 @@ class OntoParser:
         equivalent class.
         """
         for key, cls in self.attributes["class"].items():
-            for equivalent in self.graph.objects(cls.target, OWL.equivalentClass):
+            for equivalent in self._objects(cls.target, OWL.equivalentClass):
                 stripped_name = strip_name(
                     equivalent, namespace=self._lookup_namespace(equivalent)
                 )
@@ -753,43 +935,17 @@ class OntoParser:
 
     def recursively_add_equivalents(self):
         """
-        Recursively adds equivalent classes to the attributes dictionary.
-
-        This method iterates through all class names in the "class" attribute
-        and calls a helper method to recursively add equivalent classes for
-        each class name.
-        """
-        for clsname in self.attributes["class"].keys():
-            self._recursively_add_equivalents(clsname)
+        Adds all transitively equivalent classes to each class.
 
-    def _recursively_add_equivalents(self, clsname):
+        Equivalence is symmetric, so the closure of the equivalence relation
+        is computed in the same way as for the subclass hierarchy.
         """
-        Recursively adds all equivalent classes for a given class.
-
-        This method ensures that all transitive equivalent classes of the
-        specified class are added to its list of equivalent classes. It
-        traverses the equivalence relationships and updates the class
-        attributes accordingly.
-
-        Parameters
-        ----------
-        clsname : str
-            The name of the class for which equivalent classes are to be added.
-        """
-        equivalents_to_add = []
-        for equivalent in self.attributes["class"][clsname].equivalent_classes:
-            for equivalent_of_equivalent in self.attributes["class"][
-                equivalent
-            ].equivalent_classes:
-                if (
-                    equivalent_of_equivalent
-                    not in self.attributes["class"][clsname].equivalent_classes
-                ):
-                    equivalents_to_add.append(equivalent_of_equivalent)
-        if len(equivalents_to_add) == 0:
-            return
-        self.attributes["class"][clsname].equivalent_classes.extend(equivalents_to_add)
-        self._recursively_add_equivalents(clsname)
+        classes = self.attributes["class"]
+        closure = transitive_closure(
+            {name: cls.equivalent_classes for name, cls in classes.items()}
+        )
+        for name, cls in classes.items():
+            cls.equivalent_classes = closure[name]
 
     def parse_named_individuals(self):
         """
@@ -800,13 +956,11 @@ class OntoParser:
         parsed information is stored in the `attributes` dictionary under the
         "class" key.
         """
-        named_individuals = list(self.graph.subjects(RDF.type, OWL.NamedIndividual))
-        for cls in named_individuals:
+        for cls in self._instances(OWL.NamedIndividual):
             # find parent
             term = self.create_term(cls)
             self.attributes["class"][term.name] = term
-            parents = list(self.graph.objects(cls, RDF.type))
-            for parent in parents:
+            for parent in self._objects(cls, RDF.type):
                 if parent not in [OWL.NamedIndividual, OWL.Class]:
                     self.attributes["class"][
                         strip_name(
@@ -867,22 +1021,44 @@ class OntoParser:
         """
         g = nx.DiGraph()
         for key, val in self.attributes["class"].items():
-            g.add_node(val.name, node_type="class")
+            self._add_term_to_graph(g, val, "class")
 
         for property_key in ["object_property", "data_property"]:
             for key, val in self.attributes[property_key].items():
-                g.add_node(val.name, node_type=property_key)
+                self._add_term_to_graph(g, val, property_key)
+        return g
 
-                # add edges between them
-                for d in val.domain:
-                    g.add_edge(d, val.name)
+    @staticmethod
+    def _add_term_to_graph(g, term, node_type):
+        """
+        Add a term, and the edges to its domain and range, to a networkx graph.
 
-                if property_key == "object_property":
-                    for r in val.range:
-                        g.add_edge(val.name, r)
-                else:
-                    g.add_edge(val.name, val.associated_data_node)
-        return g
+        Parameters
+        ----------
+        g : networkx.DiGraph
+            The graph to be extended.
+        term : OntoTerm
+            The term to be added.
+        node_type : str
+            One of "class", "object_property" or "data_property".
+
+        Returns
+        -------
+        None
+        """
+        g.add_node(term.name, node_type=node_type)
+        if node_type == "class":
+            return
+
+        # add edges between them
+        for d in term.domain:
+            g.add_edge(d, term.name)
+
+        if node_type == "object_property":
+            for r in term.range:
+                g.add_edge(term.name, r)
+        else:
+            g.add_edge(term.name, term.associated_data_node)
 
     def add_term(
         self,
@@ -917,25 +1093,130 @@ class OntoParser:
         delimiter : str, optional
             The delimiter used for parsing the URI.
 
+        Returns
+        -------
+        OntoTerm or None
+            The added term. If the ontology is already parsed, the term is added
+            to it directly, otherwise None is returned and the term is included
+            when the ontology is parsed.
+
+        Raises
+        ------
+        ValueError
+            If the node type is not found.
+
+        """
+        return self.add_terms([dict(uri=uri, node_type=node_type, dm=dm, rn=rn)])[0]
+
+    def add_terms(self, terms):
+        """
+        Add several nodes at once.
+
+        All terms are validated before the RDF graph is modified, so that
+        either all or none of them are added.
+
+        Parameters
+        ----------
+        terms : iterable of dict
+            The terms to be added. Each dict holds the keyword arguments of
+            :meth:`add_term`, at least ``uri`` and ``node_type``.
+
+        Returns
+        -------
+        list
+            The added terms, in the given order. See :meth:`add_term` for when
+            an entry is None.
+
         Raises
         ------
         ValueError
-            If the namespace is not found.
+            If the node type of any of the terms is not found.
+        """
+        terms = list(terms)
+        specs = []
+        for term in terms:
+            if term.get("node_type") not in RDF_NODE_TYPES:
+                raise ValueError(f"Node type not found: {term.get('node_type')}")
+            specs.append((URIRef(term["uri"]), term["node_type"]))
+
+        triples = []
+        seen = set()
+        for (cls, node_type), term in zip(specs, terms):
+            new_triples = [(cls, RDF.type, RDF_NODE_TYPES[node_type])]
+            new_triples += [(cls, RDFS.range, URIRef(r)) for r in term.get("rn", ())]
+            new_triples += [(cls, RDFS.domain, URIRef(d)) for d in term.get("dm", ())]
+            for triple in new_triples:
+                if triple not in seen and triple not in self.graph:
+                    seen.add(triple)
+                    triples.append(triple)
+        self.graph.addN((*triple, self.graph) for triple in triples)
+
+        # if the ontology is not parsed yet, the terms are picked up when it is
+        if self._data_dict is None:
+            self._index = None
+            return [None] * len(specs)
+        for triple in triples:
+            self._index_triple(triple)
+        added = []
+        for cls, node_type in specs:
+            # once the hierarchy changed, the rest is picked up by parsing again
+            if self._data_dict is None:
+                added.append(None)
+            else:
+                added.append(self._add_term_to_attributes(cls, node_type))
+        return added
 
+    def _add_term_to_attributes(self, cls, node_type):
+        """
+        Add a term to the already parsed ontology data, without parsing again.
+
+        Parameters
+        ----------
+        cls : rdflib.term.URIRef
+            The term to be added.
+        node_type : str
+            One of "class", "object_property" or "data_property".
+
+        Returns
+        -------
+        OntoTerm or None
+            The added term, or None if the term changes the class hierarchy. In
+            that case, the ontology is parsed again on next access.
         """
         if node_type == "class":
-            self.graph.add((URIRef(uri), RDF.type, OWL.Class))
+            term = self.create_term(cls)
+            if term.name in self.attributes["class"]:
+                return self.attributes["class"][term.name]
+            if (
+                len(self._objects(cls, RDFS.subClassOf)) > 0
+                or len(self._objects(cls, OWL.equivalentClass)) > 0
+            ):
+                self._data_dict = None
+                return None
+            term.node_type = "class"
+            # owl:Thing stays the last class, as it is after parsing
+            self.classes.insert(self.classes.index(OWL.Thing), cls)
+            thing = self.attributes["class"].pop("owl:Thing")
+            self.attributes["class"][term.name] = term
+            self.attributes["class"]["owl:Thing"] = thing
+            if "owl:Thing" in thing.subclasses:
+                thing.subclasses.insert(thing.subclasses.index("owl:Thing"), term.name)
+            else:
+                thing.subclasses.append(term.name)
+            self.data_dict["ancestors"]["class"][term.name] = ["owl:Thing"]
+            # the domain and range owl:Thing are expanded to the new class too
+            for key in ["object_property", "data_property"]:
+                for prop in self.attributes[key].values():
+                    if "owl:Thing" in prop.domain:
+                        prop.domain = self.get_domain(prop.URIRef)
+                    if key == "object_property" and "owl:Thing" in prop.range:
+                        prop.range = self.get_range(prop.URIRef)
         elif node_type == "object_property":
-            self.graph.add((URIRef(uri), RDF.type, OWL.ObjectProperty))
-        elif node_type == "data_property":
-            self.graph.add((URIRef(uri), RDF.type, OWL.DatatypeProperty))
+            term = self._add_object_property(cls)
         else:
-            raise ValueError("Node type not found")
-        for r in rn:
-            self.graph.add((URIRef(uri), RDFS.range, URIRef(r)))
-        for d in dm:
-            self.graph.add((URIRef(uri), RDFS.domain, URIRef(d)))
-        self._data_dict = None
+            term = self._add_data_property(cls)
+        self._recheck_namespace(term)
+        return term
 
     def add_namespace(self, namespace_name, namespace_iri):
         """
@@ -954,6 +1235,18 @@ class OntoParser:
             If the namespace already exists.
 
         """
-        if namespace_name not in self.namespaces.keys():
-            self.graph.bind(namespace_name, namespace_iri)
-        self._data_dict = None
+        if namespace_name in self.namespaces.keys():
+            return
+        self.graph.bind(namespace_name, namespace_iri)
+        # the namespace is added in place, unless it changes the names of
+        # existing terms, in which case the ontology is parsed again
+        bound = dict(self.graph.namespaces()).get(namespace_name)
+        renames_terms = any(
+            term.uri is not None and term.uri.startswith(namespace_iri)
+            for key in ["class", "object_property", "data_property"]
+            for term in self.attributes[key].values()
+        )
+        if bound is None or bound.toPython() != namespace_iri or renames_terms:
+            self._data_dict = None
+        else:
+            self.namespaces[namespace_name] = namespace_iri
@@ -0,0 +1,607 @@
+"""
+This module provides the path search in the network graph of an ontology.
+
+Path search is the largest cost of query generation, while the same pairs of
+terms are queried again and again. The paths found between two nodes are kept
+in a bounded least recently used cache. Every change of the network graph
+increments a version counter of the network, and the cache is emptied as soon
+as it sees a new version.
+
+Besides `networkx`, paths can be searched with `CSRGraph`, which stores the
+graph as integer indexed compressed sparse row arrays. Shortest paths are found
+by a bidirectional breadth first search over the node IDs, and the k shortest
+simple paths with Yen's algorithm on top of it. A single shortest path can also
+be read off a shortest path tree of the source, which is computed once by a
+breadth first search and serves all targets, but may pick another path than
+`networkx` among paths of equal length.
+
+`ReachabilityIndex` answers whether a node can be reached from another at all,
+without any path search.
+"""
+
+from collections import OrderedDict, namedtuple
+import hashlib
+import heapq
+import threading
+
+import networkx as nx
+import numpy as np
+
+from tools4rdf.network.closure import strongly_connected_components
+
+PATH_CACHE_SIZE = 1024
+
+PATH_BACKENDS = ("networkx", "csr")
+
+PathCacheInfo = namedtuple("PathCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class PathCache:
+    """
+    A least recently used cache of the shortest paths between nodes.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of entries. If 0, nothing is cached. Default is
+        `PATH_CACHE_SIZE`.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries.
+    version : int
+        The version of the graph the cached paths belong to.
+    hits : int
+        The number of lookups that found an entry.
+    misses : int
+        The number of lookups that did not find an entry.
+    """
+
+    def __init__(self, maxsize=PATH_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # locks cannot be pickled, a copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version):
+        """
+        Look up the paths stored for a key.
+
+        Parameters
+        ----------
+        key : tuple
+            The source and target node names and the number of paths.
+        version : int
+            The current version of the graph. If it is newer than the version
+            of the cached paths, the cache is emptied first.
+
+        Returns
+        -------
+        list or None
+            The cached paths, or None if there is no entry for the key.
+        """
+        with self._lock:
+            if version > self.version:
+                self._entries.clear()
+                self.version = version
+            paths = self._entries.get(key) if version == self.version else None
+            if paths is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return paths
+
+    def put(self, key, version, paths):
+        """
+        Store the paths for a key.
+
+        Parameters
+        ----------
+        key : tuple
+            The source and target node names and the number of paths.
+        version : int
+            The version of the graph the paths were found in. Paths of an
+            outdated version are not stored, while a newer version empties the
+            cache first.
+        paths : list
+            The paths, as lists of node names.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            if version > self.version:
+                self._entries.clear()
+                self.version = version
+            if version != self.version or self.maxsize <= 0:
+                return
+            self._entries[key] = paths
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def items(self):
+        """
+        Get all entries, least recently used first.
+
+        Returns
+        -------
+        list of tuple
+            The keys and paths of the entries.
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def update(self, entries, version):
+        """
+        Store several entries at once.
+
+        Parameters
+        ----------
+        entries : iterable of tuple
+            The keys and paths of the entries, as returned by `items`.
+        version : int
+            The version of the graph the paths were found in.
+
+        Returns
+        -------
+        None
+        """
+        for key, paths in entries:
+            self.put(key, version, paths)
+
+    def clear(self):
+        """
+        Remove all entries and reset the statistics.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Get the statistics of the cache.
+
+        Returns
+        -------
+        PathCacheInfo
+            The number of hits and misses, the maximum and the current size.
+        """
+        with self._lock:
+            return PathCacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+def graph_fingerprint(g):
+    """
+    Compute a fingerprint of the nodes and edges of a graph, in their order.
+
+    Parameters
+    ----------
+    g : networkx.DiGraph
+        The graph.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever a node or edge is added or removed,
+        or the graph is built in another order.
+
+    Notes
+    -----
+    The order of the nodes gives their IDs in `CSRGraph`, and the order of the
+    edges breaks ties between shortest paths, so graphs with the same content
+    but built in another order can have other paths and fingerprints.
+    """
+    digest = hashlib.sha256()
+    for node in g.nodes:
+        digest.update(f"{node}\0".encode())
+    digest.update(b"\1")
+    for u, v in g.edges:
+        digest.update(f"{u}\0{v}\0".encode())
+    return digest.hexdigest()
+
+
+class CSRGraph:
+    """
+    A directed graph stored as compressed sparse row arrays, for path search.
+
+    Parameters
+    ----------
+    g : networkx.DiGraph
+        The graph to be converted. Later changes of it are not reflected.
+
+    Attributes
+    ----------
+    nodes : list
+        The node names, indexed by node ID.
+    index : dict
+        The node ID of every node name.
+    indptr : numpy.ndarray
+        The successors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+    indices : numpy.ndarray
+        The node IDs of the successors.
+    rev_indptr, rev_indices : numpy.ndarray
+        The same for the predecessors of the nodes.
+    """
+
+    def __init__(self, g):
+        self.nodes = list(g.nodes)
+        self.index = {node: count for count, node in enumerate(self.nodes)}
+        n_nodes = len(self.nodes)
+        tails = np.fromiter(
+            (self.index[u] for u, v in g.edges), dtype=np.int64, count=len(g.edges)
+        )
+        heads = np.fromiter(
+            (self.index[v] for u, v in g.edges), dtype=np.int64, count=len(g.edges)
+        )
+        self.indptr, self.indices = self._compress(tails, heads, n_nodes)
+        self.rev_indptr, self.rev_indices = self._compress(heads, tails, n_nodes)
+        # the search loops run faster over plain lists than over array slices
+        self._succ = self._to_lists(self.indptr, self.indices)
+        self._pred = self._to_lists(self.rev_indptr, self.rev_indices)
+
+    @staticmethod
+    def _compress(tails, heads, n_nodes):
+        # a stable sort keeps the order of the edges of every node
+        order = np.argsort(tails, kind="stable")
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=n_nodes), out=indptr[1:])
+        return indptr, heads[order]
+
+    @staticmethod
+    def _to_lists(indptr, indices):
+        indices = indices.tolist()
+        bounds = indptr.tolist()
+        return [indices[bounds[i] : bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    def _node_id(self, node):
+        if node not in self.index:
+            raise nx.NodeNotFound(f"Node {node} not in graph")
+        return self.index[node]
+
+    def _bfs(self, source, target, blocked_nodes=(), blocked_edges=()):
+        """
+        Find a shortest path between two node IDs.
+
+        The search runs from both ends at once, always expanding the smaller
+        of the two frontiers.
+
+        Parameters
+        ----------
+        source, target : int
+            The node IDs of the ends of the path.
+        blocked_nodes : set, optional
+            The node IDs the path may not go through.
+        blocked_edges : set, optional
+            The edges, as pairs of node IDs, the path may not go through.
+
+        Returns
+        -------
+        list of int or None
+            The node IDs of the path, or None if there is no path.
+        """
+        if source == target:
+            return [source]
+        if source in blocked_nodes or target in blocked_nodes:
+            return None
+        pred = {source: None}
+        succ = {target: None}
+        forward = [source]
+        reverse = [target]
+        meet = None
+        while meet is None and forward and reverse:
+            if len(forward) <= len(reverse):
+                level = []
+                for u in forward:
+                    for v in self._succ[u]:
+                        if v in pred or v in blocked_nodes or (u, v) in blocked_edges:
+                            continue
+                        pred[v] = u
+                        if v in succ:
+                            meet = v
+                            break
+                        level.append(v)
+                    if meet is not None:
+                        break
+                forward = level
+            else:
+                level = []
+                for v in reverse:
+                    for u in self._pred[v]:
+                        if u in succ or u in blocked_nodes or (u, v) in blocked_edges:
+                            continue
+                        succ[u] = v
+                        if u in pred:
+                            meet = u
+                            break
+                        level.append(u)
+                    if meet is not None:
+                        break
+                reverse = level
+        if meet is None:
+            return None
+        path = []
+        node = meet
+        while node is not None:
+            path.append(node)
+            node = pred[node]
+        path.reverse()
+        node = succ[meet]
+        while node is not None:
+            path.append(node)
+            node = succ[node]
+        return path
+
+    def shortest_path_tree(self, source):
+        """
+        Find the shortest paths from a source to all nodes.
+
+        The breadth first search expands a whole level of the graph at once,
+        with array operations on the CSR arrays.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source node.
+
+        Returns
+        -------
+        numpy.ndarray
+            The node ID of the predecessor of every node on a shortest path from
+            the source; -1 for the source and for nodes that are not reachable.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source is not in the graph.
+        """
+        source = self._node_id(source)
+        parent = np.full(len(self.nodes), -1, dtype=np.int64)
+        visited = np.zeros(len(self.nodes), dtype=bool)
+        visited[source] = True
+        frontier = np.array([source], dtype=np.int64)
+        while frontier.size > 0:
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            # positions in `indices` of all edges leaving the frontier
+            offsets = np.cumsum(counts) - counts
+            edges = np.arange(counts.sum()) - np.repeat(offsets - starts, counts)
+            tails = np.repeat(frontier, counts)
+            heads = self.indices[edges]
+            keep = ~visited[heads]
+            heads, tails = heads[keep], tails[keep]
+            # the first edge reaching a node determines its predecessor, and
+            # the next level is kept in the order the nodes were reached
+            frontier, first = np.unique(heads, return_index=True)
+            order = np.argsort(first)
+            frontier, first = frontier[order], first[order]
+            visited[frontier] = True
+            parent[frontier] = tails[first]
+        return parent
+
+    def tree_path(self, tree, source, target):
+        """
+        Get the path to a node from a shortest path tree.
+
+        Parameters
+        ----------
+        tree : numpy.ndarray
+            The shortest path tree, as returned by `shortest_path_tree`.
+        source, target : str
+            The names of the source of the tree and of the target node.
+
+        Returns
+        -------
+        list
+            The names of the nodes along the path from the source to the target.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the target is not in the graph.
+        networkx.NetworkXNoPath
+            If the target is not reachable from the source.
+        """
+        source, target = self._node_id(source), self._node_id(target)
+        if target != source and tree[target] < 0:
+            raise nx.NetworkXNoPath(f"No path to {self.nodes[target]}.")
+        path = [target]
+        while path[-1] != source:
+            path.append(int(tree[path[-1]]))
+        return [self.nodes[node] for node in path[::-1]]
+
+    def shortest_path(self, source, target):
+        """
+        Find a shortest path between two nodes.
+
+        Parameters
+        ----------
+        source, target : str
+            The names of the nodes.
+
+        Returns
+        -------
+        list
+            The names of the nodes along the path.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source or target is not in the graph.
+        networkx.NetworkXNoPath
+            If there is no path between the nodes.
+        """
+        path = self._bfs(self._node_id(source), self._node_id(target))
+        if path is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        return [self.nodes[node] for node in path]
+
+    def shortest_simple_paths(self, source, target, num_paths=1):
+        """
+        Find the shortest simple paths between two nodes, using Yen's algorithm.
+
+        Parameters
+        ----------
+        source, target : str
+            The names of the nodes.
+        num_paths : int, optional
+            The maximum number of paths (default is 1).
+
+        Returns
+        -------
+        list of list
+            The paths, shortest first, as lists of node names.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source or target is not in the graph.
+        networkx.NetworkXNoPath
+            If there is no path between the nodes.
+        """
+        source_id, target_id = self._node_id(source), self._node_id(target)
+        if num_paths <= 0:
+            return []
+        path = self._bfs(source_id, target_id)
+        if path is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        found = [path]
+        seen = {tuple(path)}
+        candidates = []
+        while len(found) < num_paths:
+            last = found[-1]
+            for i in range(len(last) - 1):
+                root = last[: i + 1]
+                # the spur path may not repeat an edge already taken from this root
+                blocked_edges = {
+                    (other[i], other[i + 1])
+                    for other in found
+                    if other[: i + 1] == root
+                }
+                spur = self._bfs(root[-1], target_id, set(root[:-1]), blocked_edges)
+                if spur is None:
+                    continue
+                candidate = root[:-1] + spur
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (len(candidate), len(seen), candidate))
+            if len(candidates) == 0:
+                break
+            found.append(heapq.heappop(candidates)[2])
+        return [[self.nodes[node] for node in path] for path in found]
+
+
+class ReachabilityIndex:
+    """
+    An index of which nodes of a graph can be reached from which.
+
+    The strongly connected components of the graph are collapsed first. Every
+    component then stores the set of components reachable from it as a bitset,
+    computed in one pass in reverse topological order.
+
+    Parameters
+    ----------
+    csr : CSRGraph
+        The graph.
+    """
+
+    def __init__(self, csr):
+        self.nodes = csr.nodes
+        self.index = csr.index
+        components = strongly_connected_components(csr._succ)
+        self.component = [0] * len(self.nodes)
+        for count, members in enumerate(components):
+            for node in members:
+                self.component[node] = count
+        self.members = components
+        # components come after all components reachable from them, so that
+        # the bitsets of the successors are complete when they are merged
+        self.reach = []
+        for count, members in enumerate(components):
+            bits = 1 << count
+            for node in members:
+                for successor in csr._succ[node]:
+                    other = self.component[successor]
+                    if other != count:
+                        bits |= self.reach[other]
+            self.reach.append(bits)
+
+    def _node_id(self, node):
+        if node not in self.index:
+            raise nx.NodeNotFound(f"Node {node} not in graph")
+        return self.index[node]
+
+    def is_reachable(self, source, target):
+        """
+        Check if there is a path from one node to another.
+
+        Parameters
+        ----------
+        source, target : str
+            The names of the nodes. A node is reachable from itself.
+
+        Returns
+        -------
+        bool
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source or target is not in the graph.
+        """
+        source = self.component[self._node_id(source)]
+        target = self.component[self._node_id(target)]
+        return bool(self.reach[source] >> target & 1)
+
+    def reachable_from(self, source):
+        """
+        Get all nodes that can be reached from a node.
+
+        Parameters
+        ----------
+        source : str
+            The name of the node.
+
+        Returns
+        -------
+        list
+            The names of the reachable nodes, not including the source itself.
+
+        Raises
+        ------
+        networkx.NodeNotFound
+            If the source is not in the graph.
+        """
+        source_id = self._node_id(source)
+        bits = self.reach[self.component[source_id]]
+        nodes = []
+        while bits:
+            lowest = bits & -bits
+            for node in self.members[lowest.bit_length() - 1]:
+                if node != source_id:
+                    nodes.append(self.nodes[node])
+            bits ^= lowest
+        return nodes
@@ -0,0 +1,227 @@
+"""
+This module provides a cache of query results.
+
+Results are stored as DataFrames, keyed by the text of the query and a
+fingerprint of the knowledge graph it was run on, so that a repeated query on
+an unchanged graph is answered without evaluating it again. Entries are kept
+in memory up to a total size in bytes, least recently used first out, and can
+be kept in a directory on disk as well, to be shared between processes.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from rdflib import Graph
+
+from tools4rdf.network.cache import load_compiled, save_compiled
+from tools4rdf.network.endpoint import SPARQLEndpoint
+
+RESULT_CACHE_BYTES = 256 * 1024**2
+
+ResultCacheInfo = namedtuple(
+    "ResultCacheInfo", ["hits", "misses", "hit_rate", "maxbytes", "currbytes"]
+)
+
+
+def kg_fingerprint(kg, version=None):
+    """
+    Get the fingerprint of a knowledge graph, which changes with its content.
+
+    Parameters
+    ----------
+    kg : object
+        The knowledge graph.
+    version : hashable, optional
+        A version of the knowledge graph given by the user, which is used as
+        the fingerprint together with the identity of the graph if provided.
+
+    Returns
+    -------
+    tuple or None
+        The fingerprint, or None if the content of the knowledge graph cannot
+        be told apart.
+
+    Notes
+    -----
+    For an rdflib graph, the fingerprint is its identifier and number of
+    triples, so a change that keeps the number of triples is only noticed with
+    a `version`. For a SPARQL endpoint, it is the url; the results are reused
+    until `version` changes or they expire, see `ResultCache`. Queries sent to
+    an endpoint through SERVICE run on an empty graph named after the url.
+    """
+    if isinstance(kg, Graph):
+        identity = ("graph", str(kg.identifier))
+        if version is None:
+            return identity + (len(kg),)
+    elif isinstance(kg, SPARQLEndpoint):
+        identity = ("endpoint", kg.url)
+    elif version is not None:
+        identity = ("kg", type(kg).__name__)
+    else:
+        return None
+    return identity + (version,)
+
+
+class ResultCache:
+    """
+    A least recently used cache of query results, limited by size in bytes.
+
+    Parameters
+    ----------
+    maxbytes : int, optional
+        The maximum total size of the DataFrames kept in memory. Default is
+        `RESULT_CACHE_BYTES`.
+    directory : str, optional
+        If provided, results are stored in this directory as well, and looked
+        up there when they are not in memory. Entries are stored with `pickle`;
+        only use directories which are not writable by others.
+    ttl : float, optional
+        The time in seconds after which results expire. Default is None (they
+        do not expire).
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups that found a result.
+    misses : int
+        The number of lookups that did not find a result.
+    """
+
+    def __init__(self, maxbytes=RESULT_CACHE_BYTES, directory=None, ttl=None):
+        self.maxbytes = maxbytes
+        self.directory = directory
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.currbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # locks cannot be pickled, a copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get_file(self, key):
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.result")
+
+    def _is_expired(self, created):
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _store(self, key, created, frame):
+        # the lock is held by the caller
+        size = int(frame.memory_usage(deep=True).sum())
+        if key in self._entries:
+            self.currbytes -= self._entries.pop(key)[2]
+        if size > self.maxbytes:
+            return
+        self._entries[key] = (created, frame, size)
+        self.currbytes += size
+        while self.currbytes > self.maxbytes:
+            self.currbytes -= self._entries.popitem(last=False)[1][2]
+
+    def get(self, key):
+        """
+        Look up the result of a query.
+
+        Parameters
+        ----------
+        key : tuple
+            The query and the fingerprint of the knowledge graph.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            A copy of the cached result, or None if there is no valid entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[0]):
+                self.currbytes -= self._entries.pop(key)[2]
+                entry = None
+            if entry is None and self.directory is not None:
+                stored = load_compiled(self._get_file(key))
+                if (
+                    stored is not None
+                    and stored["key"] == key
+                    and not self._is_expired(stored["created"])
+                ):
+                    self._store(key, stored["created"], stored["frame"])
+                    entry = (stored["created"], stored["frame"])
+            if entry is None:
+                self.misses += 1
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1].copy()
+
+    def put(self, key, frame):
+        """
+        Store the result of a query.
+
+        Parameters
+        ----------
+        key : tuple
+            The query and the fingerprint of the knowledge graph.
+        frame : pandas.DataFrame
+            The result.
+
+        Returns
+        -------
+        None
+        """
+        created = time.time()
+        frame = frame.copy()
+        with self._lock:
+            self._store(key, created, frame)
+        if self.directory is not None:
+            save_compiled(
+                self._get_file(key),
+                {"key": key, "created": created, "frame": frame},
+            )
+
+    def clear(self):
+        """
+        Remove all results from memory and reset the statistics.
+
+        Results stored on disk are kept.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Get the statistics of the cache.
+
+        Returns
+        -------
+        ResultCacheInfo
+            The number of hits and misses, the fraction of lookups that were
+            hits, and the maximum and current size in bytes.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            hit_rate = self.hits / lookups if lookups > 0 else 0.0
+            return ResultCacheInfo(
+                self.hits, self.misses, hit_rate, self.maxbytes, self.currbytes
+            )
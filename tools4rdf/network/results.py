@@ -0,0 +1,159 @@
+"""
+This module provides the conversion of SPARQL results into typed DataFrames.
+
+The results of a query are rows of rdflib terms. Instead of a DataFrame of
+these objects, the rows are split into columns and every column is converted
+as a whole: literals into NumPy dtypes chosen from the range of the data
+property queried, or from the datatype of the literals if the range is not
+known, and URIs into pandas categoricals.
+"""
+
+import numpy as np
+import pandas as pd
+from rdflib import Literal
+
+# kinds of columns by the local name of their XSD datatype
+XSD_KINDS = {
+    "float": "float",
+    "double": "float",
+    "decimal": "float",
+    "integer": "int",
+    "int": "int",
+    "long": "int",
+    "short": "int",
+    "byte": "int",
+    "nonNegativeInteger": "int",
+    "nonPositiveInteger": "int",
+    "positiveInteger": "int",
+    "negativeInteger": "int",
+    "unsignedLong": "int",
+    "unsignedInt": "int",
+    "unsignedShort": "int",
+    "unsignedByte": "int",
+    "boolean": "bool",
+    "dateTime": "datetime",
+    "date": "datetime",
+    "dateTimeStamp": "datetime",
+}
+
+
+def _local_name(uri):
+    return uri.rsplit("#", 1)[-1].rsplit("/", 1)[-1]
+
+
+def get_data_types(terms):
+    """
+    Get the datatypes of the data properties among the terms of a query.
+
+    Parameters
+    ----------
+    terms : list
+        The terms of the query, lists of terms are included.
+
+    Returns
+    -------
+    dict
+        The local name of the datatype for the name of each data property in a
+        query, as returned by `OntoTerm.query_name_without_prefix`.
+    """
+    types = {}
+    for term in terms:
+        if isinstance(term, (list, tuple)):
+            types.update(get_data_types(term))
+            continue
+        types.update(get_data_types(term._condition_parents))
+        if term.node_type == "data_property" and len(term.range) > 0:
+            types[term.query_name_without_prefix] = term._clean_datatype(term.range[0])
+    return types
+
+
+def _get_kind(label, column, types):
+    # the variable of a data property ends with its name, after its parents
+    match = None
+    for name, data_type in types.items():
+        if label == name or label.endswith("_" + name):
+            if match is None or len(name) > len(match[0]):
+                match = (name, data_type)
+    if match is not None:
+        return XSD_KINDS.get(match[1], "string")
+    for value in column:
+        if value is None:
+            continue
+        if not isinstance(value, Literal):
+            return "category"
+        if value.datatype is None:
+            return "string"
+        return XSD_KINDS.get(_local_name(value.datatype), "string")
+    return "string"
+
+
+def _convert(column, kind):
+    if kind == "float":
+        return np.array(
+            [np.nan if value is None else float(value) for value in column],
+            dtype=float,
+        )
+    if kind == "int":
+        if any(value is None for value in column):
+            return _convert(column, "float")
+        return np.array([int(value) for value in column], dtype=np.int64)
+    if kind == "bool":
+        if any(value is None for value in column):
+            return pd.array(
+                [
+                    None if value is None else str(value) in ("true", "1")
+                    for value in column
+                ],
+                dtype="boolean",
+            )
+        return np.array([str(value) in ("true", "1") for value in column], dtype=bool)
+    if kind == "datetime":
+        return pd.to_datetime(
+            [None if value is None else str(value) for value in column],
+            errors="coerce",
+        )
+    if kind == "category":
+        return pd.Categorical(
+            [None if value is None else str(value) for value in column]
+        )
+    return np.array(
+        [None if value is None else str(value) for value in column], dtype=object
+    )
+
+
+def build_frame(rows, labels, types=None):
+    """
+    Build a typed DataFrame from the rows of SPARQL results.
+
+    Parameters
+    ----------
+    rows : iterable of tuple
+        The rows, with rdflib terms or None for unbound variables.
+    labels : list of str
+        The names of the columns.
+    types : dict, optional
+        The datatypes of data properties, as returned by `get_data_types`.
+        Columns of other variables are typed from their values.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The DataFrame, with float, int, bool and datetime columns for literals
+        of these types, str columns for other literals and categorical columns
+        of URIs.
+    """
+    if types is None:
+        types = {}
+    columns = [[] for _ in labels]
+    appends = [column.append for column in columns]
+    for row in rows:
+        for append, value in zip(appends, row):
+            append(value)
+    data = {}
+    for label, column in zip(labels, columns):
+        try:
+            data[label] = _convert(column, _get_kind(label, column, types))
+        except (ValueError, TypeError):
+            # values that do not match their datatype are kept as strings
+            data[label] = _convert(column, "string")
+    return pd.DataFrame(data, columns=labels)
@@ -0,0 +1,141 @@
+"""
+This module provides the caching of generated SPARQL queries as templates.
+
+Requests with the same terms, modifiers and options give the same query text,
+apart from the literal values in the filter condition. The text of a query is
+therefore stored once per structural signature of the request, with the values
+cut out, and a later request with the same signature only fills in its own
+values. Like the path cache, the templates are dropped when the graph version
+of the network changes.
+"""
+
+import re
+
+from tools4rdf.network.paths import PathCache
+
+QUERY_CACHE_SIZE = 256
+
+# the literal values of a filter condition, as written by OntoTerm
+_VALUE = re.compile(r'"(.*?)"(?=\^\^xsd:)')
+
+
+class QueryTemplateCache(PathCache):
+    """
+    A least recently used cache of query templates.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of templates. If 0, nothing is cached. Default is
+        `QUERY_CACHE_SIZE`.
+    """
+
+    def __init__(self, maxsize=QUERY_CACHE_SIZE):
+        super().__init__(maxsize=maxsize)
+
+
+def mask_condition(condition):
+    """
+    Split a filter condition into its structure and its literal values.
+
+    Parameters
+    ----------
+    condition : str or None
+        The condition of a term.
+
+    Returns
+    -------
+    masked : str or None
+        The condition with every value replaced by an empty string.
+    values : list of str
+        The values, in order of appearance.
+    """
+    if condition is None:
+        return None, []
+    return _VALUE.sub('""', condition), _VALUE.findall(condition)
+
+
+def term_signature(term):
+    """
+    Get the structural signature of a term, without the values of its condition.
+
+    Parameters
+    ----------
+    term : OntoTerm
+        The term.
+
+    Returns
+    -------
+    tuple
+    """
+    return (
+        term.name,
+        term.node_type,
+        term._enforce_type,
+        term._add_subclass,
+        term._old_variable_name,
+        mask_condition(term._condition)[0],
+        tuple(term_signature(parent) for parent in term._parents),
+        tuple(term_signature(parent) for parent in term._condition_parents),
+    )
+
+
+def make_template(queries, values):
+    """
+    Turn generated queries into a template by cutting out the filter values.
+
+    Parameters
+    ----------
+    queries : str or list of str
+        The generated queries.
+    values : list of str
+        The values of the filter condition used for the queries.
+
+    Returns
+    -------
+    tuple or None
+        The template, or None if the values cannot be located unambiguously.
+    """
+    is_list = isinstance(queries, list)
+    templates = []
+    for query in queries if is_list else [queries]:
+        matches = list(_VALUE.finditer(query))
+        if [match.group(1) for match in matches] != values:
+            return None
+        segments = []
+        position = 0
+        for match in matches:
+            segments.append(query[position : match.start(1)])
+            position = match.end(1)
+        segments.append(query[position:])
+        templates.append(tuple(segments))
+    return is_list, tuple(templates)
+
+
+def fill_template(template, values):
+    """
+    Create queries from a template and the values of the filter condition.
+
+    Parameters
+    ----------
+    template : tuple
+        The template, as returned by `make_template`.
+    values : list of str
+        The values of the filter condition.
+
+    Returns
+    -------
+    str or list of str
+        The queries, in the form they were generated in.
+    """
+    is_list, templates = template
+    queries = []
+    for segments in templates:
+        parts = [segments[0]]
+        for value, segment in zip(values, segments[1:]):
+            parts.append(value)
+            parts.append(segment)
+        queries.append("".join(parts))
+    if is_list:
+        return queries
+    return queries[0]
@@ -21,6 +21,7 @@ making it easier to work with semantic data and SPARQL queries.
 from rdflib import URIRef
 import numbers
 import copy
+import sys
 import warnings
 from urllib.parse import urlparse
 
@@ -128,14 +129,102 @@ def strip_name(uri, get_what="name", namespace=None):
         raise ValueError("get_what must be either namespace or name")
 
 
+def _intern(val):
+    """
+    Intern a string, so that equal names, namespaces and URIs share one object.
+
+    Parameters
+    ----------
+    val : object
+        The value to be interned. Anything but a plain string is returned as is.
+
+    Returns
+    -------
+    object
+    """
+    if type(val) is str:
+        return sys.intern(val)
+    return val
+
+
+class _LazyList:
+    """
+    A list attribute of `OntoTerm` that is only created when it is first accessed.
+
+    Most terms have no subclasses, individuals, parents and so on, so that an
+    empty list per attribute and term is not allocated up front. The value is
+    kept in the slot ``_lazy_<name>``, which is None until the list is created.
+    """
+
+    def __set_name__(self, owner, name):
+        self.slot = owner.__dict__["_lazy_" + name]
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj)
+        if value is None:
+            value = []
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+_LAZY_LISTS = (
+    "subclasses",
+    "named_individuals",
+    "equivalent_classes",
+    "subproperties",
+    "is_domain_of",
+    "is_range_of",
+    "_parents",
+    "_condition_parents",
+)
+
+
 class OntoTerm:
+    __slots__ = (
+        "_uri",
+        "node_type",
+        "_domain",
+        "_range",
+        "data_type",
+        "node_id",
+        "associated_data_node",
+        "delimiter",
+        "_description",
+        "_label",
+        "_condition",
+        "namespace",
+        "_name",
+        "target",
+        "_enforce_type",
+        "_add_subclass",
+        "_old_variable_name",
+    ) + tuple("_lazy_" + name for name in _LAZY_LISTS)
+
+    subclasses = _LazyList()
+    named_individuals = _LazyList()
+    equivalent_classes = _LazyList()
+    subproperties = _LazyList()
+    is_domain_of = _LazyList()
+    is_range_of = _LazyList()
+    # parents for the class; these are accumulated
+    # when using the >> operator
+    _parents = _LazyList()
+    # condition parents are the parents that have conditions
+    # these are accumulated when using the & or || operators
+    _condition_parents = _LazyList()
+
     def __init__(
         self,
         uri=None,
         namespace=None,
         node_type=None,
-        dm=[],
-        rn=[],
+        dm=(),
+        rn=(),
         data_type=None,
         node_id=None,
         delimiter="/",
@@ -158,30 +247,20 @@ class OntoTerm:
         # identifier
         self.node_id = node_id
         self.associated_data_node = None
-        self.subclasses = []
-        self.named_individuals = []
-        self.equivalent_classes = []
-        self.subproperties = []
+        for attribute in _LAZY_LISTS:
+            setattr(self, attribute, None)
         self.delimiter = delimiter
         self._description = None
         self.description = description
         self.label = label
         self._label = None
-        self.is_domain_of = []
-        self.is_range_of = []
         self._condition = None
         if uri is not None and namespace is None:
             namespace = strip_name(uri, get_what="namespace")
-        self.namespace = namespace
+        self.namespace = _intern(namespace)
         # name of the class
         self._name = None
         self.name = name
-        # parents for the class; these are accumulated
-        # when using the >> operator
-        self._parents = []
-        # condition parents are the parents that have conditions
-        # these are accumulated when using the & or || operators
-        self._condition_parents = []
         self.target = target
         self._enforce_type = True
         self._add_subclass = True
@@ -205,7 +284,39 @@ class OntoTerm:
 
     @uri.setter
     def uri(self, val):
-        self._uri = val
+        self._uri = _intern(val)
+
+    @property
+    def domain(self):
+        """
+        Get the domain of the term.
+
+        Returns
+        -------
+        list
+            The names of the terms in the domain.
+        """
+        return self._domain
+
+    @domain.setter
+    def domain(self, val):
+        self._domain = [_intern(x) for x in val]
+
+    @property
+    def range(self):
+        """
+        Get the range of the term.
+
+        Returns
+        -------
+        list
+            The names of the terms or data types in the range.
+        """
+        return self._range
+
+    @range.setter
+    def range(self, val):
+        self._range = [_intern(x) for x in val]
 
     @property
     def description(self):
@@ -273,7 +384,7 @@ class OntoTerm:
                 get_what="name",
                 namespace=self.namespace,
             )
-        self._name = val
+        self._name = _intern(val)
 
     @property
     def name_without_prefix(self):
@@ -377,10 +488,31 @@ class OntoTerm:
             return self.name_without_prefix + "value"
         return self.name_without_prefix
 
+    def _view(self):
+        """
+        Create a lightweight copy of the term to be modified for a query.
+
+        The copy shares the ontology data of the term, such as the subclasses,
+        domain and range, instead of copying it. Only the query modifiers are its
+        own: the condition, the flags, and the lists of parents and condition
+        parents.
+
+        Returns
+        -------
+        OntoTerm
+            The copy of the term.
+        """
+        item = copy.copy(self)
+        if self._lazy__parents is not None:
+            item._parents = list(self._lazy__parents)
+        if self._lazy__condition_parents is not None:
+            item._condition_parents = list(self._lazy__condition_parents)
+        return item
+
     @property
     def any(self):
         # this indicates that type enforcing is not needed
-        item = copy.deepcopy(self)
+        item = self._view()
         item._enforce_type = False
         # but subclasses need not be added anymore
         item._add_subclass = False
@@ -389,7 +521,7 @@ class OntoTerm:
     @property
     def all_subtypes(self):
         # this indicates that type enforcing is not needed
-        item = copy.deepcopy(self)
+        item = self._view()
         # this means no need to enforce type
         item._enforce_type = False
         item._add_subclass = True
@@ -398,7 +530,7 @@ class OntoTerm:
     @property
     def only(self):
         # this indicates that type enforcing IS needed
-        item = copy.deepcopy(self)
+        item = self._view()
         item._add_subclass = False
         item._enforce_type = True
         return item
@@ -460,7 +592,7 @@ class OntoTerm:
         # print("eq")
         # print(f'lhs {self} rhs {val}')
         if self.node_type == "data_property":
-            item = copy.deepcopy(self)
+            item = self._view()
             item._condition = item._create_condition_string("=", val)
             return item
         else:
@@ -469,28 +601,28 @@ class OntoTerm:
     def __lt__(self, val):
         self._is_number(val)
         self._is_data_node()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = item._create_condition_string("<", val)
         return item
 
     def __le__(self, val):
         self._is_number(val)
         self._is_data_node()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = item._create_condition_string("<=", val)
         return item
 
     def __ne__(self, val):
         # self._is_number(val)
         self._is_data_node()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = item._create_condition_string("!=", val)
         return item
 
     def __ge__(self, val):
         self._is_number(val)
         self._is_data_node()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = item._create_condition_string(">=", val)
         return item
 
@@ -499,7 +631,7 @@ class OntoTerm:
         # print(f'lhs {self} rhs {val}')
         self._is_number(val)
         self._is_data_node()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = item._create_condition_string(">", val)
         return item
 
@@ -509,10 +641,10 @@ class OntoTerm:
         term._is_data_node()
         self._ensure_condition_exists()
         term._ensure_condition_exists()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = "&&".join([item._condition, term._condition])
         item._condition = f"({item._condition})"
-        item._condition_parents.append(copy.deepcopy(term))
+        item._condition_parents.append(term._view())
         # and clean up the inbound term
         if item.name != term.name:
             term.refresh_condition()
@@ -528,10 +660,10 @@ class OntoTerm:
         term._is_data_node()
         self._ensure_condition_exists()
         term._ensure_condition_exists()
-        item = copy.deepcopy(self)
+        item = self._view()
         item._condition = "||".join([item._condition, term._condition])
         item._condition = f"({item._condition})"
-        item._condition_parents.append(copy.deepcopy(term))
+        item._condition_parents.append(term._view())
         # and clean up the inbound term
         if item.name != term.name:
             term.refresh_condition()
@@ -546,8 +678,8 @@ class OntoTerm:
         warnings.warn(
             "The @ operator is deprecated and will be removed in future versions. termA@termB should be [termA, termB] instead.",
         )
-        item = copy.deepcopy(self)
-        item._parents.append(copy.deepcopy(term))
+        item = self._view()
+        item._parents.append(term._view())
         return item
 
     def refresh_condition(self):